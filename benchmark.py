@@ -0,0 +1,99 @@
+"""
+Measures the time it takes to generate documentation with a varying number of rendering threads.
+
+Run the script with a regular and a free-threaded build of Python (e.g. `python3.13` and `python3.13t`) to compare
+how the GIL and free-threaded builds scale:
+
+    python3.13 benchmark.py
+    python3.13t benchmark.py
+"""
+
+import importlib
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from markdown_doc.generator import MarkdownGenerator, MarkdownOptions
+
+MODULE_COUNT = 20
+CLASS_COUNT = 40
+METHOD_COUNT = 8
+
+
+def write_module(path: Path, index: int) -> None:
+    "Writes a synthetic module with data-classes, regular classes with methods, and cross-references between them."
+
+    lines = [f'"Synthetic module {index} with classes that reference one another."', "", "from dataclasses import dataclass", ""]
+    for c in range(CLASS_COUNT):
+        if c % 2 == 0:
+            lines.extend(
+                [
+                    "",
+                    "@dataclass",
+                    f"class Data{c}:",
+                    '    """',
+                    f"    A data-class that links to :class:`Plain{c + 1}` and https://example.com/data/{c}.",
+                    "",
+                    "    :param name: Name of the object.",
+                    "    :param values: Values of the object.",
+                    f"    :param other: Reference to :class:`Plain{c + 1}`.",
+                    '    """',
+                    "",
+                    "    name: str",
+                    "    values: dict[str, list[int | float | None]]",
+                    f'    other: "Plain{c + 1} | None"',
+                    "",
+                ]
+            )
+        else:
+            lines.extend(["", f"class Plain{c}:", f'    "A regular class that is referenced by :class:`Data{c - 1}`."', ""])
+            for m in range(METHOD_COUNT):
+                lines.extend(
+                    [
+                        f"    def method{m}(self, data: Data{c - 1}, count: int = 0) -> list[Data{c - 1}]:",
+                        '        """',
+                        f"        Processes a :class:`Data{c - 1}` object, see also :meth:`method{(m + 1) % METHOD_COUNT}`.",
+                        "",
+                        "        :param data: Input data.",
+                        "        :param count: Number of repetitions.",
+                        "        :returns: Processed data.",
+                        '        """',
+                        "        return [data] * count",
+                        "",
+                    ]
+                )
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def main() -> None:
+    gil_enabled: bool = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {platform.python_version()} ({'GIL enabled' if gil_enabled else 'free-threaded'}), {os.cpu_count()} processors")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        package_dir = Path(temp_dir) / "benchmark_package"
+        package_dir.mkdir()
+        (package_dir / "__init__.py").write_text('"Synthetic package."\n', encoding="utf-8")
+        for index in range(MODULE_COUNT):
+            write_module(package_dir / f"module{index}.py", index)
+
+        sys.path.insert(0, temp_dir)
+        modules = [importlib.import_module(f"benchmark_package.module{index}") for index in range(MODULE_COUNT)]
+
+        # warm up caches shared across runs, e.g. identifiers and anchors
+        MarkdownGenerator(modules, options=MarkdownOptions()).generate(Path(temp_dir) / "warmup")
+
+        baseline: float | None = None
+        for threads in [1, 2, 4, 8]:
+            start = time.perf_counter()
+            MarkdownGenerator(modules, options=MarkdownOptions()).generate(Path(temp_dir) / f"docs{threads}", threads=threads)
+            elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline = elapsed
+            print(f"{threads} thread(s): {elapsed:.3f} s (speed-up: {baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Measures the time it takes to compute the relative path of a link to a document in another module.
+
+Compares three ways of computing the path, for each partition strategy:
+
+* a new context and a path computed with `pathlib` for each link, as done before contexts were interned,
+* a path computed on the components of qualified names with `module_path`,
+* a path memoized by an interned context with `Context.path_to`, as done when rendering.
+
+Paths are checked to be the same with each method before they are timed:
+
+    python3 benchmark_links.py
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+from markdown_doc.generator import Context, PartitionStrategy, module_path, object_partition
+
+AREA_COUNT = 4
+PACKAGE_COUNT = 4
+MODULE_COUNT = 4
+LINK_COUNT = 20000
+REPEAT = 5
+
+
+def pathlib_module_path(target: str, source: str) -> str:
+    "Relative path from source to target, computed with `pathlib` as before paths were computed on name components."
+
+    target_path = Path("/" + target.replace(".", "/") + ".md")
+    source_path = Path("/" + source.replace(".", "/") + ".md")
+    target_dir = target_path.parent
+    source_dir = source_path.parent
+    if sys.version_info >= (3, 12):
+        relative_path = Path(target_dir).relative_to(source_dir, walk_up=True)
+    else:
+        relative_path = Path(os.path.relpath(target_dir, start=source_dir))
+    return (relative_path / target_path.name).as_posix()
+
+
+def create_modules() -> list[tuple[ModuleType, type]]:
+    "Creates synthetic modules in a hierarchy of packages, each defining a class that links point to."
+
+    modules: list[tuple[ModuleType, type]] = []
+    for a in range(AREA_COUNT):
+        for p in range(PACKAGE_COUNT):
+            for m in range(MODULE_COUNT):
+                module = ModuleType(f"project.area{a}.package{p}.module{m}")
+                cls = type(f"Class{m}", (), {"__module__": module.__name__})
+                setattr(module, cls.__name__, cls)
+                modules.append((module, cls))
+    return modules
+
+
+def path_with_pathlib(context: Context, cls: type) -> str:
+    "Creates contexts for both ends of the link, and computes the path with `pathlib`."
+
+    target = Context(ModuleType(cls.__module__), object_partition(cls, context.strategy), context.strategy)
+    source = Context(context.module, context.partition, context.strategy)
+    return pathlib_module_path(target.name(), source.name())
+
+
+def path_with_components(context: Context, cls: type) -> str:
+    "Creates a context for the target of the link, and computes the path on the components of qualified names."
+
+    target = Context(ModuleType(cls.__module__), object_partition(cls, context.strategy), context.strategy)
+    return module_path(target.name(), context.name())
+
+
+def path_with_interned_context(context: Context, cls: type) -> str:
+    "Looks up the path memoized by the context that the link is rendered in."
+
+    return context.path_to(cls)
+
+
+def measure(links: list[tuple[Context, type]], path_to: Callable[[Context, type], str]) -> float:
+    "Time (in microseconds) per link, best of several runs."
+
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for context, cls in links:
+            path_to(context, cls)
+        best = min(best, time.perf_counter() - start)
+    return best / len(links) * 1e6
+
+
+def main() -> None:
+    modules = create_modules()
+    rng = random.Random(42)
+
+    for strategy in PartitionStrategy:
+        contexts = {module.__name__: Context(module, object_partition(cls, strategy), strategy) for module, cls in modules}
+        links: list[tuple[Context, type]] = []
+        while len(links) < LINK_COUNT:
+            (source, _), (target, cls) = rng.sample(modules, 2)
+            if source.__name__.rsplit(".", 1)[0] != target.__name__.rsplit(".", 1)[0]:  # link into another directory
+                links.append((contexts[source.__name__], cls))
+
+        for context, cls in links:
+            expected = path_with_pathlib(context, cls)
+            if path_with_components(context, cls) != expected or path_with_interned_context(context, cls) != expected:
+                raise AssertionError(f"path mismatch for link from `{context.name()}` to `{cls.__module__}.{cls.__qualname__}`")
+
+        print(
+            f"{strategy.value:<10} pathlib: {measure(links, path_with_pathlib):6.2f} us/link, "
+            f"module_path: {measure(links, path_with_components):6.2f} us/link, "
+            f"Context.path_to: {measure(links, path_with_interned_context):6.2f} us/link"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Checks that `replace_links` finds the same URLs as the regular expression it replaced, and compares their speed.
+
+The scanner in `markdown_doc.links` replaced a liberal URL-matching regular expression, which is embedded below as a
+reference. The check has two parts:
+
+* differential fuzzing: random strings built from fragments of URLs (schemes, top-level domains, parentheses,
+  brackets, `@`, punctuation, uppercase and non-ASCII characters), and all doc-strings in the standard library
+  (extracted without importing modules), must produce the same output with both implementations,
+* timing: a corpus of worst-case inputs for the regular expression, such as long dotted or hyphenated names, deeply
+  nested or unbalanced parentheses, long tables, and words that end in something like a top-level domain, is timed
+  with both implementations, and with the scanner on input four times as long to show it scales linearly.
+
+Any mismatch raises an error with the input that reproduces it:
+
+    python3 fuzz_links.py
+"""
+
+import ast
+import random
+import re
+import sysconfig
+import time
+from pathlib import Path
+from typing import Callable
+
+from markdown_doc.links import replace_links
+
+SHORT_COUNT = 200000
+LONG_COUNT = 5000
+SEED = 42
+MIN_TIME = 0.2
+
+# the regular expression that `replace_links` used before it was replaced with a scanner
+REFERENCE_REGEX = re.compile(
+    r"""
+    \b
+    (                                  # Capture 1: entire matched URL
+    (?:
+        https?:                        # URL protocol and colon
+        (?:
+        /{1,3}                         # 1-3 slashes
+        |                              #   or
+        [a-z0-9%]                      # Single letter or digit or '%'
+                                       # (Trying not to match e.g. "URI::Escape")
+        )
+        |                              #   or
+                                       # looks like domain name followed by a slash:
+        [a-z0-9.\-]+[.]
+        (?:com|net|org|edu|gov|mil|aero|asia|biz|cat|coop|info|int|jobs|mobi|museum|name|post|pro|tel|travel|xxx|
+        ac|ad|ae|af|ag|ai|al|am|an|ao|aq|ar|as|at|au|aw|ax|az|ba|bb|bd|be|bf|bg|bh|bi|bj|bm|bn|bo|br|bs|bt|bv|bw|
+        by|bz|ca|cc|cd|cf|cg|ch|ci|ck|cl|cm|cn|co|cr|cs|cu|cv|cx|cy|cz|dd|de|dj|dk|dm|do|dz|ec|ee|eg|eh|er|es|et|
+        eu|fi|fj|fk|fm|fo|fr|ga|gb|gd|ge|gf|gg|gh|gi|gl|gm|gn|gp|gq|gr|gs|gt|gu|gw|gy|hk|hm|hn|hr|ht|hu|id|ie|il|
+        im|in|io|iq|ir|is|it|je|jm|jo|jp|ke|kg|kh|ki|km|kn|kp|kr|kw|ky|kz|la|lb|lc|li|lk|lr|ls|lt|lu|lv|ly|ma|mc|
+        md|me|mg|mh|mk|ml|mm|mn|mo|mp|mq|mr|ms|mt|mu|mv|mw|mx|my|mz|na|nc|ne|nf|ng|ni|nl|no|np|nr|nu|nz|om|pa|pe|
+        pf|pg|ph|pk|pl|pm|pn|pr|ps|pt|pw|py|qa|re|ro|rs|ru|rw|sa|sb|sc|sd|se|sg|sh|si|sj|sk|sl|sm|sn|so|sr|ss|st|
+        su|sv|sx|sy|sz|tc|td|tf|tg|th|tj|tk|tl|tm|tn|to|tp|tr|tt|tv|tw|tz|ua|ug|uk|us|uy|uz|va|vc|ve|vg|vi|vn|vu|
+        wf|ws|ye|yt|yu|za|zm|zw)
+        /
+    )
+    [^\s()<>{}\[\]]*                   # 0+ non-space, non-()<>{}[]
+    (?:                                # 0+ times:
+        \(                             #   Balanced parens containing:
+        [^\s()]*                       #   0+ non-paren chars
+        (?:                            #   0+ times:
+        \([^\s()]*\)                   #     Inner balanced parens containing 0+ non-paren chars
+        [^\s()]*                       #     0+ non-paren chars
+        )*
+        \)
+        [^\s()<>{}\[\]]*               # 0+ non-space, non-()<>{}[]
+    )*
+    (?:                                # End with:
+        \(                             #   Balanced parens containing:
+        [^\s()]*                       #   0+ non-paren chars
+        (?:                            #   0+ times:
+        \([^\s()]*\)                   #     Inner balanced parens containing 0+ non-paren chars
+        [^\s()]*                       #     0+ non-paren chars
+        )*
+        \)
+        |                              #   or
+        [^\s`!()\[\]{};:'".,<>?«»“”‘’] # not a space or one of these punctuation chars
+    )
+    |					# OR, the following to match naked domains:
+    (?:
+        (?<!@)			# not preceded by a @, avoid matching foo@_gmail.com_
+        [a-z0-9]+
+        (?:[.\-][a-z0-9]+)*
+        [.]
+        (?:com|net|org|edu|gov|mil|aero|asia|biz|cat|coop|info|int|jobs|mobi|museum|name|post|pro|tel|travel|xxx|
+        ac|ad|ae|af|ag|ai|al|am|an|ao|aq|ar|as|at|au|aw|ax|az|ba|bb|bd|be|bf|bg|bh|bi|bj|bm|bn|bo|br|bs|bt|bv|bw|
+        by|bz|ca|cc|cd|cf|cg|ch|ci|ck|cl|cm|cn|co|cr|cs|cu|cv|cx|cy|cz|dd|de|dj|dk|dm|do|dz|ec|ee|eg|eh|er|es|et|
+        eu|fi|fj|fk|fm|fo|fr|ga|gb|gd|ge|gf|gg|gh|gi|gl|gm|gn|gp|gq|gr|gs|gt|gu|gw|gy|hk|hm|hn|hr|ht|hu|id|ie|il|
+        im|in|io|iq|ir|is|it|je|jm|jo|jp|ke|kg|kh|ki|km|kn|kp|kr|kw|ky|kz|la|lb|lc|li|lk|lr|ls|lt|lu|lv|ly|ma|mc|
+        md|me|mg|mh|mk|ml|mm|mn|mo|mp|mq|mr|ms|mt|mu|mv|mw|mx|my|mz|na|nc|ne|nf|ng|ni|nl|no|np|nr|nu|nz|om|pa|pe|
+        pf|pg|ph|pk|pl|pm|pn|pr|ps|pt|pw|py|qa|re|ro|rs|ru|rw|sa|sb|sc|sd|se|sg|sh|si|sj|sk|sl|sm|sn|so|sr|ss|st|
+        su|sv|sx|sy|sz|tc|td|tf|tg|th|tj|tk|tl|tm|tn|to|tp|tr|tt|tv|tw|tz|ua|ug|uk|us|uy|uz|va|vc|ve|vg|vi|vn|vu|
+        wf|ws|ye|yt|yu|za|zm|zw)
+        \b
+        /?
+        (?!@)			# not succeeded by a @, avoid matching "foo.na" in "foo.na@example.com"
+    )
+    )
+    """,
+    re.VERBOSE | re.UNICODE,
+)
+
+# fragments that random strings are built from
+FRAGMENTS = [
+    "http:",
+    "https:",
+    "/",
+    "//",
+    "///",
+    ".",
+    "-",
+    "%",
+    "@",
+    "a",
+    "x1",
+    "Z",
+    "example",
+    "com",
+    "org",
+    "io",
+    "co",
+    "uk",
+    "zz",
+    "py",
+    "(",
+    ")",
+    "[",
+    "]",
+    "{",
+    "}",
+    "<",
+    ">",
+    " ",
+    "\n",
+    ",",
+    ";",
+    ":",
+    "'",
+    '"',
+    "?",
+    "!",
+    "`",
+    "_",
+    "é",
+    "«",
+    "»",
+    "“",
+    "’",
+]
+
+TYPICAL_DOCSTRING = """
+    Parses a date and time string in ISO 8601 format, as described in https://en.wikipedia.org/wiki/ISO_8601.
+
+    Time zone offsets are accepted with or without a colon, e.g. `+01:00` or `+0100` (see RFC 3339). Fractional
+    seconds may have any number of digits, which are rounded to microseconds.
+
+    :param value: The string to parse.
+    :param strict: Whether to reject strings that are valid in ISO 8601 but not in RFC 3339.
+    :returns: A time zone aware `datetime` object.
+    :raises ValueError: Raised when the string is not a valid date and time.
+"""
+
+CODE_SAMPLE = """
+    >>> client = Client(base_url="https://api.example.com/v1/", timeout=(3.05, 27))
+    >>> items = client.get(path="/items", params={"page": [1, 2]}, headers={"Accept": "text/html"})
+    >>> print(items[0].name, items[0].tags["lang"], os.path.join(root.dir, "index.md"))
+"""
+
+
+def reference_replace_links(text: str) -> str:
+    "Replaces plain text URLs with Markdown links using the reference regular expression."
+
+    return REFERENCE_REGEX.sub(r"[\1](\1)", text)
+
+
+def check(text: str) -> None:
+    "Raises an error if the two implementations produce a different output."
+
+    expected = reference_replace_links(text)
+    actual = replace_links(text)
+    if actual != expected:
+        raise AssertionError(f"output mismatch for input {text!r}:\nexpected: {expected!r}\nactual:   {actual!r}")
+
+
+def random_text(rng: random.Random, min_length: int, max_length: int) -> str:
+    "Random string concatenated from fragments of URLs and surrounding text."
+
+    return "".join(rng.choices(FRAGMENTS, k=rng.randint(min_length, max_length)))
+
+
+def stdlib_docstrings() -> list[str]:
+    "Doc-strings of modules, classes and functions in the standard library, parsed from source."
+
+    docstrings: list[str] = []
+    for path in sorted(Path(sysconfig.get_paths()["stdlib"]).rglob("*.py")):
+        if "site-packages" in path.parts or "test" in path.parts:
+            continue
+        try:
+            tree = ast.parse(path.read_bytes())
+        except (SyntaxError, ValueError):
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                docstring = ast.get_docstring(node, clean=False)
+                if docstring:
+                    docstrings.append(docstring)
+    return docstrings
+
+
+def worst_cases(size: int) -> list[tuple[str, str]]:
+    """
+    Inputs that are slow to match with the reference regular expression, along with a description of each.
+
+    :param size: Scale factor for the length of inputs.
+    """
+
+    return [
+        ("typical doc-string with one URL", TYPICAL_DOCSTRING * (size // 100)),
+        ("code sample with calls and brackets", CODE_SAMPLE * (size // 20)),
+        ("dotted name", ".".join("label" for _ in range(size // 10))),
+        ("hyphenated name ending in a non-domain", "a-" * (size // 4) + ".zz"),
+        ("words ending in a top-level domain", " ".join(f"self.{tld} obj.{tld}.attr" for tld in ("is", "in", "at", "to", "id", "py") * (size // 30))),
+        ("unclosed parentheses after a URL", "see http://example.com/path" + "(" * size),
+        ("unbalanced parentheses after a URL", "see http://example.com/" + "(a)(b(" * (size // 6)),
+        ("nested parentheses after a URL", "see http://example.com/" + "(x(y)z)" * (size // 7)),
+        ("deeply nested parentheses after a URL", "see http://example.com/" + "(" * (size // 2) + ")" * (size // 2)),
+        ("e-mail-like domains", " ".join("user@mail.example.com" for _ in range(size // 20))),
+        (
+            "long table with links",
+            "\n".join(f"| `module{i}.Class` | https://docs.example.org/en/{i}/index.html | ftp.example.net | see api.{i}.io/ref |" for i in range(size // 80)),
+        ),
+    ]
+
+
+def measure(replace: Callable[[str], str], text: str) -> float:
+    "Time (in milliseconds) per call, repeating calls for at least a minimum amount of time."
+
+    count = 0
+    start = time.perf_counter()
+    while True:
+        replace(text)
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_TIME:
+            return elapsed / count * 1e3
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+
+    for _ in range(SHORT_COUNT):
+        check(random_text(rng, 1, 12))
+    print(f"{SHORT_COUNT} random short strings match")
+
+    for _ in range(LONG_COUNT):
+        check(random_text(rng, 30, 200))
+    print(f"{LONG_COUNT} random long strings match")
+
+    docstrings = stdlib_docstrings()
+    for docstring in docstrings:
+        check(docstring)
+    print(f"{len(docstrings)} standard library doc-strings match")
+
+    size = 4000
+    print(f"{'input':<40} {'length':>7} {'regex [ms]':>11} {'scanner [ms]':>13} {'scanner (4x input) [ms]':>24}")
+    for (description, text), (_, long_text) in zip(worst_cases(size), worst_cases(4 * size), strict=True):
+        check(text)
+        check(long_text)
+        print(
+            f"{description:<40} {len(text):>7} {measure(reference_replace_links, text):>11.3f} "
+            f"{measure(replace_links, text):>13.3f} {measure(replace_links, long_text):>24.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ Copyright 2024-2026, Levente Hunyadi
 """
 
 import argparse
+import contextlib
 import importlib
 import sys
 from dataclasses import dataclass
@@ -14,18 +15,48 @@ from pathlib import Path
 from types import ModuleType
 
 from .argparse_action import enum_action
-from .generator import MarkdownAnchorStyle, MarkdownOptions, PartitionStrategy, generate_markdown
-from .import_util import import_modules
+from .cache import default_budget
+from .dependency import DependencyGraph, changed_files, changed_modules
+from .generator import MarkdownAnchorStyle, MarkdownGenerator, MarkdownOptions, PartitionStrategy
+from .import_util import ImportProfiler, compile_modules, import_modules, walk_modules
+from .inventory import Inventory
+from .isolation import IsolatedGenerator
+from .memory import MemoryProfiler
+from .pipeline import PipelineGenerator
+from .server import DocumentServer
 
 
 @dataclass
 class ProgramArgs(argparse.Namespace):
     directory: list[Path]
     module: list[str]
+    include: list[str]
+    exclude: list[str]
     root_dir: Path
     out_dir: Path
+    precompile: bool
+    check: bool
+    isolated: bool
+    pipeline: list[int] | None
+    serve: str | None
+    workers: int | None
+    threads: int
+    max_modules_per_worker: int | None
+    max_worker_memory: int | None
+    import_profile: Path | None
+    memory_profile: Path | None
     anchor_style: MarkdownAnchorStyle
     partition: PartitionStrategy
+    inventory: list[list[str]] | None
+    write_inventory: Path | None
+    search_index: Path | None
+    navigation: bool
+    dependencies: Path | None
+    since: str | None
+    cache_stats: bool
+    cache_size: int | None
+    max_type_args: int | None
+    max_type_length: int | None
 
 
 parser = argparse.ArgumentParser(
@@ -47,6 +78,18 @@ parser.add_argument(
     nargs="*",
     help="qualified names(s) of Python module(s) to scan",
 )
+parser.add_argument(
+    "--include",
+    action="extend",
+    nargs="*",
+    help="glob pattern(s) of qualified module names to import when recursing into folders, or regular expression(s) with prefix 're:'",
+)
+parser.add_argument(
+    "--exclude",
+    action="extend",
+    nargs="*",
+    help="glob pattern(s) of qualified module names to skip (with all sub-modules) when recursing into folders, or regular expression(s) with prefix 're:'",
+)
 parser.add_argument(
     "-r",
     "--root-dir",
@@ -61,6 +104,65 @@ parser.add_argument(
     default=Path.cwd() / "docs",
     help="output directory (default: 'docs' in working directory)",
 )
+parser.add_argument(
+    "--precompile",
+    action="store_true",
+    help="compile modules to bytecode in parallel before importing them when recursing into folders",
+)
+parser.add_argument(
+    "--check",
+    action="store_true",
+    help="validate doc-strings and cross-references in parallel, report all problems with file and line, and write no output",
+)
+mode_group = parser.add_mutually_exclusive_group()
+mode_group.add_argument(
+    "--isolated",
+    action="store_true",
+    help="import and document modules in worker processes, keeping the memory footprint of the main process small",
+)
+mode_group.add_argument(
+    "--pipeline",
+    type=int,
+    nargs=4,
+    metavar=("IMPORT", "EXTRACT", "RENDER", "WRITE"),
+    help="import, extract, render and write modules in a pipeline of stages with the given number of threads each, and print stage statistics",
+)
+mode_group.add_argument(
+    "--serve",
+    metavar="ADDRESS",
+    help="serve Markdown documents over HTTP on 'host:port' or a Unix domain socket 'unix:path', re-rendering modules that change on disk",
+)
+parser.add_argument(
+    "--workers",
+    type=int,
+    help="number of worker processes (or threads with --check) running at the same time (default: number of processors)",
+)
+parser.add_argument(
+    "--threads",
+    type=int,
+    default=1,
+    help="number of threads rendering modules, classes and functions in parallel, which pays off on free-threaded Python builds (default: 1)",
+)
+parser.add_argument(
+    "--max-modules-per-worker",
+    type=int,
+    help="number of modules a worker process documents before it is replaced with a new one",
+)
+parser.add_argument(
+    "--max-worker-memory",
+    type=int,
+    help="peak memory (in MiB) above which a worker process is replaced with a new one",
+)
+parser.add_argument(
+    "--import-profile",
+    type=Path,
+    help="print time it takes to import each module when recursing into folders, and write import times to a JSON file",
+)
+parser.add_argument(
+    "--memory-profile",
+    type=Path,
+    help="print memory allocated while importing and rendering each module with the top allocation sites, and write measurements to a JSON file",
+)
 parser.add_argument(
     "--anchor-style",
     action=enum_action(MarkdownAnchorStyle),
@@ -73,26 +175,206 @@ parser.add_argument(
     default=PartitionStrategy.SINGLE,
     help="how to split module contents across Markdown files",
 )
+parser.add_argument(
+    "--inventory",
+    action="append",
+    nargs=2,
+    metavar=("FILE", "URL"),
+    help="local Sphinx 'objects.inv' or JSON link inventory of objects documented elsewhere, and the base URL its links are relative to",
+)
+parser.add_argument(
+    "--write-inventory",
+    type=Path,
+    help="write a JSON link inventory of all objects documented, which other projects can pass to '--inventory'",
+)
+parser.add_argument(
+    "--search-index",
+    type=Path,
+    help="write a JSON search index of names and doc-string summaries of all symbols documented, mapped to file and anchor",
+)
+parser.add_argument(
+    "--navigation",
+    action="store_true",
+    help="write 'SUMMARY.md' with all modules and an index page 'README.md' for each package to the output directory",
+)
+parser.add_argument(
+    "--dependencies",
+    type=Path,
+    help="record the modules that the documents of each module link to in a JSON file, which '--since' reads to find the documents a change affects",
+)
+parser.add_argument(
+    "--since",
+    metavar="REV",
+    help="only render modules changed since a git revision (including uncommitted changes), and modules that link to them as recorded with '--dependencies'",
+)
+parser.add_argument(
+    "--cache-stats",
+    action="store_true",
+    help="print the number of entries, estimated size and hit ratio of each cache after generating",
+)
+parser.add_argument(
+    "--cache-size",
+    type=int,
+    help="memory budget (in MiB) shared by caches, beyond which least recently used entries are evicted (default: 256)",
+)
+parser.add_argument(
+    "--max-type-args",
+    type=int,
+    help="maximum number of arguments to show for a generic type, union or 'Literal', eliding the rest",
+)
+parser.add_argument(
+    "--max-type-length",
+    type=int,
+    help="number of characters in a type after which remaining arguments are elided",
+)
 
 args = parser.parse_args(namespace=ProgramArgs)
 out_dir = Path.cwd() / args.out_dir  # does not alter absolute paths
 root_dir = Path.cwd() / args.root_dir  # does not alter absolute paths
 
 try:
-    modules: list[ModuleType] = []
+    if args.cache_size is not None:
+        default_budget.resize(args.cache_size * 1024 * 1024)
+
     if args.directory:
         for directory in args.directory:
             if not directory.is_dir():
                 raise ValueError(f"not a directory: {directory}")
 
-            modules.extend(import_modules(root_dir, directory))
-    if args.module:
-        for module in args.module:
-            modules.append(importlib.import_module(module))
+            if args.precompile:
+                print(compile_modules(root_dir, directory, include=args.include, exclude=args.exclude))
+
+    inventories = [Inventory.load(Path(path), base_url) for path, base_url in args.inventory or []]
+    options = MarkdownOptions(
+        anchor_style=args.anchor_style,
+        partition_strategy=args.partition,
+        inventories=inventories,
+        max_type_args=args.max_type_args,
+        max_type_length=args.max_type_length,
+    )
+
+    if args.isolated or args.pipeline is not None or args.serve is not None:
+        if args.isolated:
+            mode = "isolated worker processes"
+        elif args.pipeline is not None:
+            mode = "a pipeline"
+        else:
+            mode = "a documentation server"
+        if args.import_profile:
+            raise ValueError(f"import profiling is not available with {mode}")
+        if args.memory_profile:
+            raise ValueError(f"memory profiling is not available with {mode}")
+        if args.dependencies or args.since is not None:
+            raise ValueError(f"selective rebuild is not available with {mode}")
+        if args.check:
+            raise ValueError(f"validation is not available with {mode}")
+        if args.threads > 1:
+            raise ValueError(f"thread-parallel rendering is not available with {mode}")
+
+        module_names: list[str] = []
+        if args.directory:
+            for directory in args.directory:
+                module_names.extend(name for name, _ in walk_modules(root_dir, directory, include=args.include, exclude=args.exclude))
+        if args.module:
+            module_names.extend(args.module)
+        if not module_names:
+            raise ValueError("no Python module given")
+
+        if args.serve is not None:
+            server = DocumentServer(module_names, options=options)
+            server.warm()
+            server.serve(args.serve)
+        elif args.pipeline is not None:
+            import_workers, extract_workers, render_workers, write_workers = args.pipeline
+            metrics = PipelineGenerator(
+                module_names,
+                options=options,
+                import_workers=import_workers,
+                extract_workers=extract_workers,
+                render_workers=render_workers,
+                write_workers=write_workers,
+            ).generate(out_dir, inventory_file=args.write_inventory, search_index_file=args.search_index, navigation=args.navigation)
+            print(metrics.report())
+        else:
+            IsolatedGenerator(
+                module_names,
+                options=options,
+                workers=args.workers,
+                max_modules_per_worker=args.max_modules_per_worker,
+                max_memory=args.max_worker_memory * 1024 * 1024 if args.max_worker_memory is not None else None,
+            ).generate(out_dir, inventory_file=args.write_inventory, search_index_file=args.search_index, navigation=args.navigation)
+    else:
+        if args.memory_profile and args.threads > 1:
+            raise ValueError("memory profiling is not available with thread-parallel rendering")
+
+        profiler = ImportProfiler() if args.import_profile else None
+        memory_profiler = MemoryProfiler() if args.memory_profile else None
+        modules: list[ModuleType] = []
+        if args.directory:
+            for directory in args.directory:
+                modules.extend(
+                    import_modules(root_dir, directory, include=args.include, exclude=args.exclude, profiler=profiler, memory_profiler=memory_profiler)
+                )
+        if args.module:
+            with profiler if profiler is not None else contextlib.nullcontext():
+                for module in args.module:
+                    with memory_profiler.measure(module, "import") if memory_profiler is not None else contextlib.nullcontext():
+                        modules.append(importlib.import_module(module))
+        if profiler is not None and args.import_profile is not None:
+            print(profiler.report())
+            profiler.write_json(args.import_profile)
+
+        # links may point to any module imported, even if the module itself is not rendered
+        batch = [module.__name__ for module in modules]
+        if args.since is not None:
+            if args.dependencies is None:
+                raise ValueError("selective rebuild requires a dependency graph file ('--dependencies')")
+            if args.write_inventory is not None or args.search_index is not None or args.navigation:
+                # these files list the objects of all modules, whereas only some modules are rendered
+                raise ValueError("selective rebuild is not available with '--write-inventory', '--search-index' or '--navigation'")
+
+            changed = changed_modules(root_dir, changed_files(root_dir, args.since))
+            if args.dependencies.exists():
+                affected = DependencyGraph.load(args.dependencies).affected(changed)
+                modules = [module for module in modules if module.__name__ in affected]
+                print(f"{len(modules)} of {len(batch)} module(s) affected by changes since {args.since}")
+            else:
+                print(f"no dependency graph in {args.dependencies}, rendering all modules")
+
+        if args.check:
+            if not batch:
+                raise ValueError("no Python module given")
+
+            # modules are imported but not rendered
+            if memory_profiler is not None and args.memory_profile is not None:
+                print(memory_profiler.report())
+                memory_profiler.write_json(args.memory_profile)
 
-    options = MarkdownOptions(anchor_style=args.anchor_style)
+            issues = MarkdownGenerator(modules, options=options, batch=batch).validate(workers=args.workers)
+            for issue in issues:
+                print(issue)
+            if issues:
+                sys.exit(1)
+        else:
+            if not batch:
+                raise ValueError("no Python module given")
 
-    generate_markdown(modules, out_dir, options=options)
+            generator = MarkdownGenerator(modules, options=options, batch=batch)
+            generator.generate(
+                out_dir,
+                inventory_file=args.write_inventory,
+                search_index_file=args.search_index,
+                navigation=args.navigation,
+                threads=args.threads,
+                memory_profiler=memory_profiler,
+                dependency_file=args.dependencies,
+            )
+            if args.cache_stats:
+                for stats in generator.cache_stats():
+                    print(stats)
+            if memory_profiler is not None and args.memory_profile is not None:
+                print(memory_profiler.report())
+                memory_profiler.write_json(args.memory_profile)
 except Exception as e:
     print(e, file=sys.stderr)
     if e.__cause__:
@@ -0,0 +1,424 @@
+"""
+Generate Markdown documentation from Python code
+
+Copyright 2024-2026, Levente Hunyadi
+
+:see: https://github.com/hunyadi/markdown_doc
+"""
+
+import collections
+import functools
+import itertools
+import sys
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Callable, Generic, Hashable, Iterator, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# approximate memory held by an entry in the dictionaries of a cache and its budget
+_ENTRY_OVERHEAD = 200
+
+# values that hold no references to other objects
+_ATOMIC_TYPES = frozenset([str, bytes, int, float, bool, type(None)])
+
+# objects shared with the rest of the program
+_SHARED_TYPES = (type, ModuleType, FunctionType, MethodType, BuiltinFunctionType)
+
+
+def estimate_size(value: object) -> int:
+    """
+    Estimates the memory (in bytes) held by a value, following containers and object attributes.
+
+    Classes, functions and modules are shared with the rest of the program, and are not counted.
+    """
+
+    if type(value) in _ATOMIC_TYPES:
+        return sys.getsizeof(value)
+
+    seen: set[int] = set()
+    total = 0
+    stack: list[object] = [value]
+    while stack:
+        obj = stack.pop()
+        if type(obj) in _ATOMIC_TYPES:
+            total += sys.getsizeof(obj)
+            continue
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            attributes = getattr(obj, "__dict__", None)
+            if attributes is not None:
+                stack.append(attributes)
+            for slot in getattr(type(obj), "__slots__", ()):
+                if hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+    return total
+
+
+@dataclass
+class CacheStats:
+    """
+    Statistics of a cache.
+
+    :param name: Name of the cache.
+    :param entries: Number of entries held.
+    :param size: Estimated memory (in bytes) held by entries.
+    :param hits: Number of lookups served from the cache.
+    :param misses: Number of lookups not found in the cache.
+    :param evictions: Number of entries discarded to stay within the memory budget.
+    :param compute_time: Total time (in seconds) spent computing values not found in the cache.
+    """
+
+    name: str
+    entries: int = 0
+    size: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    compute_time: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        "Fraction of lookups served from the cache."
+
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def saved_time(self) -> float:
+        "Estimated time (in seconds) that computing the values served from the cache would have taken."
+
+        return self.hits * self.compute_time / self.misses if self.misses else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.entries} entries, {self.size / 1024:.0f} KiB, {self.hits} hits, {self.misses} misses "
+            f"({self.hit_ratio:.1%} hit ratio), {self.evictions} evictions, about {self.saved_time:.3f}s saved"
+        )
+
+
+class CacheBudget:
+    """
+    A memory budget shared by caches.
+
+    Once the estimated size of all entries exceeds the budget, the least recently used entries are evicted, regardless
+    of which cache they belong to. Caches that share a budget share its lock, which makes them safe to use from
+    several threads. Caches are referenced weakly, and the entries of a cache that is garbage collected (e.g. with the
+    generator that owns it) no longer count towards the budget.
+
+    :param max_size: Maximum estimated memory (in bytes) held by entries of all caches.
+    """
+
+    max_size: int
+    size: int
+    lock: threading.Lock
+    _lru: "collections.OrderedDict[tuple[int, tuple[Any, Hashable]], int]"
+    _caches: "dict[int, weakref.ref[MemoryCache[Any, Any]]]"
+    _released: list[tuple[int, dict[tuple[Any, Hashable], Any]]]
+    _serials: Iterator[int]
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.size = 0
+        self.lock = threading.Lock()
+        self._lru = collections.OrderedDict()
+        self._caches = {}
+        self._released = []
+        self._serials = itertools.count()
+
+    def resize(self, max_size: int) -> None:
+        "Changes the budget, evicting entries if the caches hold more than the new budget."
+
+        with self.lock:
+            self.max_size = max_size
+            self._evict()
+
+    def register(self, cache: "MemoryCache[Any, Any]", entries: dict[tuple[Any, Hashable], Any]) -> int:
+        "Registers a cache with its entries, and returns the serial number that identifies the cache in the budget."
+
+        with self.lock:
+            serial = next(self._serials)
+            self._caches[serial] = weakref.ref(cache)
+
+        # invoked by the garbage collector in any thread, possibly while the lock is held: defer clean-up to the next update
+        weakref.finalize(cache, self._released.append, (serial, entries))
+        return serial
+
+    def _release(self) -> None:
+        "Discards the entries of caches that have been garbage collected."
+
+        while self._released:
+            serial, entries = self._released.pop()
+            del self._caches[serial]
+            for key in entries:
+                self.size -= self._lru.pop((serial, key), 0)
+
+    def add(self, serial: int, key: tuple[Any, Hashable], size: int) -> None:
+        self._release()
+        self._lru[(serial, key)] = size
+        self.size += size
+        self._evict()
+
+    def remove(self, serial: int, key: tuple[Any, Hashable]) -> int:
+        size = self._lru.pop((serial, key), 0)
+        self.size -= size
+        return size
+
+    def _evict(self) -> None:
+        while self.size > self.max_size and self._lru:
+            (serial, key), size = self._lru.popitem(last=False)
+            self.size -= size
+            cache = self._caches[serial]()
+            if cache is not None:
+                cache.evicted(key, size)
+
+    def stats(self) -> list[CacheStats]:
+        "Statistics of all caches that share the budget, sorted by name."
+
+        with self.lock:
+            self._release()
+            caches = [cache for ref in self._caches.values() if (cache := ref()) is not None]
+        return sorted((cache.stats() for cache in caches), key=lambda stats: stats.name)
+
+
+default_budget = CacheBudget(256 * 1024 * 1024)
+"The memory budget shared by caches unless another budget is given."
+
+
+class MemoryCache(Generic[K, V]):
+    """
+    A cache of computed values within a memory budget, with least recently used entries evicted first.
+
+    With weak keys, a key (e.g. a class or a module) is referenced weakly and compared by identity, and all entries of
+    the key are discarded when the key is garbage collected, such that a cache does not keep classes and modules alive
+    across reloads. A sub-key distinguishes several values computed for the same key.
+
+    `None` is not cached as a value.
+    """
+
+    name: str
+    weak: bool
+    sizeof: Callable[[V], int]
+    budget: CacheBudget
+    _entries: dict[tuple[Any, Hashable], V]
+    _refs: dict[int, "weakref.ref[Any]"]
+    _subkeys: dict[int, set[Hashable]]
+    _collected: list[int]
+    _stats: CacheStats
+    _hits: int
+    _misses: int
+    _serial: int
+    _lock: threading.Lock
+    _touch: Callable[[tuple[int, tuple[Any, Hashable]]], None]
+
+    def __init__(self, name: str, *, weak: bool = False, sizeof: Callable[[V], int] = estimate_size, budget: CacheBudget | None = None) -> None:
+        """
+        Creates a cache.
+
+        :param name: Name of the cache in statistics.
+        :param weak: Whether keys are referenced weakly and compared by identity.
+        :param sizeof: Estimates the memory (in bytes) held by a value.
+        :param budget: The memory budget the cache shares with other caches.
+        """
+
+        self.name = name
+        self.weak = weak
+        self.sizeof = sizeof
+        self.budget = budget if budget is not None else default_budget
+        self._entries = {}
+        self._refs = {}
+        self._subkeys = {}
+        self._collected = []
+        self._stats = CacheStats(name)
+        self._hits = 0
+        self._misses = 0
+        self._serial = self.budget.register(self, self._entries)
+
+        # bound ahead of time, since lookups are frequent and mostly hits
+        self._lock = self.budget.lock
+        self._touch = self.budget._lru.move_to_end
+
+    def _on_collected(self, ident: int, ref: "weakref.ref[Any]") -> None:
+        # invoked by the garbage collector in any thread, possibly while the lock is held: defer clean-up to the next lookup
+        self._collected.append(ident)
+
+    def _purge(self) -> None:
+        "Discards entries of weak keys that have been garbage collected."
+
+        while self._collected:
+            ident = self._collected.pop()
+            ref = self._refs.get(ident)
+            if ref is not None and ref() is None:
+                self._discard_ident(ident)
+
+    def _discard_ident(self, ident: int) -> None:
+        for subkey in self._subkeys.pop(ident, set()):
+            self._remove((ident, subkey))
+        self._refs.pop(ident, None)
+
+    def _remove(self, key: tuple[Any, Hashable]) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._stats.entries -= 1
+            self._stats.size -= self.budget.remove(self._serial, key)
+
+    def _key(self, key: K, subkey: Hashable) -> tuple[Any, Hashable]:
+        "Internal key of a weak key, which is the identity of the object."
+
+        ident = id(key)
+        ref = self._refs.get(ident)
+        if ref is not None and ref() is not key:
+            # identity of an object garbage collected has been reused by a new object
+            self._discard_ident(ident)
+        return (ident, subkey)
+
+    def get(self, key: K, subkey: Hashable = None) -> V | None:
+        "Returns a cached value, or `None` if not found."
+
+        with self._lock:
+            if self._collected:
+                self._purge()
+            internal_key = self._key(key, subkey) if self.weak else (key, subkey)
+            value = self._entries.get(internal_key)
+            if value is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._touch((self._serial, internal_key))
+            return value
+
+    def put(self, key: K, value: V, subkey: Hashable = None) -> V:
+        """
+        Caches a value unless a value has been cached for the key in the meantime (e.g. by another thread).
+
+        :returns: The value held by the cache, or the value passed if it cannot be cached.
+        """
+
+        if value is None:
+            return value
+
+        with self._lock:
+            if self._collected:
+                self._purge()
+            internal_key = self._key(key, subkey) if self.weak else (key, subkey)
+            existing = self._entries.get(internal_key)
+            if existing is not None:
+                return existing
+
+            if self.weak:
+                ident = id(key)
+                if ident not in self._refs:
+                    try:
+                        self._refs[ident] = weakref.ref(key, functools.partial(self._on_collected, ident))
+                    except TypeError:  # object does not support weak references
+                        return value
+                self._subkeys.setdefault(ident, set()).add(subkey)
+
+            size = self.sizeof(value) + _ENTRY_OVERHEAD
+            self._entries[internal_key] = value
+            self._stats.entries += 1
+            self._stats.size += size
+            self.budget.add(self._serial, internal_key, size)
+            return value
+
+    def get_or_compute(self, key: K, compute: Callable[[], V], subkey: Hashable = None) -> V:
+        "Returns a cached value, computing and caching it if not found."
+
+        value = self.get(key, subkey)
+        if value is not None:
+            return value
+        return self.compute(key, compute, subkey)
+
+    def compute(self, key: K, compute: Callable[[], V], subkey: Hashable = None) -> V:
+        "Computes and caches a value after a lookup has not found it."
+
+        start = time.perf_counter()
+        value = compute()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._stats.compute_time += elapsed
+        return self.put(key, value, subkey)
+
+    def evicted(self, key: tuple[Any, Hashable], size: int) -> None:
+        "Invoked by the budget when an entry is evicted."
+
+        self._entries.pop(key, None)
+        self._stats.entries -= 1
+        self._stats.size -= size
+        self._stats.evictions += 1
+        if self.weak:
+            ident, subkey = key
+            subkeys = self._subkeys.get(ident)
+            if subkeys is not None:
+                subkeys.discard(subkey)
+                if not subkeys:
+                    del self._subkeys[ident]
+                    del self._refs[ident]
+
+    def discard(self, key: K) -> None:
+        "Discards all values cached for a key."
+
+        with self._lock:
+            if self.weak:
+                ident = id(key)
+                ref = self._refs.get(ident)
+                if ref is not None and ref() is key:
+                    self._discard_ident(ident)
+            else:
+                for internal_key in [internal_key for internal_key in self._entries if internal_key[0] == key]:
+                    self._remove(internal_key)
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> None:
+        "Discards all values cached for keys that satisfy a condition."
+
+        with self._lock:
+            if self.weak:
+                for ident, ref in list(self._refs.items()):
+                    key = ref()
+                    if key is not None and predicate(key):
+                        self._discard_ident(ident)
+            else:
+                for internal_key in [internal_key for internal_key in self._entries if predicate(internal_key[0])]:
+                    self._remove(internal_key)
+
+    def clear(self) -> None:
+        "Discards all values."
+
+        with self._lock:
+            for internal_key in list(self._entries):
+                self._remove(internal_key)
+            self._refs.clear()
+            self._subkeys.clear()
+
+    def stats(self) -> CacheStats:
+        "Returns a snapshot of statistics."
+
+        with self._lock:
+            stats = self._stats
+            return CacheStats(stats.name, stats.entries, stats.size, self._hits, self._misses, stats.evictions, stats.compute_time)
+
+
+def lru_cache_stats(name: str, info: functools._CacheInfo) -> CacheStats:
+    """
+    Statistics of a function memoized with `functools.lru_cache`.
+
+    Such a cache is bounded by a number of entries rather than by the memory budget, and its size is not estimated.
+
+    :param name: Name of the cache in statistics.
+    :param info: Statistics returned by `cache_info()` of the memoized function.
+    """
+
+    return CacheStats(name, entries=info.currsize, hits=info.hits, misses=info.misses, evictions=info.misses - info.currsize)
@@ -0,0 +1,129 @@
+"""
+Generate Markdown documentation from Python code
+
+Copyright 2024-2026, Levente Hunyadi
+
+:see: https://github.com/hunyadi/markdown_doc
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import Iterable
+
+from .import_util import module_path
+
+
+class DependencyGraph:
+    """
+    Records which modules the documentation of each module links to.
+
+    The documents of a module depend on the modules they link to, since links carry the file name and anchor of the
+    object they point to. When a module changes, its own documents and the documents of modules linking into it may
+    change, and no other documents do.
+    """
+
+    links: dict[str, set[str]]
+
+    def __init__(self, links: dict[str, set[str]] | None = None) -> None:
+        """
+        Creates a dependency graph.
+
+        :param links: Maps the qualified name of a module to the qualified names of modules its documents link to.
+        """
+
+        self.links = links if links is not None else {}
+
+    def __len__(self) -> int:
+        return len(self.links)
+
+    def add(self, module_name: str, linked_modules: Iterable[str]) -> None:
+        "Records (or replaces) the modules that the documents of a module link to."
+
+        self.links[module_name] = set(linked_modules)
+
+    def dependents(self, module_names: Iterable[str]) -> set[str]:
+        "Modules whose documents link to any of the given modules."
+
+        targets = set(module_names)
+        return {module_name for module_name, linked in self.links.items() if not linked.isdisjoint(targets)}
+
+    def affected(self, module_names: Iterable[str]) -> set[str]:
+        "Modules whose documents may change when the given modules change, including the modules themselves."
+
+        changed = set(module_names)
+        return changed | self.dependents(changed)
+
+    @staticmethod
+    def load(path: Path) -> "DependencyGraph":
+        "Loads a dependency graph from a JSON file."
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or not isinstance(data.get("links"), dict):
+            raise ValueError(f"expected: JSON dependency graph with a mapping of links in {path}")
+        return DependencyGraph({module_name: set(linked) for module_name, linked in data["links"].items()})
+
+    def write(self, path: Path) -> None:
+        "Writes the dependency graph to a JSON file, with modules sorted by name."
+
+        links = {module_name: sorted(linked) for module_name, linked in sorted(self.links.items())}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "links": links}, f, indent=4)
+
+
+def _git(directory: Path, *args: str) -> str:
+    "Runs a git command in a directory, and returns its output."
+
+    try:
+        process = subprocess.run(["git", "-C", str(directory), *args], capture_output=True, text=True, check=True)
+    except FileNotFoundError as e:
+        raise ValueError("git is not available") from e
+    except subprocess.CalledProcessError as e:
+        raise ValueError(f"git {' '.join(args)} failed: {e.stderr.strip()}") from None
+    return process.stdout
+
+
+def changed_files(directory: Path, since: str) -> list[Path]:
+    """
+    Lists files in the local git repository that changed since a revision, without contacting a remote.
+
+    Changes in the working tree, whether staged or not, and untracked files (unless ignored) count as changes.
+
+    :param directory: A directory within the git repository.
+    :param since: A git revision such as a branch name, tag or commit hash, e.g. `main` or `HEAD~3`.
+    :returns: Absolute paths of files added, modified, renamed or deleted, below the directory as given (i.e. symbolic
+        links are not resolved).
+    """
+
+    # the top level is found relative to the directory, since git resolves symbolic links in absolute paths
+    top_level = Path(os.path.normpath(directory.absolute() / _git(directory, "rev-parse", "--show-cdup").strip()))
+    paths = _git(top_level, "diff", "--name-only", "--no-renames", "-z", since, "--").split("\0")
+    paths.extend(_git(top_level, "ls-files", "--others", "--exclude-standard", "-z").split("\0"))
+    return sorted({top_level / path for path in paths if path})
+
+
+def changed_modules(root_path: Path, paths: Iterable[Path]) -> set[str]:
+    """
+    Maps Python source files to qualified module names.
+
+    Files outside the root path and files other than Python source files are skipped. Deleted files map to the module
+    they used to define, such that modules that linked into them are rebuilt.
+
+    :param root_path: The directory to act as `PYTHONPATH`.
+    :param paths: Absolute paths of files.
+    """
+
+    # paths are made absolute without resolving symbolic links, the same way as when modules are enumerated
+    root_path = root_path.absolute()
+    module_names: set[str] = set()
+    for path in paths:
+        path = path.absolute()
+        if path.suffix != ".py" or not path.is_relative_to(root_path):
+            continue
+        if path.name == "__init__.py":
+            module_names.add(module_path(root_path, path.parent))
+        else:
+            module_names.add(module_path(root_path, path.with_suffix("")))
+    return module_names
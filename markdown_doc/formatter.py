@@ -6,9 +6,10 @@ Copyright 2024-2026, Levente Hunyadi
 :see: https://github.com/hunyadi/markdown_doc
 """
 
+import inspect
 import sys
 import typing
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from types import ModuleType, UnionType
 from typing import Any, ForwardRef, Literal, ParamSpec, TypeVar, Union
@@ -20,6 +21,9 @@ else:
     from typing_extensions import LiteralString as LiteralString
     from typing_extensions import Self as Self
 
+if sys.version_info >= (3, 14):
+    import annotationlib
+
 
 def is_union_type(tp: Any) -> bool:
     """
@@ -70,6 +74,28 @@ def evaluate_type(typ: Any, module: ModuleType) -> Any:
         return typ
 
 
+def get_signature(function: Callable[..., Any]) -> inspect.Signature:
+    """
+    Returns the signature of a function without forcing evaluation of its type annotations, where possible.
+
+    With lazily evaluated annotations (Python 3.14 and later), names that are not (yet) defined are returned as forward
+    references rather than raising `NameError`, and annotations that fail to evaluate for other reasons are returned as
+    strings. Forward references are evaluated only when the type formatter has to resolve them to produce a link.
+    Earlier versions of Python evaluate annotations eagerly (unless postponed with `from __future__ import annotations`),
+    and the signature is returned as is.
+
+    :param function: The function whose signature to inspect.
+    """
+
+    if sys.version_info >= (3, 14):
+        try:
+            return inspect.signature(function, annotation_format=annotationlib.Format.FORWARDREF)
+        except Exception:
+            return inspect.signature(function, annotation_format=annotationlib.Format.STRING)
+    else:
+        return inspect.signature(function)
+
+
 @dataclass(kw_only=True)
 class TypeFormatterOptions:
     """
@@ -86,19 +112,70 @@ class TypeFormatterOptions:
 
     Here, we want the documentation generator to emit `JsonType` and `int16` for these types rather than their lengthy definition.
 
+    Limits keep the output size bounded for types such as `Literal[...]` with thousands of values. When a limit is reached,
+    the remaining arguments of a type are elided, e.g. `Literal['a', 'b', … (+998 more)]`.
+
     :param type_transform: Transformation to apply to types before a string is emitted, e.g. to create a link in a documentation.
     :param value_transform: Transformation to apply to values (e.g. in arguments to `Literal`) before a string is emitted.
     :param auxiliary_types: Maps each Python type (typically `Annotated[T, ...]`) to a human-readable name.
+    :param max_args: Maximum number of arguments to emit for a generic type, union or `Literal`.
+    :param max_length: Number of characters after which remaining arguments are elided.
     """
 
     type_transform: Callable[[type], str] | None
     value_transform: Callable[[Any], str] | None
     auxiliary_types: dict[object, str]
+    max_args: int | None = None
+    max_length: int | None = None
+
+
+class _Arguments:
+    """
+    Arguments of a generic type, union or `Literal` that are emitted one at a time.
+
+    :param kind: Kind of work item that emits each argument, e.g. a type or a value.
+    :param items: Arguments to emit.
+    :param separator: Text between consecutive arguments.
+    :param closing: Text that follows the last argument, e.g. a closing bracket.
+    :param index: Index of the next argument to emit.
+    """
+
+    __slots__ = ("kind", "items", "separator", "closing", "index")
+
+    kind: int
+    items: Sequence[Any]
+    separator: str
+    closing: str
+    index: int
+
+    def __init__(self, kind: int, items: Sequence[Any], separator: str, closing: str) -> None:
+        self.kind = kind
+        self.items = items
+        self.separator = separator
+        self.closing = closing
+        self.index = 0
+
+
+# work item kinds, each paired with a payload
+_EMIT = 0  # text to append to the output
+_TYPE = 1  # type to format (with metadata)
+_PLAIN = 2  # type to format (without metadata)
+_VALUE = 3  # value to format, e.g. an argument to `Literal`
+_REPR = 4  # object to format with `repr`, e.g. metadata in `Annotated`
+_ARGUMENTS = 5  # arguments of a generic type
+
+_Item = tuple[int, Any]
+
+# maximum number of pending work items, which bounds the nesting depth of types
+_MAX_PENDING = 100000
 
 
 class TypeFormatter:
     """
     Converts a simple, composite or generic type to a string representation.
+
+    Types are formatted iteratively with an explicit stack of work items, and text is appended to a single output buffer,
+    such that deeply nested types neither exhaust the call stack nor allocate intermediate strings.
     """
 
     context: ModuleType | None
@@ -139,11 +216,90 @@ class TypeFormatter:
         :param data_type_args: A tuple of `(X,Y,Z)` for a union of `X | Y | Z` or `Union[X, Y, Z]`.
         """
 
-        return " | ".join(self.python_type_to_str(t) for t in data_type_args)
+        return self._format((_ARGUMENTS, _Arguments(_TYPE, data_type_args, " | ", "")))
 
     def plain_type_to_str(self, data_type: Any) -> str:
         "Returns the string representation of a Python type without metadata."
 
+        return self._format((_PLAIN, data_type))
+
+    def python_type_to_str(self, data_type: Any) -> str:
+        "Returns the string representation of a Python type."
+
+        return self._format((_TYPE, data_type))
+
+    def _format(self, item: _Item) -> str:
+        "Processes work items until the stack is exhausted, appending text to the output buffer."
+
+        max_args = self.options.max_args
+        max_length = self.options.max_length
+
+        buffer: list[str] = []
+        length = 0
+        stack: list[_Item] = [item]
+        while stack:
+            kind, payload = stack.pop()
+            if kind != _ARGUMENTS:
+                result = self._expand(kind, payload)
+                if isinstance(result, str):
+                    buffer.append(result)
+                    length += len(result)
+                else:
+                    # push in reverse order such that items are processed in order
+                    stack.extend(reversed(result))
+                    if len(stack) > _MAX_PENDING:
+                        raise ValueError(f"type is nested too deeply: {payload}")
+                continue
+
+            # emit arguments that expand to text in place, and suspend at the first that expands to further work items
+            args: _Arguments = payload
+            while True:
+                remaining = len(args.items) - args.index
+                if remaining == 0:
+                    text = args.closing
+                elif (max_args is not None and args.index >= max_args) or (max_length is not None and length >= max_length):
+                    separator = args.separator if args.index > 0 else ""
+                    text = f"{separator}… (+{remaining} more){args.closing}"
+                else:
+                    if args.index > 0:
+                        buffer.append(args.separator)
+                        length += len(args.separator)
+                    result = self._expand(args.kind, args.items[args.index])
+                    args.index += 1
+                    if isinstance(result, str):
+                        buffer.append(result)
+                        length += len(result)
+                        continue
+
+                    stack.append((_ARGUMENTS, args))
+                    stack.extend(reversed(result))
+                    break
+
+                buffer.append(text)
+                length += len(text)
+                break
+
+        return "".join(buffer)
+
+    def _expand(self, kind: int, payload: Any) -> str | list[_Item]:
+        "Returns the text a work item emits, or the work items it expands into."
+
+        if kind == _EMIT:
+            return typing.cast(str, payload)
+        elif kind == _TYPE:
+            return self._expand_type(payload)
+        elif kind == _PLAIN:
+            return self._expand_plain_type(payload)
+        elif kind == _VALUE:
+            return self.value_to_str(payload)
+        elif kind == _REPR:
+            return repr(payload)
+        else:
+            raise ValueError(f"expected: work item kind to expand; got: {kind}")
+
+    def _expand_plain_type(self, data_type: Any) -> str | list[_Item]:
+        "Returns the string representation of a Python type without metadata, or the work items that produce it."
+
         if data_type is Self:
             return "Self"
         elif data_type is LiteralString:
@@ -159,7 +315,7 @@ class TypeFormatter:
 
             context_type = getattr(self.context, fwd_arg, None)
             if context_type is None:
-                return self.python_type_to_str(evaluate_type(fwd_arg, self.context))
+                return [(_TYPE, evaluate_type(fwd_arg, self.context))]
 
             if isinstance(context_type, type) and self.options.type_transform is not None:
                 return self.options.type_transform(context_type)
@@ -177,7 +333,7 @@ class TypeFormatter:
                 # simple type name that is defined in the current context
                 return data_type
 
-            return self.python_type_to_str(evaluate_type(data_type, self.context))
+            return [(_TYPE, evaluate_type(data_type, self.context))]
         elif isinstance(data_type, ParamSpec):
             return data_type.__name__
         elif isinstance(data_type, TypeVar):
@@ -198,18 +354,15 @@ class TypeFormatter:
             elif origin is tuple:  # tuple[T, ...]
                 origin_name = "tuple"
             elif origin is type:  # type[T]
-                args = ", ".join(self.python_type_to_str(t) for t in data_type_args)
-                return f"type[{args}]"
+                origin_name = "type"
             elif origin is Literal:
-                args = ", ".join(self.value_to_str(arg) for arg in data_type_args)
-                return f"Literal[{args}]"
+                return [(_EMIT, "Literal["), (_ARGUMENTS, _Arguments(_VALUE, data_type_args, ", ", "]"))]
             elif is_optional_type(data_type) or is_union_type(data_type):
-                return self.union_to_str(data_type_args)
+                return [(_ARGUMENTS, _Arguments(_TYPE, data_type_args, " | ", ""))]
             else:
                 origin_name = origin.__name__
 
-            args = ", ".join(self.python_type_to_str(t) for t in data_type_args)
-            return f"{origin_name}[{args}]"
+            return [(_EMIT, f"{origin_name}["), (_ARGUMENTS, _Arguments(_TYPE, data_type_args, ", ", "]"))]
 
         if not isinstance(data_type, type):
             raise ValueError(f"not a type, generic type, or type-like object: {data_type} (of type {type(data_type)})")
@@ -219,8 +372,8 @@ class TypeFormatter:
         else:
             return data_type.__name__
 
-    def python_type_to_str(self, data_type: Any) -> str:
-        "Returns the string representation of a Python type."
+    def _expand_type(self, data_type: Any) -> str | list[_Item]:
+        "Returns the string representation of a Python type, or the work items that produce it."
 
         if data_type is None or data_type is type(None):
             return "None"
@@ -230,13 +383,13 @@ class TypeFormatter:
             return "Any"
         elif isinstance(data_type, list):  # e.g. in `Callable[[bool, int], str]`
             callable_args = typing.cast(list[Any], data_type)  # type: ignore[redundant-cast]
-            items = ", ".join(self.python_type_to_str(item) for item in callable_args)
-            return f"[{items}]"
+            return [(_EMIT, "["), (_ARGUMENTS, _Arguments(_TYPE, callable_args, ", ", "]"))]
 
         # use compact name for alias types
-        name = self.options.auxiliary_types.get(data_type)
-        if name is not None:
-            return name
+        if self.options.auxiliary_types:
+            name = self.options.auxiliary_types.get(data_type)
+            if name is not None:
+                return name
 
         meta_data = getattr(data_type, "__metadata__", None)
         if meta_data is not None:
@@ -257,12 +410,11 @@ class TypeFormatter:
 
                 if meta_set.issuperset(auxiliary_meta_tuple):
                     # type is an auxiliary type with extra annotations
-                    auxiliary_args = ", ".join(repr(m) for m in meta_tuple if m not in auxiliary_meta_tuple)
-                    return f"Annotated[{auxiliary_name}, {auxiliary_args}]"
+                    auxiliary_args = [m for m in meta_tuple if m not in auxiliary_meta_tuple]
+                    return [(_EMIT, f"Annotated[{auxiliary_name}, "), (_ARGUMENTS, _Arguments(_REPR, auxiliary_args, ", ", "]"))]
 
             # type is an annotated type
-            args = ", ".join(repr(m) for m in meta_tuple)
-            return f"Annotated[{self.plain_type_to_str(arg)}, {args}]"
+            return [(_EMIT, "Annotated["), (_PLAIN, arg), (_EMIT, ", "), (_ARGUMENTS, _Arguments(_REPR, meta_tuple, ", ", "]"))]
         else:
             # type is a regular type
-            return self.plain_type_to_str(data_type)
+            return self._expand_plain_type(data_type)
@@ -6,109 +6,40 @@ Copyright 2024-2026, Levente Hunyadi
 :see: https://github.com/hunyadi/markdown_doc
 """
 
+import asyncio
+import collections
+import contextlib
 import enum
+import functools
+import importlib
 import inspect
 import logging
 import os
+import posixpath
 import re
 import sys
+import threading
 import typing
-from dataclasses import dataclass, field, is_dataclass
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field, is_dataclass, replace
 from enum import Enum
 from pathlib import Path
 from types import FunctionType, MethodType, ModuleType
-from typing import Any, Callable, TypeGuard
+from typing import Annotated, Any, AsyncGenerator, AsyncIterator, Callable, ForwardRef, Iterable, Iterator, Literal, TypeGuard
 
-from docsource.docstring import DocstringSeeAlso, check_docstring, parse_type
-from docsource.enumeration import enum_labels
+from docsource.docstring import Docstring, DocstringSeeAlso, check_docstring, parse_type
 from docsource.inspection import get_module_classes, get_module_functions, is_type_enum
 
-from .formatter import TypeFormatter, TypeFormatterOptions
-from .resolver import ClassResolver, MemberFunctionResolver, MemberResolver, ModuleFunctionResolver, ModuleResolver, Resolver
-
-
-def replace_links(text: str) -> str:
-    """
-    Replaces plain text URLs with Markdown links.
-
-    :param text: String with possible occurrences of URLs.
-    :returns: String with replacements made.
-    """
-
-    regex = re.compile(
-        r"""
-        \b
-        (                                  # Capture 1: entire matched URL
-        (?:
-            https?:                        # URL protocol and colon
-            (?:
-            /{1,3}                         # 1-3 slashes
-            |                              #   or
-            [a-z0-9%]                      # Single letter or digit or '%'
-                                           # (Trying not to match e.g. "URI::Escape")
-            )
-            |                              #   or
-                                           # looks like domain name followed by a slash:
-            [a-z0-9.\-]+[.]
-            (?:com|net|org|edu|gov|mil|aero|asia|biz|cat|coop|info|int|jobs|mobi|museum|name|post|pro|tel|travel|xxx|
-            ac|ad|ae|af|ag|ai|al|am|an|ao|aq|ar|as|at|au|aw|ax|az|ba|bb|bd|be|bf|bg|bh|bi|bj|bm|bn|bo|br|bs|bt|bv|bw|
-            by|bz|ca|cc|cd|cf|cg|ch|ci|ck|cl|cm|cn|co|cr|cs|cu|cv|cx|cy|cz|dd|de|dj|dk|dm|do|dz|ec|ee|eg|eh|er|es|et|
-            eu|fi|fj|fk|fm|fo|fr|ga|gb|gd|ge|gf|gg|gh|gi|gl|gm|gn|gp|gq|gr|gs|gt|gu|gw|gy|hk|hm|hn|hr|ht|hu|id|ie|il|
-            im|in|io|iq|ir|is|it|je|jm|jo|jp|ke|kg|kh|ki|km|kn|kp|kr|kw|ky|kz|la|lb|lc|li|lk|lr|ls|lt|lu|lv|ly|ma|mc|
-            md|me|mg|mh|mk|ml|mm|mn|mo|mp|mq|mr|ms|mt|mu|mv|mw|mx|my|mz|na|nc|ne|nf|ng|ni|nl|no|np|nr|nu|nz|om|pa|pe|
-            pf|pg|ph|pk|pl|pm|pn|pr|ps|pt|pw|py|qa|re|ro|rs|ru|rw|sa|sb|sc|sd|se|sg|sh|si|sj|sk|sl|sm|sn|so|sr|ss|st|
-            su|sv|sx|sy|sz|tc|td|tf|tg|th|tj|tk|tl|tm|tn|to|tp|tr|tt|tv|tw|tz|ua|ug|uk|us|uy|uz|va|vc|ve|vg|vi|vn|vu|
-            wf|ws|ye|yt|yu|za|zm|zw)
-            /
-        )
-        [^\s()<>{}\[\]]*                   # 0+ non-space, non-()<>{}[]
-        (?:                                # 0+ times:
-            \(                             #   Balanced parens containing:
-            [^\s()]*                       #   0+ non-paren chars
-            (?:                            #   0+ times:
-            \([^\s()]*\)                   #     Inner balanced parens containing 0+ non-paren chars
-            [^\s()]*                       #     0+ non-paren chars
-            )*
-            \)
-            [^\s()<>{}\[\]]*               # 0+ non-space, non-()<>{}[]
-        )*
-        (?:                                # End with:
-            \(                             #   Balanced parens containing:
-            [^\s()]*                       #   0+ non-paren chars
-            (?:                            #   0+ times:
-            \([^\s()]*\)                   #     Inner balanced parens containing 0+ non-paren chars
-            [^\s()]*                       #     0+ non-paren chars
-            )*
-            \)
-            |                              #   or
-            [^\s`!()\[\]{};:'".,<>?«»“”‘’] # not a space or one of these punctuation chars
-        )
-        |					# OR, the following to match naked domains:
-        (?:
-            (?<!@)			# not preceded by a @, avoid matching foo@_gmail.com_
-            [a-z0-9]+
-            (?:[.\-][a-z0-9]+)*
-            [.]
-            (?:com|net|org|edu|gov|mil|aero|asia|biz|cat|coop|info|int|jobs|mobi|museum|name|post|pro|tel|travel|xxx|
-            ac|ad|ae|af|ag|ai|al|am|an|ao|aq|ar|as|at|au|aw|ax|az|ba|bb|bd|be|bf|bg|bh|bi|bj|bm|bn|bo|br|bs|bt|bv|bw|
-            by|bz|ca|cc|cd|cf|cg|ch|ci|ck|cl|cm|cn|co|cr|cs|cu|cv|cx|cy|cz|dd|de|dj|dk|dm|do|dz|ec|ee|eg|eh|er|es|et|
-            eu|fi|fj|fk|fm|fo|fr|ga|gb|gd|ge|gf|gg|gh|gi|gl|gm|gn|gp|gq|gr|gs|gt|gu|gw|gy|hk|hm|hn|hr|ht|hu|id|ie|il|
-            im|in|io|iq|ir|is|it|je|jm|jo|jp|ke|kg|kh|ki|km|kn|kp|kr|kw|ky|kz|la|lb|lc|li|lk|lr|ls|lt|lu|lv|ly|ma|mc|
-            md|me|mg|mh|mk|ml|mm|mn|mo|mp|mq|mr|ms|mt|mu|mv|mw|mx|my|mz|na|nc|ne|nf|ng|ni|nl|no|np|nr|nu|nz|om|pa|pe|
-            pf|pg|ph|pk|pl|pm|pn|pr|ps|pt|pw|py|qa|re|ro|rs|ru|rw|sa|sb|sc|sd|se|sg|sh|si|sj|sk|sl|sm|sn|so|sr|ss|st|
-            su|sv|sx|sy|sz|tc|td|tf|tg|th|tj|tk|tl|tm|tn|to|tp|tr|tt|tv|tw|tz|ua|ug|uk|us|uy|uz|va|vc|ve|vg|vi|vn|vu|
-            wf|ws|ye|yt|yu|za|zm|zw)
-            \b
-            /?
-            (?!@)			# not succeeded by a @, avoid matching "foo.na" in "foo.na@example.com"
-        )
-        )
-        """,
-        re.VERBOSE | re.UNICODE,
-    )
-    text, count = regex.subn(r"[\1](\1)", text)
-    logging.debug("%d URL(s) found", count)
-    return text
+from .cache import CacheStats, MemoryCache, lru_cache_stats
+from .dependency import DependencyGraph
+from .formatter import TypeFormatter, TypeFormatterOptions, evaluate_type, get_signature
+from .inventory import Inventory, InventoryEntry, InventoryItem, write_inventory
+from .links import replace_links
+from .memory import MemoryProfiler
+from .resolver import ClassResolver, MemberFunctionResolver, MemberResolver, ModuleFunctionResolver, ModuleResolver, Resolver, ResolverError
+from .search import SearchItem, summary_text, write_search_index
+from .source import SourceCache
 
 
 def quote_value(value: Any) -> str:
@@ -123,11 +54,37 @@ def quote_value(value: Any) -> str:
         return f"```{s}```"
 
 
+_SAFE_NAME_REGEX = re.compile(r"(\b_+|_+\b)")
+
+# approximate memory held by an object of a doc-string component (e.g. a parameter), excluding its text
+_DOCSTRING_PART_SIZE = 200
+
+
+def _docstring_size(docstring: Docstring) -> int:
+    "Approximate memory held by a parsed doc-string, counting the text it holds but not the types it refers to."
+
+    size = _DOCSTRING_PART_SIZE + sys.getsizeof(docstring.short_description) + sys.getsizeof(docstring.long_description)
+    for param in docstring.params.values():
+        size += _DOCSTRING_PART_SIZE + sys.getsizeof(param.description)
+    if docstring.returns is not None:
+        size += _DOCSTRING_PART_SIZE + sys.getsizeof(docstring.returns.description)
+    for raises in docstring.raises.values():
+        size += _DOCSTRING_PART_SIZE + sys.getsizeof(raises.description)
+    for see_also in docstring.see_also:
+        size += _DOCSTRING_PART_SIZE + sys.getsizeof(see_also.text)
+    return size
+
+
+# names, anchors and relative paths are short strings shared by all generators, and looked up far too often to share
+# the lock of the memory budget, which is why they are bounded by a number of entries instead
+_NAME_CACHE_SIZE = 65536
+
+
+@functools.lru_cache(maxsize=_NAME_CACHE_SIZE)
 def safe_name(name: str) -> str:
     "Object name with those characters escaped that are allowed in Python identifiers but have special meaning in Markdown."
 
-    regex = re.compile(r"(\b_+|_+\b)")
-    return regex.sub(lambda m: m.group(0).replace("_", "\\_"), name)
+    return _SAFE_NAME_REGEX.sub(lambda m: m.group(0).replace("_", "\\_"), name)
 
 
 def _safe_id_part(part: str) -> str:
@@ -139,6 +96,7 @@ def _safe_id_part(part: str) -> str:
         return part
 
 
+@functools.lru_cache(maxsize=_NAME_CACHE_SIZE)
 def safe_id(name: str) -> str:
     """
     Object identifier that qualifies as a Markdown anchor.
@@ -148,29 +106,35 @@ def safe_id(name: str) -> str:
     Usually, the identifier matches the class or function name. However, objects with private visibility have a name
     that begins with `_`, and the name of special methods starts with `__`, both of which confuses many Markdown
     formatting engines. We take a safe approach to prefix these with `p` and `sp`, respectively.
+
+    Identifiers are memoized by qualified name.
     """
 
     parts = name.split(".")
     return ".".join(_safe_id_part(part) for part in parts)
 
 
+@functools.lru_cache(maxsize=_NAME_CACHE_SIZE)
 def module_path(target: str, source: str) -> str:
     """
     Returns a relative path from source to target.
 
+    Paths are computed on the components of the qualified names, and memoized for each pair of source and target.
+
     :param target: The fully qualified name of the module to link to (in dot notation).
     :param source: The fully qualified name of the module to link from (in dot notation).
     """
 
-    target_path = Path("/" + target.replace(".", "/") + ".md")
-    source_path = Path("/" + source.replace(".", "/") + ".md")
-    target_dir = target_path.parent
-    source_dir = source_path.parent
-    if sys.version_info >= (3, 12):
-        relative_path = Path(target_dir).relative_to(source_dir, walk_up=True)
-    else:
-        relative_path = Path(os.path.relpath(target_dir, start=source_dir))
-    return (relative_path / target_path.name).as_posix()
+    *target_dir, target_name = target.split(".")
+    *source_dir, _ = source.split(".")
+    common = 0
+    for target_part, source_part in zip(target_dir, source_dir, strict=False):
+        if target_part != source_part:
+            break
+        common += 1
+    parts = [".."] * (len(source_dir) - common) + target_dir[common:]
+    parts.append(f"{target_name}.md")
+    return "/".join(parts)
 
 
 CallableType = Callable[..., Any]
@@ -182,6 +146,66 @@ def is_function(fn: Any) -> TypeGuard[CallableType]:
     return isinstance(fn, FunctionType) or isinstance(fn, MethodType) or isinstance(fn, classmethod) or isinstance(fn, staticmethod)
 
 
+def _unwrap_function(cls: type, member: Any) -> CallableType | None:
+    """
+    Returns the function object for a class member as found in the class dictionary, or `None` if it is not a function.
+
+    Functions with `@classmethod` are bound to the class, and functions with `@staticmethod` are unwrapped, which is
+    what attribute lookup would return, but without invoking the descriptor protocol.
+    """
+
+    if isinstance(member, classmethod):
+        func: Any = member.__func__
+        return MethodType(func, cls) if isinstance(func, FunctionType) else None
+    elif isinstance(member, staticmethod):
+        func = member.__func__
+        return func if isinstance(func, FunctionType) or isinstance(func, MethodType) else None
+    elif isinstance(member, FunctionType) or isinstance(member, MethodType):
+        return member
+    else:
+        return None
+
+
+def class_functions(cls: type) -> list[tuple[str, CallableType]]:
+    """
+    Returns the member functions defined (or overridden) in a class, in order of definition.
+
+    Unlike `inspect.getmembers`, inherited members are not traversed, and attributes (e.g. properties) are not evaluated.
+
+    :param cls: The class whose member functions to return.
+    :returns: Pairs of function name and function object.
+    """
+
+    functions: list[tuple[str, CallableType]] = []
+    for name, member in cls.__dict__.items():
+        func = _unwrap_function(cls, member)
+        if func is not None:
+            functions.append((name, func))
+    return functions
+
+
+def _is_imported(module_name: str) -> bool:
+    "True if a module has been imported, and bound to its parent package once the import completed."
+
+    module = sys.modules.get(module_name)
+    if module is None:
+        return False
+    parent_name, _, child_name = module_name.rpartition(".")
+    return not parent_name or getattr(sys.modules.get(parent_name), child_name, None) is module
+
+
+def _weak_value(obj: Any) -> Any:
+    "A weak reference to a module, class or function, or the object itself otherwise (e.g. an inventory entry or a constant)."
+
+    if isinstance(obj, MethodType):
+        # a bound method is created on attribute lookup, and would be collected right away
+        return weakref.WeakMethod(obj)
+    elif isinstance(obj, (ModuleType, type, FunctionType)):
+        return weakref.ref(obj)
+    else:
+        return obj
+
+
 @enum.unique
 class ObjectKind(enum.Enum):
     "Represents a group of Python types, e.g. regular classes, data-classes, enumerations, module-level functions, etc."
@@ -220,46 +244,115 @@ def object_kind(cls: ObjectType | ModuleType) -> ObjectKind:
         return ObjectKind.CLASS
 
 
-@dataclass
+@enum.unique
+class PartitionStrategy(enum.Enum):
+    "Determines how to split module contents across Markdown files."
+
+    SINGLE = "single"
+    "Create a single Markdown file with all classes, enums and functions in a module."
+
+    BY_KIND = "by_kind"
+    "Create separate Markdown files for classes, enums and functions in each module."
+
+    BY_OBJECT = "by_object"
+    "Create a Markdown file for each class and enum, a Markdown file for module-level functions, and an index page for each module."
+
+
+_FUNCTIONS_PARTITION = "functions"
+
+# partitions of a module with `PartitionStrategy.BY_KIND` in the order they are generated, with their title in navigation
+_KIND_TITLES = {
+    ObjectKind.DATACLASS: "Data-classes",
+    ObjectKind.ENUM: "Enumerations",
+    ObjectKind.CLASS: "Classes",
+    ObjectKind.FUNCTION: "Functions",
+}
+
+
+def object_partition(obj: ObjectType | ModuleType, strategy: PartitionStrategy) -> str | None:
+    """
+    Identifies the group of types that an object is exported with, or `None` if the object is exported in the main document of its module.
+
+    :param obj: A module, class or function.
+    :param strategy: Determines how module contents are split across Markdown files.
+    """
+
+    if strategy is PartitionStrategy.SINGLE:
+        return None
+
+    if not isinstance(obj, (ModuleType, type)):
+        # member functions are exported with the class they are defined in
+        owner, sep, _ = obj.__qualname__.partition(".")
+        if sep and "<locals>" not in obj.__qualname__:
+            cls = getattr(sys.modules.get(obj.__module__), owner, None)
+            if isinstance(cls, type):
+                obj = cls
+
+    match strategy:
+        case PartitionStrategy.BY_KIND:
+            return object_kind(obj).value
+        case PartitionStrategy.BY_OBJECT:
+            if isinstance(obj, ModuleType):
+                return None
+            elif isinstance(obj, type):
+                return obj.__name__
+            else:
+                return _FUNCTIONS_PARTITION
+
+
+def _context_name(module_name: str, partition: str | None) -> str:
+    "Name of the document that holds a group of types exported as a unit."
+
+    if partition is not None:
+        return f"{module_name}-{partition}"
+    else:
+        return module_name
+
+
+@dataclass(frozen=True)
 class Context:
     """
     Represents a group of types that are exported as a unit.
 
     :param module: The module in which the types are defined.
     :param partition: Identifies the group of types.
+    :param strategy: Determines how module contents are split across Markdown files.
+    :param _paths: Memoizes relative paths to other documents by module name and partition, and thereby records the documents linked to.
     """
 
     module: ModuleType
-    partition: ObjectKind | None
+    partition: str | None
+    strategy: PartitionStrategy = PartitionStrategy.SINGLE
+    _paths: dict[tuple[str, str | None], str] = field(default_factory=dict[tuple[str, str | None], str], init=False, repr=False, compare=False)
 
     def name(self) -> str:
-        if self.partition is not None:
-            return f"{self.module.__name__}-{self.partition.value}"
-        else:
-            return self.module.__name__
+        return _context_name(self.module.__name__, self.partition)
 
     def matches(self, cls: ObjectType) -> bool:
         if cls.__module__ != self.module.__name__:
             return False
-        if self.partition is None:
-            return True
 
-        return self.partition is object_kind(cls)
+        return self.partition == object_partition(cls, self.strategy)
 
     def path_to(self, cls: ObjectType | ModuleType) -> str:
-        if self.partition is not None:
-            kind = object_kind(cls)
-        else:
-            kind = None
+        partition = object_partition(cls, self.strategy)
 
         if isinstance(cls, ModuleType):
-            module = cls
+            module_name = cls.__name__
         else:
-            module = sys.modules[cls.__module__]
+            module_name = cls.__module__
+
+        key = (module_name, partition)
+        path = self._paths.get(key)
+        if path is None:
+            path = module_path(_context_name(module_name, partition), self.name())
+            self._paths[key] = path
+        return path
 
-        target = Context(module, kind).name()
-        source = self.name()
-        return module_path(target, source)
+    def linked_modules(self) -> set[str]:
+        "Qualified names of modules whose documents have been linked to from this context."
+
+        return {module_name for module_name, _ in list(self._paths)}
 
 
 def module_anchor(module: ModuleType) -> str:
@@ -329,11 +422,13 @@ def decorator_link(fn: CallableType, context: Context) -> str:
     return _class_link(fn, context, text=f"@{fn.__name__}")
 
 
+_LABELED_REF_REGEX = re.compile(r"^[^<>]+<([^<>]+)>$")
+
+
 def _extract_ref(text: str) -> str:
     "Extracts a fully-qualified reference from a reference string possibly with a custom label included."
 
-    regex = re.compile(r"^[^<>]+<([^<>]+)>$")
-    if (m := regex.match(text)) is not None:
+    if (m := _LABELED_REF_REGEX.match(text)) is not None:
         # :class:`HTTPAdapter <requests.adapters.HTTPAdapter>`
         return m.group(1)
     else:
@@ -353,13 +448,294 @@ def is_documented(cls: ObjectType) -> bool:
     return parse_type(cls).full_description is not None
 
 
+@dataclass
+class MarkdownDocument:
+    """
+    A Markdown document generated for (a part of) a Python module.
+
+    :param path: Path of the document relative to the output directory (in POSIX notation).
+    :param text: Markdown text of the document.
+    :param objects: Modules, classes and functions documented, with the anchor that links point to.
+    :param symbols: Modules, classes, functions, enumeration members and data-class properties to publish in a search index.
+    :param title: Title of the document in navigation, e.g. the module name or the kind of objects in a partition.
+    """
+
+    path: str
+    text: str
+    objects: list[InventoryItem] = field(default_factory=list[InventoryItem])
+    symbols: list[SearchItem] = field(default_factory=list[SearchItem])
+    title: str = ""
+
+    def write(self, target: Path) -> None:
+        "Writes the document to a file in the target directory."
+
+        path = target / Path(self.path)
+        os.makedirs(path.parent, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.text)
+
+
+@dataclass
+class _Page:
+    """
+    A Markdown file generated for (a part of) a module.
+
+    :param title: Title of the page in navigation.
+    :param path: Path of the Markdown file relative to the output directory (in POSIX notation).
+    """
+
+    title: str
+    path: str
+
+
+@dataclass
+class _Node:
+    """
+    A module or package in the hierarchy of modules documented.
+
+    :param name: Fully-qualified name of the module or package.
+    :param pages: Markdown files generated for the module, in the order they were rendered.
+    :param objects: Classes and functions documented in the module.
+    :param children: Sub-modules and sub-packages by their unqualified name.
+    """
+
+    name: str
+    pages: list[_Page] = field(default_factory=list[_Page])
+    objects: list[InventoryItem] = field(default_factory=list[InventoryItem])
+    children: dict[str, "_Node"] = field(default_factory=dict[str, "_Node"])
+
+    @property
+    def short_name(self) -> str:
+        return self.name.rsplit(".", 1)[-1]
+
+    @property
+    def index_path(self) -> str:
+        "Path of the index page generated for a package."
+
+        return f"{self.name.replace('.', '/')}/README.md"
+
+    def link_path(self) -> str | None:
+        "Path of the page that a link to the module or package points to."
+
+        if self.pages:
+            return self.pages[0].path
+        elif self.children:
+            return self.index_path
+        else:
+            return None
+
+
+class MarkdownNavigation:
+    """
+    Builds navigation files from the Markdown files generated, without reading them back.
+
+    A GitBook-style `SUMMARY.md` is written to the output directory, listing all modules hierarchically with the pages
+    generated for each, and a `README.md` index page is written to the directory of each package, listing sub-packages
+    and modules with the classes and functions they define. Links point to the pages and anchors that documents were
+    rendered with, which reflect the partition strategy and the anchor style in effect.
+    """
+
+    root: _Node
+
+    def __init__(self) -> None:
+        self.root = _Node("")
+
+    def _node(self, module_name: str) -> _Node:
+        node = self.root
+        parts = module_name.split(".")
+        for count, part in enumerate(parts, start=1):
+            child = node.children.get(part)
+            if child is None:
+                child = _Node(".".join(parts[:count]))
+                node.children[part] = child
+            node = child
+        return node
+
+    def add(self, module_name: str, document: MarkdownDocument) -> None:
+        """
+        Registers a Markdown document generated for a module.
+
+        :param module_name: Fully-qualified name of the module documented.
+        :param document: The Markdown document generated.
+        """
+
+        node = self._node(module_name)
+        node.pages.append(_Page(document.title, document.path))
+        node.objects.extend(item for item in document.objects if item.kind in ("class", "function"))
+
+    def _summary_lines(self, node: _Node, depth: int, lines: list[str]) -> None:
+        for name in sorted(node.children):
+            child = node.children[name]
+            indent = "  " * depth
+            link_path = child.link_path()
+            if link_path is not None:
+                lines.append(f"{indent}* [{safe_name(child.short_name)}]({link_path})")
+            for page in child.pages[1:]:
+                # further pages of a module partitioned across several files
+                lines.append(f"{indent}  * [{safe_name(page.title)}]({page.path})")
+            if child.children and child.pages:
+                # the first page of a package links to its module documentation, the index page lists its contents
+                lines.append(f"{indent}  * [Contents]({child.index_path})")
+            self._summary_lines(child, depth + 1, lines)
+
+    def summary(self) -> str:
+        "Generates the text of `SUMMARY.md`."
+
+        lines = ["# Summary", ""]
+        self._summary_lines(self.root, 0, lines)
+        return "\n".join(lines) + "\n"
+
+    def index(self, node: _Node) -> str:
+        "Generates the text of the `README.md` index page of a package."
+
+        directory = posixpath.dirname(node.index_path)
+        lines = [f"# {safe_name(node.name)}", ""]
+
+        if node.pages:
+            lines.append(f"Package documentation: [{safe_name(node.name)}]({posixpath.relpath(node.pages[0].path, directory)})")
+            lines.append("")
+
+        for name in sorted(node.children):
+            child = node.children[name]
+            link_path = child.link_path()
+            if link_path is None:
+                continue
+
+            lines.append(f"* [{safe_name(child.short_name)}]({posixpath.relpath(link_path, directory)})")
+            for item in sorted(child.objects, key=lambda item: item.name):
+                title = item.name.rsplit(".", 1)[-1]
+                lines.append(f"  * [{safe_name(title)}]({posixpath.relpath(item.path, directory)}#{item.anchor})")
+
+        return "\n".join(lines) + "\n"
+
+    def _packages(self, node: _Node) -> list[_Node]:
+        packages: list[_Node] = []
+        for name in sorted(node.children):
+            child = node.children[name]
+            if child.children:
+                packages.append(child)
+                packages.extend(self._packages(child))
+        return packages
+
+    def files(self) -> dict[str, str]:
+        "Maps the paths of `SUMMARY.md` and the index pages of packages (relative to the output directory) to their text."
+
+        files = {"SUMMARY.md": self.summary()}
+        for package in self._packages(self.root):
+            files[package.index_path] = self.index(package)
+        return files
+
+    def write(self, target: Path) -> None:
+        """
+        Writes `SUMMARY.md` and the index pages of packages to the output directory.
+
+        :param target: Directory that Markdown files have been written to.
+        """
+
+        os.makedirs(target, exist_ok=True)
+        for file_path, text in self.files().items():
+            path = target / Path(file_path)
+            os.makedirs(path.parent, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+
+
+_MODULE_REF_REGEX = re.compile(r":mod:`([^`]+)`")
+_CLASS_REF_REGEX = re.compile(r":class:`([^`]+)`")
+_EXCEPTION_REF_REGEX = re.compile(r":exc:`([^`]+)`")
+_DECORATOR_REF_REGEX = re.compile(r":deco:`([^`]+)`")
+_FUNCTION_REF_REGEX = re.compile(r":func:`([^`]+)`")
+_METHOD_REF_REGEX = re.compile(r":meth:`([^`]+)`")
+_REF_REGEXES = {
+    "mod": _MODULE_REF_REGEX,
+    "class": _CLASS_REF_REGEX,
+    "exc": _EXCEPTION_REF_REGEX,
+    "deco": _DECORATOR_REF_REGEX,
+    "func": _FUNCTION_REF_REGEX,
+    "meth": _METHOD_REF_REGEX,
+}
+_ROLE_REGEX = re.compile(rf":(?:{'|'.join(_REF_REGEXES)}):`")
+
+
+class AnchorRegistry:
+    """
+    Keeps track of anchors emitted in a Markdown document to detect collisions in a single pass.
+
+    Distinct objects may map to the same anchor, e.g. a private function `_f` and a public function `p_f`. Duplicate
+    anchors break links silently, which is why they are reported.
+
+    Symbols to publish in a search index are recorded along with the anchor they are documented under.
+
+    :param document: The name of the document the anchors belong to.
+    """
+
+    document: str
+    anchors: dict[str, str]
+    collisions: list[tuple[str, str, str]]
+    objects: list[tuple[str, str, str]]
+    symbols: list[tuple[str, str, str, str]]
+
+    def __init__(self, document: str) -> None:
+        self.document = document
+        self.anchors = {}
+        self.collisions = []
+        self.objects = []
+        self.symbols = []
+
+    def register(self, anchor: str, name: str, kind: str | None = None) -> None:
+        """
+        Records an anchor, and reports a collision if the anchor has already been emitted for another object.
+
+        :param anchor: The anchor emitted.
+        :param name: The qualified name of the object the anchor identifies.
+        :param kind: Kind of object (e.g. `class` or `function`) if the anchor is to be published in a link inventory.
+        """
+
+        existing = self.anchors.setdefault(anchor, name)
+        if existing != name:
+            self.collisions.append((anchor, existing, name))
+            logging.warning("duplicate anchor `%s` in document `%s` for `%s` and `%s`", anchor, self.document, existing, name)
+        elif kind is not None:
+            self.objects.append((name, kind, anchor))
+
+    def merge(self, other: "AnchorRegistry") -> None:
+        """
+        Appends the anchors and symbols recorded in another registry, as if they had been recorded in this registry.
+
+        Used when parts of a document are rendered in parallel, each with a registry of its own.
+        """
+
+        for anchor, name in other.anchors.items():
+            existing = self.anchors.setdefault(anchor, name)
+            if existing != name:
+                self.collisions.append((anchor, existing, name))
+                logging.warning("duplicate anchor `%s` in document `%s` for `%s` and `%s`", anchor, self.document, existing, name)
+        self.collisions.extend(other.collisions)
+        self.objects.extend(item for item in other.objects if self.anchors[item[2]] == item[0])
+        self.symbols.extend(other.symbols)
+
+    def add_symbol(self, name: str, kind: str, anchor: str, description: str | None) -> None:
+        """
+        Records a symbol to publish in a search index.
+
+        :param name: The qualified name of the symbol, e.g. a class, a function or an enumeration member.
+        :param kind: Kind of symbol, e.g. `class`, `function` or `member`.
+        :param anchor: The anchor the symbol is documented under, e.g. the anchor of the enclosing class for members.
+        :param description: Short description of the symbol from its doc-string.
+        """
+
+        self.symbols.append((name, kind, anchor, summary_text(description)))
+
+
 class MarkdownWriter:
     "Writes lines to a Markdown document."
 
     lines: list[str]
+    anchors: AnchorRegistry
 
-    def __init__(self) -> None:
+    def __init__(self, anchors: AnchorRegistry | None = None) -> None:
         self.lines = []
+        self.anchors = anchors if anchors is not None else AnchorRegistry("")
 
     def __bool__(self) -> bool:
         return len(self.lines) > 0
@@ -384,17 +760,6 @@ class MarkdownAnchorStyle(enum.Enum):
     "GitBook anchor style, with Markdown extension syntax {#...} following heading title text."
 
 
-@enum.unique
-class PartitionStrategy(enum.Enum):
-    "Determines how to split module contents across Markdown files."
-
-    SINGLE = "single"
-    "Create a single Markdown file with all classes, enums and functions in a module."
-
-    BY_KIND = "by_kind"
-    "Create separate Markdown files for classes, enums and functions in each module."
-
-
 @dataclass
 class MarkdownOptions:
     """
@@ -406,6 +771,9 @@ class MarkdownOptions:
     :param include_undocumented: Whether to include classes, functions and methods without a doc-string description.
     :param stdlib_links: Whether to include references for built-in types and types in the Python standard library.
     :param auxiliary_types: Maps each Python type (typically `Annotated[T, ...]`) to a human-readable name.
+    :param inventories: Objects documented elsewhere (e.g. in third-party packages), which links may point to without importing them.
+    :param max_type_args: Maximum number of arguments to show for a generic type, union or `Literal`, eliding the rest.
+    :param max_type_length: Number of characters in a type after which remaining arguments are elided.
     """
 
     anchor_style: MarkdownAnchorStyle = MarkdownAnchorStyle.GITHUB
@@ -414,6 +782,9 @@ class MarkdownOptions:
     include_undocumented: bool = False
     stdlib_links: bool = True
     auxiliary_types: dict[object, str] = field(default_factory=dict[object, str])
+    inventories: list[Inventory] = field(default_factory=list[Inventory])
+    max_type_args: int | None = None
+    max_type_length: int | None = None
 
 
 class ProcessingError(RuntimeError):
@@ -430,27 +801,170 @@ class ProcessingError(RuntimeError):
         self.obj = obj
 
 
+@dataclass
+class ValidationIssue:
+    """
+    A problem found when validating doc-strings and cross-references.
+
+    :param path: Path to the source file in which the object is defined, if known.
+    :param line: Line number of the object definition in the source file, if known.
+    :param name: Qualified name of the module, class or function whose documentation is invalid.
+    :param message: Description of the problem.
+    """
+
+    path: str | None
+    line: int | None
+    name: str
+    message: str
+
+    def __str__(self) -> str:
+        if self.path is None:
+            location = "<unknown>"
+        elif self.line is None:
+            location = self.path
+        else:
+            location = f"{self.path}:{self.line}"
+        return f"{location}: {self.name}: {self.message}"
+
+
+def _error_message(e: Exception) -> str:
+    "Error message of an exception, including the exception that caused it."
+
+    if e.__cause__ is not None:
+        return f"{e}: {e.__cause__}"
+    else:
+        return str(e)
+
+
+def _type_key(data_type: Any) -> Any:
+    """
+    A key that tells apart types that compare equal but are written differently, e.g. `int | str` and `str | int`.
+
+    Classes are held by weak reference, such that cached text does not keep the classes of a reloaded module alive.
+    """
+
+    if isinstance(data_type, list):  # argument list of `Callable`
+        return tuple(_type_key(item) for item in data_type)
+    args = typing.get_args(data_type)
+    if args:
+        return (type(data_type), _type_key(typing.get_origin(data_type)), tuple(_type_key(arg) for arg in args))
+    elif isinstance(data_type, type):
+        return weakref.ref(data_type)
+    else:
+        # tells apart values that compare equal, e.g. `Literal[1]` and `Literal[True]`
+        return (type(data_type), data_type)
+
+
 class MarkdownTypeFormatter:
     "Generates a safe Markdown string from a Python type."
 
+    module: ModuleType
     formatter: TypeFormatter
+    cache: "MemoryCache[ModuleType, str] | None"
+    cache_key: Any
 
-    def __init__(self, module: ModuleType, type_transform: Callable[[type], str], auxiliary_types: dict[object, str]) -> None:
+    def __init__(
+        self,
+        module: ModuleType,
+        type_transform: Callable[[type], str],
+        options: MarkdownOptions,
+        *,
+        cache: "MemoryCache[ModuleType, str] | None" = None,
+        cache_key: Any = None,
+    ) -> None:
         """
         Creates a type formatter.
 
         :param module: The module in whose context forward references are evaluated.
         :param type_transform: Transformation to apply to types before a string is emitted, e.g. to create a link in a documentation.
+        :param options: Options for generating Markdown output.
+        :param cache: If given, formatted types are cached per module.
+        :param cache_key: Identifies the type transformation in the cache, e.g. the document that links point from.
         """
 
+        self.module = module
         self.formatter = TypeFormatter(
-            context=module, options=TypeFormatterOptions(type_transform=type_transform, value_transform=quote_value, auxiliary_types=auxiliary_types)
+            context=module,
+            options=TypeFormatterOptions(
+                type_transform=type_transform,
+                value_transform=quote_value,
+                auxiliary_types=options.auxiliary_types,
+                max_args=options.max_type_args,
+                max_length=options.max_type_length,
+            ),
         )
+        self.cache = cache
+        self.cache_key = cache_key
+
+    def _type_to_markdown(self, data_type: Any) -> str:
+        return self.formatter.python_type_to_str(data_type).replace("[[", "[&#x200B;[").replace("]]", "]&#x200B;]")
 
     def type_to_markdown(self, data_type: Any) -> str:
         "Emits a safe Markdown string for a data type."
 
-        return self.formatter.python_type_to_str(data_type).replace("[[", "[&#x200B;[").replace("]]", "]&#x200B;]")
+        if self.cache is not None:
+            key = (_type_key(data_type), self.cache_key)
+            try:
+                hash(key)
+            except TypeError:  # e.g. `Annotated` with metadata that is not hashable
+                pass
+            else:
+                return self.cache.get_or_compute(self.module, lambda: self._type_to_markdown(data_type), key)
+        return self._type_to_markdown(data_type)
+
+
+class _OutputWriter:
+    """
+    Writes Markdown documents to a target directory, and collects objects and symbols across documents for writing the
+    link inventory, the search index and navigation files at the end.
+
+    Documents may be written from several threads and in any order of modules. Objects, symbols and navigation entries
+    are collected in the order of module names, such that the files that span all documents are the same whichever
+    way documents are generated.
+
+    :param target: Directory to write Markdown files to.
+    :param module_names: Fully-qualified names of the modules documented, in the order of collection.
+    """
+
+    target: Path
+    module_names: list[str]
+    documents: dict[str, list[MarkdownDocument]]
+    lock: threading.Lock
+
+    def __init__(self, target: Path, module_names: list[str]) -> None:
+        self.target = target
+        self.module_names = module_names
+        self.documents = {}
+        self.lock = threading.Lock()
+
+    def write(self, module_name: str, documents: list[MarkdownDocument]) -> None:
+        "Writes the documents generated for a module."
+
+        for document in documents:
+            document.write(self.target)
+
+        # the text of a document is not needed once written
+        with self.lock:
+            self.documents[module_name] = [replace(document, text="") for document in documents]
+
+    def finish(self, *, inventory_file: Path | None, search_index_file: Path | None, navigation: bool) -> None:
+        "Writes the files that span all documents."
+
+        objects: list[InventoryItem] = []
+        symbols: list[SearchItem] = []
+        nav = MarkdownNavigation()
+        for module_name in self.module_names:
+            for document in self.documents.get(module_name, []):
+                objects.extend(document.objects)
+                symbols.extend(document.symbols)
+                nav.add(module_name, document)
+
+        if navigation:
+            nav.write(self.target)
+        if inventory_file is not None:
+            write_inventory(objects, inventory_file)
+        if search_index_file is not None:
+            write_search_index(symbols, search_index_file)
 
 
 class MarkdownGenerator:
@@ -459,6 +973,16 @@ class MarkdownGenerator:
     modules: list[ModuleType]
     options: MarkdownOptions
     predicate: Callable[[ObjectType], bool] | None
+    batch: set[str]
+    _sources: SourceCache
+    _contexts: dict[tuple[str, str | None], Context]
+    _functions: MemoryCache[type, list[str]]
+    _docstrings: MemoryCache[ObjectType | ModuleType, Docstring]
+    _references: MemoryCache[ModuleType | type, Any]
+    _texts: MemoryCache[str, str]
+    _scoped_texts: MemoryCache[ModuleType | type, str]
+    _types: MemoryCache[ModuleType, str]
+    _executor: ThreadPoolExecutor | None
 
     def __init__(
         self,
@@ -466,17 +990,31 @@ class MarkdownGenerator:
         *,
         options: MarkdownOptions | None = None,
         predicate: Callable[[ObjectType], bool] | None = None,
+        batch: Iterable[str] | None = None,
     ) -> None:
         """
         Instantiates a Markdown generator object.
 
         :param options: Options for generating Markdown output.
         :param predicate: If given, only those classes and functions are processed for which the predicate returns `True`.
+        :param batch: Qualified names of all modules in the exported batch, which links may point to (default: names of `modules`).
         """
 
         self.modules = modules
         self.options = options if options is not None else MarkdownOptions()
         self.predicate = predicate
+        self.batch = set(batch) if batch is not None else {module.__name__ for module in modules}
+        self._sources = SourceCache()
+        self._contexts = {}
+        self._functions = MemoryCache("class functions", weak=True)
+        # parameter and return types in doc-strings often refer to the class the doc-string belongs to, which would keep
+        # a weak key alive; doc-strings are discarded with `invalidate` or when evicted
+        self._docstrings = MemoryCache("doc-strings", sizeof=_docstring_size)
+        self._references = MemoryCache("references", weak=True)
+        self._texts = MemoryCache("doc-string texts", sizeof=sys.getsizeof)
+        self._scoped_texts = MemoryCache("doc-string texts with references", weak=True, sizeof=sys.getsizeof)
+        self._types = MemoryCache("types", weak=True, sizeof=sys.getsizeof)
+        self._executor = None
 
     def _heading_anchor(self, anchor: str, text: str) -> str:
         """
@@ -492,16 +1030,56 @@ class MarkdownGenerator:
             case MarkdownAnchorStyle.GITBOOK:
                 return text + " {#" + anchor + "}"
 
+    def _heading(self, level: int, anchor: str, text: str, name: str, kind: str | None, w: MarkdownWriter) -> None:
+        """
+        Writes a heading with an anchor, and registers the anchor to detect collisions.
+
+        :param level: Heading level, e.g. 1 for `#` and 2 for `##`.
+        :param anchor: Anchor name, following HTML and Markdown identifier rules.
+        :param text: Heading title text.
+        :param name: Qualified name of the object the heading introduces.
+        :param kind: Kind of object the heading introduces, or `None` for headings that introduce a group of objects.
+        """
+
+        w.anchors.register(anchor, name, kind)
+        w.print(f"{'#' * level} {self._heading_anchor(anchor, text)}")
+
+    def _lookup_external(self, module_name: str, qualname: str | None = None) -> InventoryEntry | None:
+        """
+        Finds an object documented elsewhere in the inventories.
+
+        :param module_name: Qualified name of the module, or the module the object is defined in.
+        :param qualname: Qualified name of the object within the module, or `None` to look up the module itself.
+        """
+
+        for inventory in self.options.inventories:
+            if qualname is None:
+                entry = inventory.lookup(module_name)
+            else:
+                entry = inventory.find(module_name, qualname)
+            if entry is not None:
+                return entry
+        return None
+
+    def _external_link(self, entry: InventoryEntry, text: str | None = None) -> str:
+        "Creates a link to an object documented elsewhere."
+
+        if text is None:
+            text = entry.short_name
+        return f"[{safe_name(text)}]({entry.url})"
+
     def _module_link(self, module: ModuleType, context: Context) -> str:
-        "Creates a link to a class if it is part of the exported batch."
+        "Creates a link to a module if it is part of the exported batch or an inventory."
 
-        if module in self.modules:
+        if module.__name__ in self.batch:
             return module_link(module, context)
+        elif (entry := self._lookup_external(module.__name__)) is not None:
+            return self._external_link(entry)
         else:
             return safe_name(module.__name__)
 
     def _class_link(self, cls: type, context: Context) -> str:
-        "Creates a link to a class if it is part of the exported batch."
+        "Creates a link to a class if it is part of the exported batch or an inventory."
 
         if cls.__module__ == "builtins":
             if issubclass(cls, BaseException):
@@ -509,84 +1087,144 @@ class MarkdownGenerator:
 
             # built-in type such as `bool`, `int` or `str`
             return cls.__name__
+
+        if cls.__module__ in self.batch:
+            return class_link(cls, context)
+        elif (entry := self._lookup_external(cls.__module__, cls.__qualname__)) is not None:
+            return self._external_link(entry, cls.__name__)
         elif self.options.stdlib_links and (cls.__module__ in sys.builtin_module_names or cls.__module__ in sys.stdlib_module_names):
             # standard library reference
             qualname = f"{cls.__module__}.{cls.__qualname__}"
             return f"[{qualname}](https://docs.python.org/3/library/{cls.__module__}.html#{qualname})"
-
-        module = sys.modules[cls.__module__]
-        if module in self.modules:
-            return class_link(cls, context)
         else:
             return safe_name(cls.__name__)
 
     def _decorator_link(self, fn: CallableType, context: Context) -> str:
-        "Creates a link to a decorator function if it is part of the exported batch."
+        "Creates a link to a decorator function if it is part of the exported batch or an inventory."
 
-        module = sys.modules[fn.__module__]
-        if module in self.modules:
+        if fn.__module__ in self.batch:
             return decorator_link(fn, context)
+        elif (entry := self._lookup_external(fn.__module__, fn.__qualname__)) is not None:
+            return self._external_link(entry, f"@{fn.__name__}")
         else:
             return f"@{safe_name(fn.__name__)}"
 
     def _function_link(self, fn: CallableType, context: Context) -> str:
-        "Creates a link to a function if it is part of the exported batch."
+        "Creates a link to a function if it is part of the exported batch or an inventory."
 
-        module = sys.modules[fn.__module__]
-        if module in self.modules:
+        if fn.__module__ in self.batch:
             return function_link(fn, context)
+        elif (entry := self._lookup_external(fn.__module__, fn.__qualname__)) is not None:
+            return self._external_link(entry, fn.__name__)
         else:
             return safe_name(fn.__name__)
 
+    def _evaluate_ref(self, ref: str, resolver: Resolver) -> Any:
+        """
+        Resolves a reference, importing modules of the exported batch on demand that have not been imported yet.
+
+        References that cannot be resolved to a Python object but are found in an inventory evaluate to an inventory entry.
+        References are cached by the module or class they are resolved in. Objects are held by weak reference, since an
+        object (e.g. a subclass) may refer to the class it is resolved in, which would keep the class alive.
+        """
+
+        cached = self._references.get(resolver.scope, ref)
+        obj = cached() if isinstance(cached, weakref.ref) else cached
+        if obj is not None:
+            return obj
+        if cached is not None:
+            # object has been garbage collected, e.g. the class of a module reloaded since
+            self._references.discard(resolver.scope)
+
+        def compute() -> Any:
+            nonlocal obj
+            obj = self._evaluate_ref_uncached(ref, resolver)
+            return _weak_value(obj)
+
+        self._references.compute(resolver.scope, compute, ref)
+        return obj
+
+    def _evaluate_ref_uncached(self, ref: str, resolver: Resolver) -> Any:
+        try:
+            return resolver.evaluate(ref)
+        except ResolverError:
+            # modules in the batch may not have been imported, e.g. when documentation is generated in a worker process,
+            # or may be being imported in another thread, in which case importing waits for the import to complete
+            parts = ref.split(".")
+            for count in range(len(parts), 0, -1):
+                name = ".".join(parts[:count])
+                if name in self.batch and not _is_imported(name):
+                    importlib.import_module(name)
+                    return resolver.evaluate(ref)
+
+            # objects documented elsewhere are linked without importing the module they are defined in
+            entry = self._lookup_external(ref)
+            if entry is not None:
+                return entry
+            raise
+
+    def _resolve_ref(self, role: str, ref: str, resolver: Resolver) -> Any:
+        """
+        Resolves a reference, and checks that it points to the kind of object its role implies.
+
+        :param role: Reference role, e.g. `class` for class references and `func` for function references.
+        :param ref: The (partially- or fully-qualified) reference to resolve.
+        :param resolver: Resolves references to their corresponding Python types.
+        :returns: A module, class or function, or an inventory entry for objects documented elsewhere.
+        """
+
+        obj: Any = self._evaluate_ref(ref, resolver)
+        if isinstance(obj, InventoryEntry):
+            return obj
+
+        match role:
+            case "mod":
+                if not isinstance(obj, ModuleType):
+                    raise ValueError(f"expected: module reference; got: {obj} of type {type(obj)}")
+            case "class" | "exc":
+                if isinstance(obj, ModuleType) or is_function(obj) or not isinstance(obj, type):
+                    raise ValueError(f"expected: class reference; got: {obj} of type {type(obj)}")
+            case "deco":
+                if not is_function(obj):
+                    raise ValueError(f"expected: decorator reference; got: {obj} of type {type(obj)}")
+            case _:
+                if not is_function(obj):
+                    raise ValueError(f"expected: function reference; got: {obj} of type {type(obj)}")
+        return obj
+
     def _replace_refs(self, text: str, resolver: Resolver, context: Context) -> str:
         "Replaces references in module, class or parameter doc-string text."
 
         def _replace_module_ref(m: re.Match[str]) -> str:
-            ref: str = _extract_ref(m.group(1))
-            obj: Any = resolver.evaluate(ref)
-            if not isinstance(obj, ModuleType):
-                raise ValueError(f"expected: module reference; got: {obj} of type {type(obj)}")
+            obj = self._resolve_ref("mod", _extract_ref(m.group(1)), resolver)
+            if isinstance(obj, InventoryEntry):
+                return self._external_link(obj)
             return self._module_link(obj, context)
 
         def _replace_class_ref(m: re.Match[str]) -> str:
-            ref = _extract_ref(m.group(1))
-            obj: Any = resolver.evaluate(ref)
-            if isinstance(obj, ModuleType) or is_function(obj) or not isinstance(obj, type):
-                raise ValueError(f"expected: class reference; got: {obj} of type {type(obj)}")
+            obj = self._resolve_ref("class", _extract_ref(m.group(1)), resolver)
+            if isinstance(obj, InventoryEntry):
+                return self._external_link(obj)
             return self._class_link(obj, context)
 
         def _replace_deco_ref(m: re.Match[str]) -> str:
-            ref: str = _extract_ref(m.group(1))
-            obj: Any = resolver.evaluate(ref)
-            if not is_function(obj):
-                raise ValueError(f"expected: decorator reference; got: {obj} of type {type(obj)}")
+            obj = self._resolve_ref("deco", _extract_ref(m.group(1)), resolver)
+            if isinstance(obj, InventoryEntry):
+                return self._external_link(obj, f"@{obj.short_name}")
             return self._decorator_link(obj, context)
 
         def _replace_func_ref(m: re.Match[str]) -> str:
-            ref: str = _extract_ref(m.group(1))
-            obj: Any = resolver.evaluate(ref)
-            if not is_function(obj):
-                raise ValueError(f"expected: function reference; got: {obj} of type {type(obj)}")
+            obj = self._resolve_ref("func", _extract_ref(m.group(1)), resolver)
+            if isinstance(obj, InventoryEntry):
+                return self._external_link(obj)
             return self._function_link(obj, context)
 
-        regex = re.compile(r":mod:`([^`]+)`")
-        text = regex.sub(_replace_module_ref, text)
-
-        regex = re.compile(r":class:`([^`]+)`")
-        text = regex.sub(_replace_class_ref, text)
-
-        regex = re.compile(r":exc:`([^`]+)`")
-        text = regex.sub(_replace_class_ref, text)
-
-        regex = re.compile(r":deco:`([^`]+)`")
-        text = regex.sub(_replace_deco_ref, text)
-
-        regex = re.compile(r":func:`([^`]+)`")
-        text = regex.sub(_replace_func_ref, text)
-
-        regex = re.compile(r":meth:`([^`]+)`")
-        text = regex.sub(_replace_func_ref, text)
-
+        text = _MODULE_REF_REGEX.sub(_replace_module_ref, text)
+        text = _CLASS_REF_REGEX.sub(_replace_class_ref, text)
+        text = _EXCEPTION_REF_REGEX.sub(_replace_class_ref, text)
+        text = _DECORATOR_REF_REGEX.sub(_replace_deco_ref, text)
+        text = _FUNCTION_REF_REGEX.sub(_replace_func_ref, text)
+        text = _METHOD_REF_REGEX.sub(_replace_func_ref, text)
         return text
 
     def _transform_text(self, text: str, resolver: Resolver, context: Context) -> str:
@@ -598,32 +1236,75 @@ class MarkdownGenerator:
         :param context: The module in which the transformation is operating, used to shorten local links.
         """
 
-        text = text.strip()
-        text = replace_links(text)
-        text = self._replace_refs(text, resolver, context)
-        return text
+        # text without references transforms the same way in any scope and context
+        if _ROLE_REGEX.search(text) is None:
+            return self._texts.get_or_compute(text, lambda: replace_links(text.strip()))
+        else:
+            return self._scoped_texts.get_or_compute(
+                resolver.scope,
+                lambda: self._replace_refs(replace_links(text.strip()), resolver, context),
+                (text, context.module.__name__, context.partition),
+            )
 
-    def _create_context(self, module: ModuleType, partition: ObjectKind) -> Context:
-        match self.options.partition_strategy:
-            case PartitionStrategy.SINGLE:
-                return Context(module, None)
-            case PartitionStrategy.BY_KIND:
-                return Context(module, partition)
+    def cache_stats(self) -> list[CacheStats]:
+        """
+        Statistics of the caches used by this generator, including caches of names, anchors and paths shared by all generators.
+
+        Caches share a memory budget, see :data:`markdown_doc.cache.default_budget`, except for names, anchors and paths,
+        which are bounded by a number of entries.
+        """
+
+        caches: list[MemoryCache[Any, Any]] = [
+            self._sources.cache,
+            self._functions,
+            self._docstrings,
+            self._references,
+            self._texts,
+            self._scoped_texts,
+            self._types,
+        ]
+        return [cache.stats() for cache in caches] + [
+            lru_cache_stats("safe names", safe_name.cache_info()),
+            lru_cache_stats("anchor identifiers", safe_id.cache_info()),
+            lru_cache_stats("module paths", module_path.cache_info()),
+        ]
+
+    def _type_formatter(self, module: ModuleType, context: Context) -> MarkdownTypeFormatter:
+        "Creates a type formatter that links to classes from a context, with formatted types cached per module."
+
+        return MarkdownTypeFormatter(
+            module,
+            lambda c: self._class_link(c, context),
+            self.options,
+            cache=self._types,
+            cache_key=(context.module.__name__, context.partition),
+        )
+
+    def _create_context(self, module: ModuleType, obj: ObjectType | ModuleType) -> Context:
+        "Returns the (interned) context for the group of types that an object is exported with."
+
+        key = (module.__name__, object_partition(obj, self.options.partition_strategy))
+        context = self._contexts.get(key)
+        if context is None:
+            # threads rendering in parallel share the context inserted first, along with the paths it memoizes
+            context = self._contexts.setdefault(key, Context(module, key[1], self.options.partition_strategy))
+        return context
 
     def _generate_enum(self, cls: type[Enum], w: MarkdownWriter) -> None:
         "Writes Markdown output for a single Python enumeration class with all enumeration members."
 
         module = sys.modules[cls.__module__]
-        docstring = parse_type(cls)
+        docstring = self._parse_docstring(cls)
+        self._add_class_symbol(cls, docstring.short_description, w)
         description = docstring.full_description
         if description:
-            w.print(self._transform_text(description, ClassResolver(cls), self._create_context(module, ObjectKind.ENUM)))
+            w.print(self._transform_text(description, ClassResolver(cls), self._create_context(module, cls)))
             w.print()
 
         w.print("**Members:**")
         w.print()
         try:
-            labels = enum_labels(cls)
+            labels = self._sources.enum_labels(cls)
             for e in cls:
                 enum_def = f"* **{safe_name(e.name)}** = {quote_value(e.value)}"
                 enum_label = labels.get(e.name)
@@ -631,20 +1312,27 @@ class MarkdownGenerator:
                     w.print(f"{enum_def} - {enum_label}")
                 else:
                     w.print(enum_def)
+                w.anchors.add_symbol(f"{cls.__module__}.{cls.__qualname__}.{e.name}", "member", class_anchor(cls), enum_label)
         except OSError:  # source code not available
             # some special constructs (e.g. dynamically generated code) don't have source
             for e in cls:
                 enum_def = f"* **{safe_name(e.name)}** = {quote_value(e.value)}"
                 w.print(enum_def)
+                w.anchors.add_symbol(f"{cls.__module__}.{cls.__qualname__}.{e.name}", "member", class_anchor(cls), None)
 
         w.print()
 
+    def _add_class_symbol(self, cls: type, description: str | None, w: MarkdownWriter) -> None:
+        "Records a class to publish in a search index."
+
+        w.anchors.add_symbol(f"{cls.__module__}.{cls.__qualname__}", "class", class_anchor(cls), description)
+
     def _generate_bases(self, cls: type, w: MarkdownWriter) -> None:
         "Writes base classes for a Python class."
 
         module = sys.modules[cls.__module__]
         bases = [b for b in cls.__bases__ if b is not object]
-        context = self._create_context(module, ObjectKind.CLASS)
+        context = self._create_context(module, cls)
         if len(bases) > 0:
             w.print(f"**Bases:** {', '.join(self._class_link(b, context) for b in bases)}")
             w.print()
@@ -670,10 +1358,10 @@ class MarkdownGenerator:
     ) -> None:
         "Writes Markdown output for a single Python function."
 
-        docstring = parse_type(function)
+        docstring = self._parse_docstring(function)
         description = docstring.full_description
 
-        signature = inspect.signature(function)
+        signature = get_signature(function)
         func_params: list[str] = []
         for param_name, param in signature.parameters.items():
             if param.annotation is not inspect.Signature.empty:
@@ -688,7 +1376,9 @@ class MarkdownGenerator:
         else:
             returns = ""
         title = f"{safe_name(function.__name__)} ( {param_list} ){returns}"
-        w.print(f"### {self._heading_anchor(function_anchor(function), title)}")
+        kind = "method" if isinstance(param_resolver, MemberFunctionResolver) else "function"
+        self._heading(3, function_anchor(function), title, f"{function.__module__}.{function.__qualname__}", kind, w)
+        w.anchors.add_symbol(f"{function.__module__}.{function.__qualname__}", kind, function_anchor(function), docstring.short_description)
         w.print()
 
         if description:
@@ -720,25 +1410,80 @@ class MarkdownGenerator:
 
         self._generate_references(docstring.see_also, w)
 
-    def _generate_functions(self, cls: type, fmt: MarkdownTypeFormatter, w: MarkdownWriter) -> None:
-        "Writes Markdown output for Python member functions in a class."
+    def _class_functions(self, cls: type) -> list[tuple[str, CallableType]]:
+        "Member functions defined in a class, with their names cached per class."
 
-        for name, func in inspect.getmembers(cls, lambda f: is_function(f)):
-            # skip inherited functions (unless overridden)
-            if name not in cls.__dict__:
-                continue
+        # functions with `@classmethod` are bound to the class, which would keep the class alive if cached
+        names = self._functions.get_or_compute(cls, lambda: [name for name, _ in class_functions(cls)])
+        return [(name, func) for name in names if (func := _unwrap_function(cls, cls.__dict__.get(name))) is not None]
 
-            # skip private functions
-            if not self.options.include_private and is_private(func):
-                continue
+    def _parse_docstring(self, obj: ObjectType | ModuleType) -> Docstring:
+        "Parses the doc-string of a module, class or function, cached per object."
 
-            # skip functions without documentation
-            if not self.options.include_undocumented and not is_documented(func):
-                continue
+        return self._docstrings.get_or_compute(obj, lambda: parse_type(obj))
+
+    def _is_documented(self, obj: ObjectType) -> bool:
+        "True if the class or function has a doc-string description."
+
+        return self._parse_docstring(obj).full_description is not None
 
+    def extract(self, module: ModuleType) -> None:
+        """
+        Extracts documentation from a module ahead of rendering it with :meth:`render`.
+
+        Collects the classes and functions to export with their member functions, and parses their doc-strings and the
+        module source. Results are cached such that rendering the module only formats text and types.
+
+        :param module: The module to extract documentation from.
+        """
+
+        self._parse_docstring(module)
+        for cls in self._module_classes(module):
+            self._parse_docstring(cls)
+            try:
+                self._sources.source_of(cls)
+            except OSError:  # source code not available
+                pass
+            if not is_type_enum(cls):
+                for _, func in self._class_functions(cls):
+                    self._parse_docstring(func)
+        for func in self._module_functions(module):
+            self._parse_docstring(func)
+
+    def invalidate(self, module: ModuleType) -> None:
+        """
+        Discards documentation extracted from a module, e.g. after the module has been reloaded.
+
+        Entries cached for the module and for the classes and functions defined in it are discarded, including text and
+        types that link to other objects. A reloaded module keeps its identity but its classes and functions are new
+        objects, which are looked up afresh. Modules whose documents link into a reloaded module cache the links they
+        resolved, and are to be invalidated as well.
+
+        :param module: The module to discard cached documentation for.
+        """
+
+        def defined_in(obj: Any) -> bool:
+            return obj is module or getattr(obj, "__module__", None) == module.__name__
+
+        for cache in (self._functions, self._docstrings, self._references, self._scoped_texts, self._types):
+            cache.discard_where(defined_in)
+
+        # contexts record the documents linked to from cached text
+        for key in [key for key in self._contexts if key[0] == module.__name__]:
+            self._contexts.pop(key, None)
+
+    def _member_functions(self, cls: type) -> list[CallableType]:
+        "Member functions in a class to export."
+
+        return [func for _, func in self._class_functions(cls) if self._is_exported_function(func)]
+
+    def _generate_functions(self, cls: type, fmt: MarkdownTypeFormatter, w: MarkdownWriter) -> None:
+        "Writes Markdown output for Python member functions in a class."
+
+        for func in self._member_functions(cls):
             module = sys.modules[func.__module__]
-            context = self._create_context(module, ObjectKind.CLASS)
-            self._generate_function(func, ClassResolver(cls), MemberFunctionResolver(cls, func), context, fmt, w)  # pyright: ignore[reportArgumentType]
+            context = self._create_context(module, cls)
+            self._generate_function(func, ClassResolver(cls), MemberFunctionResolver(cls, func), context, fmt, w)  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
 
     def _generate_class(self, cls: type, w: MarkdownWriter) -> None:
         "Writes Markdown output for a single (regular) Python class."
@@ -746,11 +1491,12 @@ class MarkdownGenerator:
         self._generate_bases(cls, w)
 
         module = sys.modules[cls.__module__]
-        context = self._create_context(module, ObjectKind.CLASS)
+        context = self._create_context(module, cls)
 
-        fmt = MarkdownTypeFormatter(module, lambda c: self._class_link(c, context), self.options.auxiliary_types)
+        fmt = self._type_formatter(module, context)
 
-        docstring = parse_type(cls)
+        docstring = self._parse_docstring(cls)
+        self._add_class_symbol(cls, docstring.short_description, w)
         description = docstring.full_description
         if description:
             w.print(self._transform_text(description, ClassResolver(cls), context))
@@ -766,11 +1512,12 @@ class MarkdownGenerator:
         self._generate_bases(cls, w)
 
         module = sys.modules[cls.__module__]
-        context = self._create_context(module, ObjectKind.DATACLASS)
+        context = self._create_context(module, cls)
 
-        fmt = MarkdownTypeFormatter(module, lambda c: self._class_link(c, context), self.options.auxiliary_types)
+        fmt = self._type_formatter(module, context)
 
-        docstring = parse_type(cls)
+        docstring = self._parse_docstring(cls)
+        self._add_class_symbol(cls, docstring.short_description, w)
         if docstring.short_description or docstring.params:
             check_docstring(cls, docstring, strict=True)
         description = docstring.full_description
@@ -786,122 +1533,556 @@ class MarkdownGenerator:
                 param_type = fmt.type_to_markdown(docstring_param.param_type)
                 param_desc = self._transform_text(docstring_param.description, MemberResolver(cls, name), context)
                 w.print(f"* **{safe_name(name)}** ({param_type}) - {param_desc}")
+                w.anchors.add_symbol(f"{cls.__module__}.{cls.__qualname__}.{name}", "property", class_anchor(cls), docstring_param.description)
             w.print()
 
         self._generate_references(docstring.see_also, w)
 
         self._generate_functions(cls, fmt, w)
 
-    def _generate_module(self, module: ModuleType, target: Path, partition: ObjectKind | None) -> None:
-        "Writes Markdown output for a single Python module."
+    def _module_classes(self, module: ModuleType) -> list[type]:
+        "Classes in a module to export."
+
+        classes: list[type] = []
+        for cls in get_module_classes(module):
+            if not self.options.include_private and is_private(cls):
+                continue
+
+            if self.predicate is not None and not self.predicate(cls):
+                continue
+
+            classes.append(cls)
+        return classes
+
+    def _is_exported_function(self, func: CallableType) -> bool:
+        "True if a module-level or member function is to be exported."
+
+        # skip private functions
+        if not self.options.include_private and is_private(func):
+            return False
+
+        # skip functions without documentation
+        if not self.options.include_undocumented and not self._is_documented(func):
+            return False
+
+        return True
+
+    def _module_functions(self, module: ModuleType) -> list[FunctionType]:
+        "Module-level functions to export."
+
+        return [fn for fn in get_module_functions(module) if self._is_exported_function(fn)]
 
-        context = self._create_context(module, ObjectKind.MODULE)
-        fmt = MarkdownTypeFormatter(module, lambda c: self._class_link(c, context), self.options.auxiliary_types)
+    def _generate_module_header(self, module: ModuleType, context: Context, w: MarkdownWriter) -> None:
+        "Writes the heading and the description of a module."
 
-        header = MarkdownWriter()
         module_name = module.__name__.split(".")[-1]
-        header.print(f"# {self._heading_anchor(module_anchor(module), module_name)}")
-        header.print()
+        self._heading(1, module_anchor(module), module_name, module.__name__, "module", w)
+        w.print()
 
-        docstring = parse_type(module)
+        docstring = self._parse_docstring(module)
+        w.anchors.add_symbol(module.__name__, "module", module_anchor(module), docstring.short_description)
         if docstring.full_description:
-            header.print(self._transform_text(docstring.full_description, ModuleResolver(module), context))
-            header.print()
+            w.print(self._transform_text(docstring.full_description, ModuleResolver(module), context))
+            w.print()
 
-        self._generate_references(docstring.see_also, header)
+        self._generate_references(docstring.see_also, w)
 
-        w = MarkdownWriter()
-        for cls in get_module_classes(module):
-            if not self.options.include_private and is_private(cls):
-                continue
+    def _generate_module(self, module: ModuleType, partition: str | None, anchors: AnchorRegistry) -> str | None:
+        """
+        Generates Markdown output for a single Python module, or `None` if there is nothing to export.
 
-            if self.predicate is not None and not self.predicate(cls):
-                continue
+        :param module: The module to generate documentation for.
+        :param partition: The group of objects to export, or `None` to export all objects.
+        :param anchors: Records the anchors emitted in the Markdown document.
+        """
 
+        context = self._create_context(module, module)
+        strategy = self.options.partition_strategy
+
+        header = MarkdownWriter(anchors)
+        if strategy is PartitionStrategy.BY_OBJECT:
+            # pages of individual objects link back to the module index page instead of repeating the module description
+            header.print(f"**Module:** {module_link(module, context)}")
+            header.print()
+        else:
+            self._generate_module_header(module, context, header)
+
+        parts: list[Callable[[MarkdownWriter], None]] = []
+        for cls in self._module_classes(module):
             # check whether the current object is to be exported
-            if partition is not None:
-                if is_type_enum(cls):
-                    if partition is not ObjectKind.ENUM:
-                        continue
-                elif is_dataclass(cls):
-                    if partition is not ObjectKind.DATACLASS:
-                        continue
-                elif isinstance(cls, type):
-                    if partition is not ObjectKind.CLASS:
-                        continue
-
-            # required to suppress type checker warnings
-            kls = typing.cast(type, cls)  # type: ignore[redundant-cast]
-
-            w.print(f"## {self._heading_anchor(class_anchor(kls), safe_name(kls.__name__))}")
-            w.print()
+            if partition is not None and object_partition(cls, strategy) != partition:
+                continue
+
+            parts.append(functools.partial(self._generate_module_class, module, cls))
+
+        functions = self._module_functions(module)
+        if functions and (partition is None or object_partition(functions[0], strategy) == partition):
+            # generate top-level module functions
+            anchor = f"{safe_id(module.__name__)}-functions"
+            parts.append(functools.partial(self._generate_group_heading, anchor, "Functions", f"{module.__name__}-functions"))
+
+            function_context = self._create_context(module, functions[0])
+            fmt = self._type_formatter(module, function_context)
+            for func in functions:
+                parts.append(functools.partial(self._generate_function, func, ModuleResolver(module), ModuleFunctionResolver(func), function_context, fmt))
+
+        if parts:
+            return f"{header.fetch()}\n{self._render_parts(parts, anchors)}"
+        else:
+            return None
+
+    def _generate_module_class(self, module: ModuleType, cls: type, w: MarkdownWriter) -> None:
+        "Writes Markdown output for a class defined in a module, including its heading."
+
+        self._heading(2, class_anchor(cls), safe_name(cls.__name__), f"{cls.__module__}.{cls.__qualname__}", "class", w)
+        w.print()
+
+        try:
+            if is_type_enum(cls):
+                self._generate_enum(cls, w)
+            elif is_dataclass(cls):
+                self._generate_dataclass(cls, w)
+            elif isinstance(cls, type):
+                self._generate_class(cls, w)
+            else:
+                raise TypeError(f"expected: data-class, enum class or regular class; got: {cls}")
+        except Exception as e:
+            raise ProcessingError(
+                f"error while processing type `{cls.__name__}` in module `{module.__name__}`",
+                obj=cls,
+            ) from e
+
+    def _generate_group_heading(self, anchor: str, text: str, name: str, w: MarkdownWriter) -> None:
+        "Writes the heading of a group of objects, e.g. module-level functions."
+
+        self._heading(2, anchor, text, name, None, w)
+        w.print()
+
+    def _render_parts(self, parts: list[Callable[[MarkdownWriter], None]], anchors: AnchorRegistry) -> str:
+        """
+        Renders the parts of a Markdown document, e.g. classes and functions, and concatenates their output in order.
 
+        When generating with several threads, each part is rendered by a thread of its own into a writer of its own, and
+        anchors are merged in order afterwards, such that the output matches that of rendering parts one after another.
+
+        :param parts: Functions that write (a part of) the Markdown document.
+        :param anchors: Records the anchors emitted in the Markdown document.
+        """
+
+        executor = self._executor
+        if executor is None:
+            w = MarkdownWriter(anchors)
+            for part in parts:
+                part(w)
+            return w.fetch()
+
+        def render_part(part: Callable[[MarkdownWriter], None]) -> MarkdownWriter:
+            w = MarkdownWriter(AnchorRegistry(anchors.document))
+            part(w)
+            return w
+
+        writers = list(executor.map(render_part, parts))
+        for w in writers:
+            anchors.merge(w.anchors)
+        return "\n".join(line for w in writers for line in w.lines)
+
+    def _source_location(self, obj: ObjectType | ModuleType) -> tuple[str | None, int | None]:
+        "Path to the source file and line number where a module, class or function is defined, if known."
+
+        if isinstance(obj, ModuleType):
+            return getattr(obj, "__file__", None), None
+        elif is_function(obj):
+            code = getattr(inspect.unwrap(obj), "__code__", None)
+            if code is None:
+                return None, None
+            return code.co_filename, code.co_firstlineno
+        elif isinstance(obj, type):
             try:
-                if is_type_enum(kls):
-                    self._generate_enum(kls, w)
-                elif is_dataclass(kls):
-                    self._generate_dataclass(kls, w)
-                elif isinstance(kls, type):
-                    self._generate_class(kls, w)
-                else:
-                    raise TypeError(f"expected: data-class, enum class or regular class; got: {kls}")
+                source = self._sources.source_of(obj)
+            except OSError:
+                return None, None
+            classdef = source.class_def(obj)
+            return source.path, classdef.lineno if classdef is not None else None
+        else:
+            return None, None
+
+    def _validate_refs(self, text: str | None, resolver: Resolver) -> list[str]:
+        "Resolves all references in doc-string text, and returns an error message for each reference that fails to resolve."
+
+        if not text:
+            return []
+
+        messages: list[str] = []
+        for role, regex in _REF_REGEXES.items():
+            for m in regex.finditer(text):
+                try:
+                    self._resolve_ref(role, _extract_ref(m.group(1)), resolver)
+                except Exception as e:
+                    messages.append(f"invalid reference {m.group(0)}: {_error_message(e)}")
+        return messages
+
+    def _validate_type(self, data_type: Any, module: ModuleType) -> list[str]:
+        "Evaluates forward references in a type annotation, and returns an error message for each that fails to evaluate."
+
+        if isinstance(data_type, (str, ForwardRef)):
+            try:
+                evaluate_type(data_type, module)
             except Exception as e:
-                kls = typing.cast(type, cls)  # type: ignore[redundant-cast]
-                raise ProcessingError(
-                    f"error while processing type `{kls.__name__}` in module `{module.__name__}`",
-                    obj=kls,
-                ) from e
+                return [f"invalid type annotation {data_type!r}: {_error_message(e)}"]
+            return []
+
+        origin = typing.get_origin(data_type)
+        if origin is Literal:
+            return []
+        elif origin is Annotated:
+            return self._validate_type(data_type.__origin__, module)
+        else:
+            return [message for arg in typing.get_args(data_type) for message in self._validate_type(arg, module)]
 
-        if partition is None or partition is ObjectKind.FUNCTION:
-            # generate top-level module functions
-            functions = get_module_functions(module)
-            if not self.options.include_private:
-                functions = [fn for fn in functions if not is_private(fn)]
-            if not self.options.include_undocumented:
-                functions = [fn for fn in functions if is_documented(fn)]
-            if functions:
-                anchor = f"{safe_id(module.__name__)}-functions"
-                anchored_title = self._heading_anchor(anchor, "Functions")
-                w.print(f"## {anchored_title}")
-                w.print()
-
-                for func in functions:
-                    self._generate_function(func, ModuleResolver(module), ModuleFunctionResolver(func), context, fmt, w)
-
-        if w:
-            with open(target, "w", encoding="utf-8") as f:
-                f.write(header.fetch())
-                f.write("\n")
-                f.write(w.fetch())
-
-    def generate(self, target: Path) -> None:
+    def _validate_function(self, function: CallableType, signature_resolver: Resolver, param_resolver: Resolver) -> list[str]:
+        "Validates the signature and the doc-string of a function, and returns an error message for each problem found."
+
+        # checking whether a function is exported parses its doc-string, which may fail and is reported for the function
+        if not self._is_exported_function(function):
+            return []
+
+        module = sys.modules[function.__module__]
+        docstring = self._parse_docstring(function)
+        signature = get_signature(function)
+
+        messages: list[str] = []
+        for param in signature.parameters.values():
+            if param.annotation is not inspect.Signature.empty:
+                messages.extend(self._validate_type(param.annotation, module))
+        if signature.return_annotation is not inspect.Signature.empty:
+            messages.extend(self._validate_type(signature.return_annotation, module))
+
+        messages.extend(self._validate_refs(docstring.full_description, signature_resolver))
+        for docstring_param in docstring.params.values():
+            messages.extend(self._validate_refs(docstring_param.description, param_resolver))
+        if docstring.returns:
+            messages.extend(self._validate_refs(docstring.returns.description, param_resolver))
+        return messages
+
+    def _validate_class(self, cls: type) -> list[str]:
+        "Validates the doc-string of a class and its member functions, and returns an error message for each problem found."
+
+        module = sys.modules[cls.__module__]
+        docstring = self._parse_docstring(cls)
+
+        messages: list[str] = []
+        if is_dataclass(cls) and (docstring.short_description or docstring.params):
+            try:
+                check_docstring(cls, docstring, strict=True)
+            except Exception as e:
+                messages.append(_error_message(e))
+
+        messages.extend(self._validate_refs(docstring.full_description, ClassResolver(cls)))
+        if is_dataclass(cls):
+            for name, docstring_param in docstring.params.items():
+                messages.extend(self._validate_type(docstring_param.param_type, module))
+                messages.extend(self._validate_refs(docstring_param.description, MemberResolver(cls, name)))
+        return messages
+
+    def _validate_object(self, obj: ObjectType | ModuleType, validate: Callable[[], list[str]], issues: list[ValidationIssue]) -> None:
+        "Runs validation for a module, class or function, and records all problems with the location of the object."
+
+        try:
+            messages = validate()
+        except Exception as e:
+            messages = [_error_message(e)]
+        if messages:
+            path, line = self._source_location(obj)
+            name = obj.__name__ if isinstance(obj, ModuleType) else f"{obj.__module__}.{obj.__qualname__}"
+            issues.extend(ValidationIssue(path, line, name, message) for message in messages)
+
+    def _validate_module(self, module: ModuleType) -> list[ValidationIssue]:
+        "Validates doc-strings and cross-references in a module, collecting all problems instead of stopping at the first."
+
+        issues: list[ValidationIssue] = []
+        self._validate_object(module, lambda: self._validate_refs(self._parse_docstring(module).full_description, ModuleResolver(module)), issues)
+
+        # validate the same classes and functions that are exported when rendering
+        for cls in self._module_classes(module):
+            self._validate_object(cls, functools.partial(self._validate_class, cls), issues)
+            if is_type_enum(cls):
+                continue
+
+            for _, func in self._class_functions(cls):
+                self._validate_object(func, functools.partial(self._validate_function, func, ClassResolver(cls), MemberFunctionResolver(cls, func)), issues)  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+
+        for func in get_module_functions(module):
+            self._validate_object(func, functools.partial(self._validate_function, func, ModuleResolver(module), ModuleFunctionResolver(func)), issues)
+
+        return issues
+
+    def validate(self, *, workers: int | None = None) -> list[ValidationIssue]:
+        """
+        Validates doc-strings and cross-references without generating Markdown output.
+
+        Runs the same extraction, reference resolution and doc-string checks as generating documentation, but collects
+        all problems instead of stopping at the first. Modules are validated in parallel threads.
+
+        :param workers: Number of threads validating modules at the same time.
+        :returns: Problems found, ordered by module.
+        """
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [issue for issues in executor.map(self._validate_module, self.modules) for issue in issues]
+
+    def render(self, module: ModuleType) -> list[MarkdownDocument]:
+        """
+        Generates Markdown documents for a module without writing them to files.
+
+        :param module: The module to generate documentation for.
+        :returns: Documents whose path mirrors the hierarchy of the Python modules.
+        """
+
+        documents: list[MarkdownDocument] = []
+        module_path = module.__name__.replace(".", "/")
+        match self.options.partition_strategy:
+            case PartitionStrategy.SINGLE:
+                documents.extend(self._render_document(module, None, f"{module_path}.md", module.__name__))
+            case PartitionStrategy.BY_KIND:
+                for kind, title in _KIND_TITLES.items():
+                    documents.extend(self._render_document(module, kind.value, f"{module_path}-{kind.value}.md", title))
+            case PartitionStrategy.BY_OBJECT:
+                documents.extend(self._render_document(module, None, f"{module_path}.md", module.__name__))
+                for cls in self._module_classes(module):
+                    documents.extend(self._render_document(module, cls.__name__, f"{module_path}-{cls.__name__}.md", cls.__name__))
+                documents.extend(self._render_document(module, _FUNCTIONS_PARTITION, f"{module_path}-{_FUNCTIONS_PARTITION}.md", "Functions"))
+        return documents
+
+    def linked_modules(self, module: ModuleType) -> set[str]:
+        """
+        Qualified names of other modules in the exported batch that the documents rendered for a module link to.
+
+        Links are recorded as documents are rendered, and include cross-references in doc-strings and links in types.
+        """
+
+        linked: set[str] = set()
+        for (module_name, _), context in list(self._contexts.items()):
+            if module_name == module.__name__:
+                linked.update(context.linked_modules())
+        linked.discard(module.__name__)
+        return linked
+
+    def _render_all(self, threads: int, memory_profiler: MemoryProfiler | None = None) -> Iterator[list[MarkdownDocument]]:
+        """
+        Generates Markdown documents for each module in order, rendering modules in parallel if several threads are used.
+
+        Modules are rendered by one pool of threads, and their parts by another, such that a thread waiting for the parts
+        of a module never blocks a part from being rendered.
+        """
+
+        if threads <= 1:
+            for module in self.modules:
+                if memory_profiler is None:
+                    yield self.render(module)
+                else:
+                    with memory_profiler.measure(module.__name__, "render"):
+                        documents = self.render(module)
+                    yield documents
+            return
+
+        with ThreadPoolExecutor(max_workers=threads) as module_executor, ThreadPoolExecutor(max_workers=threads) as part_executor:
+            self._executor = part_executor
+            try:
+                yield from module_executor.map(self.render, self.modules)
+            finally:
+                self._executor = None
+
+    def _generate_index(self, module: ModuleType, anchors: AnchorRegistry) -> str | None:
+        """
+        Generates a Markdown index page for a module whose objects are documented on separate pages, or `None` if there is nothing to export.
+
+        :param module: The module to generate the index page for.
+        :param anchors: Records the anchors emitted in the Markdown document.
+        """
+
+        classes = self._module_classes(module)
+        functions = self._module_functions(module)
+        if not classes and not functions:
+            return None
+
+        context = self._create_context(module, module)
+        w = MarkdownWriter(anchors)
+        self._generate_module_header(module, context, w)
+
+        if classes:
+            w.print("**Classes:**")
+            w.print()
+            for cls in classes:
+                w.print(f"* {class_link(cls, context)}")
+            w.print()
+
+        if functions:
+            w.print("**Functions:**")
+            w.print()
+            for func in functions:
+                w.print(f"* {function_link(func, context)}")
+            w.print()
+
+        return w.fetch()
+
+    def _render_document(self, module: ModuleType, partition: str | None, path: str, title: str) -> list[MarkdownDocument]:
+        "Generates a Markdown document for (a part of) a module, or no document if there is nothing to export."
+
+        anchors = AnchorRegistry(_context_name(module.__name__, partition))
+        if self.options.partition_strategy is PartitionStrategy.BY_OBJECT and partition is None:
+            text = self._generate_index(module, anchors)
+        else:
+            text = self._generate_module(module, partition, anchors)
+        if text is None:
+            return []
+        objects = [InventoryItem(name, kind, path, anchor) for name, kind, anchor in anchors.objects]
+        symbols = [SearchItem(name, kind, path, anchor, summary) for name, kind, anchor, summary in anchors.symbols]
+        return [MarkdownDocument(path, text, objects, symbols, title)]
+
+    def generate(
+        self,
+        target: Path,
+        *,
+        inventory_file: Path | None = None,
+        search_index_file: Path | None = None,
+        navigation: bool = False,
+        threads: int = 1,
+        memory_profiler: MemoryProfiler | None = None,
+        dependency_file: Path | None = None,
+    ) -> None:
         """
         Writes Markdown files to a target directory.
 
         The subdirectories that files are written to match the hierarchy of the Python modules.
+
+        With several threads, modules are rendered in parallel, and so are the classes and functions within each module.
+        Files are written in the same order and with the same content as with a single thread. Parallel rendering pays
+        off on free-threaded builds of Python, in which threads are not serialized by the global interpreter lock.
+
+        :param target: Directory to write Markdown files to.
+        :param inventory_file: If given, a JSON link inventory of all objects documented is written to this file.
+        :param search_index_file: If given, a JSON search index of all symbols documented is written to this file.
+        :param navigation: Whether to write `SUMMARY.md` and an index page `README.md` for each package.
+        :param threads: Number of threads rendering modules, and number of threads rendering classes and functions.
+        :param memory_profiler: If given, records the memory allocated while rendering each module. Memory allocated by
+            several threads cannot be told apart, so modules must be rendered in a single thread.
+        :param dependency_file: If given, the modules that the documents of each module link to are recorded in this JSON
+            file, replacing the entries of the modules rendered and keeping the entries of other modules.
         """
 
-        for module in self.modules:
-            module_path = module.__name__.replace(".", "/") + ".md"
-            path = target / Path(module_path)
-            os.makedirs(path.parent, exist_ok=True)
+        if memory_profiler is not None and threads > 1:
+            raise ValueError("memory profiling requires rendering modules in a single thread")
+
+        output = _OutputWriter(target, [module.__name__ for module in self.modules])
+        for module, documents in zip(self.modules, self._render_all(threads, memory_profiler), strict=True):
+            output.write(module.__name__, documents)
+        output.finish(inventory_file=inventory_file, search_index_file=search_index_file, navigation=navigation)
+
+        if dependency_file is not None:
+            graph = DependencyGraph.load(dependency_file) if dependency_file.exists() else DependencyGraph()
+            for module in self.modules:
+                graph.add(module.__name__, self.linked_modules(module))
+            graph.write(dependency_file)
 
-            match self.options.partition_strategy:
-                case PartitionStrategy.SINGLE:
-                    self._generate_module(module, path, None)
-                case PartitionStrategy.BY_KIND:
-                    for partition in [ObjectKind.DATACLASS, ObjectKind.ENUM, ObjectKind.CLASS, ObjectKind.FUNCTION]:
-                        partition_path = path.with_stem(f"{path.stem}-{partition.value}")
-                        self._generate_module(module, partition_path, partition)
+    async def _arender_modules(self, concurrency: int, executor: Executor | None) -> AsyncGenerator[tuple[ModuleType, list[MarkdownDocument]], None]:
+        """
+        Generates Markdown documents for each module in order, rendering modules in an executor without blocking the event loop.
+
+        At most `concurrency` modules are rendered (or waiting to be consumed) at the same time. When the consumer is
+        cancelled, modules not yet started are cancelled too.
+        """
+
+        if concurrency < 1:
+            raise ValueError(f"expected: positive number of modules to render at the same time; got: {concurrency}")
+
+        loop = asyncio.get_running_loop()
+        modules = iter(self.modules)
+        pending: collections.deque[tuple[ModuleType, asyncio.Future[list[MarkdownDocument]]]] = collections.deque()
+        try:
+            while True:
+                while len(pending) < concurrency and (module := next(modules, None)) is not None:
+                    pending.append((module, loop.run_in_executor(executor, self.render, module)))
+                if not pending:
+                    break
+
+                module, future = pending.popleft()
+                yield module, await future
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    async def arender(self, *, concurrency: int = 1, executor: Executor | None = None) -> AsyncIterator[MarkdownDocument]:
+        """
+        Generates Markdown documents for all modules without writing them to files, and without blocking the event loop.
 
+        CPU-bound introspection and rendering run in an executor. Documents are produced in the same order as with
+        :meth:`render` called for each module in turn.
 
-def generate_markdown(modules: list[ModuleType], out_dir: Path, *, options: MarkdownOptions | None = None) -> None:
+        :param concurrency: Maximum number of modules to render at the same time.
+        :param executor: Executor to render modules in (default: the default executor of the event loop).
+        """
+
+        async with contextlib.aclosing(self._arender_modules(concurrency, executor)) as results:
+            async for _, documents in results:
+                for document in documents:
+                    yield document
+
+    async def agenerate(
+        self,
+        target: Path,
+        *,
+        inventory_file: Path | None = None,
+        search_index_file: Path | None = None,
+        navigation: bool = False,
+        concurrency: int = 1,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Writes Markdown files to a target directory without blocking the event loop.
+
+        Rendering and file writes run in an executor, and files are written in the same order and with the same content
+        as with :meth:`generate`. Cancelling the task stops generation between modules; a module whose rendering has
+        already started in a thread runs to completion, but its documents are discarded.
+
+        :param target: Directory to write Markdown files to.
+        :param inventory_file: If given, a JSON link inventory of all objects documented is written to this file.
+        :param search_index_file: If given, a JSON search index of all symbols documented is written to this file.
+        :param navigation: Whether to write `SUMMARY.md` and an index page `README.md` for each package.
+        :param concurrency: Maximum number of modules to render at the same time.
+        :param executor: Executor to render modules and write files in (default: the default executor of the event loop).
+        """
+
+        loop = asyncio.get_running_loop()
+        output = _OutputWriter(target, [module.__name__ for module in self.modules])
+        async with contextlib.aclosing(self._arender_modules(concurrency, executor)) as results:
+            async for module, documents in results:
+                await loop.run_in_executor(executor, output.write, module.__name__, documents)
+        await loop.run_in_executor(
+            executor,
+            functools.partial(output.finish, inventory_file=inventory_file, search_index_file=search_index_file, navigation=navigation),
+        )
+
+
+def generate_markdown(
+    modules: list[ModuleType],
+    out_dir: Path,
+    *,
+    options: MarkdownOptions | None = None,
+    inventory_file: Path | None = None,
+    search_index_file: Path | None = None,
+    navigation: bool = False,
+    threads: int = 1,
+) -> None:
     """
     Generates Markdown documentation for a list of modules.
 
     :param modules: The list of modules to generate documentation for.
     :param out_dir: Directory to write Markdown files to.
     :param options: Options for generating Markdown output.
+    :param inventory_file: If given, a JSON link inventory of all objects documented is written to this file.
+    :param search_index_file: If given, a JSON search index of all symbols documented is written to this file.
+    :param navigation: Whether to write `SUMMARY.md` and an index page `README.md` for each package.
+    :param threads: Number of threads rendering modules, and number of threads rendering classes and functions.
     """
 
     if not modules:
@@ -909,4 +2090,10 @@ def generate_markdown(modules: list[ModuleType], out_dir: Path, *, options: Mark
     if options is None:
         options = MarkdownOptions()
 
-    MarkdownGenerator(modules, options=options).generate(out_dir)
+    MarkdownGenerator(modules, options=options).generate(
+        out_dir,
+        inventory_file=inventory_file,
+        search_index_file=search_index_file,
+        navigation=navigation,
+        threads=threads,
+    )
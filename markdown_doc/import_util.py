@@ -6,10 +6,26 @@ Copyright 2024-2026, Levente Hunyadi
 :see: https://github.com/hunyadi/markdown_doc
 """
 
+import concurrent.futures
+import contextlib
+import fnmatch
 import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import itertools
+import json
 import os
+import py_compile
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from types import ModuleType
+from typing import Any, Iterable, Iterator, Sequence
+
+from .memory import MemoryProfiler
 
 
 def module_path(root_path: Path, abs_path: Path) -> str:
@@ -18,12 +34,207 @@ def module_path(root_path: Path, abs_path: Path) -> str:
     return abs_path.relative_to(root_path).as_posix().replace("/", ".")
 
 
-def import_modules(root_path: Path, scan_path: Path) -> list[ModuleType]:
+class ModuleFilter:
     """
-    Recurses into the specified directory to import all Python modules within.
+    Selects modules by matching their qualified name against include and exclude patterns.
+
+    Patterns are glob patterns (e.g. `*.tests`) by default. Patterns that start with `re:` are interpreted as regular
+    expressions (e.g. `re:.*\\.migrations(\\..*)?`), which must match the entire qualified name.
+
+    :param include: If given, only modules whose name matches one of these patterns are imported.
+    :param exclude: Modules whose name matches one of these patterns are skipped, together with their sub-modules.
+    """
+
+    include: list[re.Pattern[str]]
+    exclude: list[re.Pattern[str]]
+
+    def __init__(self, include: Iterable[str] | None = None, exclude: Iterable[str] | None = None) -> None:
+        self.include = [self._compile(pattern) for pattern in include or []]
+        self.exclude = [self._compile(pattern) for pattern in exclude or []]
+
+    @staticmethod
+    def _compile(pattern: str) -> re.Pattern[str]:
+        if pattern.startswith("re:"):
+            return re.compile(pattern.removeprefix("re:"))
+        else:
+            return re.compile(fnmatch.translate(pattern))
+
+    def is_excluded(self, qualified_name: str) -> bool:
+        "True if the module (and all of its sub-modules) are to be skipped."
+
+        return any(regex.fullmatch(qualified_name) for regex in self.exclude)
+
+    def is_included(self, qualified_name: str) -> bool:
+        "True if the module is to be imported."
+
+        if self.is_excluded(qualified_name):
+            return False
+        if not self.include:
+            return True
+        return any(regex.fullmatch(qualified_name) for regex in self.include)
+
+
+@dataclass
+class ImportTiming:
+    """
+    Time spent importing a single module.
+
+    :param name: Qualified name of the module.
+    :param parent: Qualified name of the module whose import triggered this import, or `None` for a top-level import.
+    :param self_time: Time (in seconds) spent finding and executing the module, excluding nested imports.
+    :param cumulative_time: Time (in seconds) spent finding and executing the module, including nested imports.
+    """
+
+    name: str
+    parent: str | None
+    self_time: float
+    cumulative_time: float
+
+
+class _TimingLoader(importlib.abc.Loader):
+    "Wraps a loader to measure the time it takes to execute a module."
+
+    loader: importlib.abc.Loader
+    profiler: "ImportProfiler"
+
+    def __init__(self, loader: importlib.abc.Loader, profiler: "ImportProfiler") -> None:
+        self.loader = loader
+        self.profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.loader, name)
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> ModuleType | None:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        # hide the wrapper from the module being executed
+        module.__loader__ = self.loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self.loader
+
+        self.profiler._exec_module(self.loader, module)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    "Delegates to the other meta path finders, and wraps the loader they return."
+
+    profiler: "ImportProfiler"
+
+    def __init__(self, profiler: "ImportProfiler") -> None:
+        self.profiler = profiler
+
+    def find_spec(self, fullname: str, path: Sequence[str] | None, target: ModuleType | None = None) -> importlib.machinery.ModuleSpec | None:
+        start = time.perf_counter()
+        spec: importlib.machinery.ModuleSpec | None = None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+
+        spec.loader = _TimingLoader(spec.loader, self.profiler)
+        self.profiler._find_times[fullname] = time.perf_counter() - start
+        return spec
+
+
+class ImportProfiler:
+    """
+    Records self and cumulative import time for each module imported while the profiler is active.
+
+    Similar to `python -X importtime` but restricted to the imports that take place in the scope of the profiler,
+    e.g. those triggered by :func:`import_modules`. Modules already imported before the profiler is activated are not
+    recorded.
+    """
+
+    timings: list[ImportTiming]
+    _find_times: dict[str, float]
+    _stack: list[tuple[str, float]]
+    _finder: _TimingFinder
+    _active: int
+
+    def __init__(self) -> None:
+        self.timings = []
+        self._find_times = {}
+        self._stack = []
+        self._finder = _TimingFinder(self)
+        self._active = 0
+
+    def __enter__(self) -> "ImportProfiler":
+        if self._active == 0:
+            sys.meta_path.insert(0, self._finder)
+        self._active += 1
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._active -= 1
+        if self._active == 0:
+            sys.meta_path.remove(self._finder)
+
+    def _exec_module(self, loader: importlib.abc.Loader, module: ModuleType) -> None:
+        "Executes a module, and records how much time it took, accounting for nested imports."
+
+        name = module.__name__
+        parent = self._stack[-1][0] if self._stack else None
+        self._stack.append((name, 0.0))
+        start = time.perf_counter()
+        try:
+            loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            _, nested_time = self._stack.pop()
+            cumulative_time = elapsed + self._find_times.pop(name, 0.0)
+            if self._stack:
+                parent_name, parent_nested_time = self._stack[-1]
+                self._stack[-1] = (parent_name, parent_nested_time + cumulative_time)
+            self.timings.append(ImportTiming(name, parent, cumulative_time - nested_time, cumulative_time))
+
+    def sorted_timings(self) -> list[ImportTiming]:
+        "Import timings in decreasing order of cumulative time."
+
+        return sorted(self.timings, key=lambda t: (-t.cumulative_time, t.name))
+
+    def report(self, limit: int | None = None) -> str:
+        """
+        Produces a human-readable report of import times.
+
+        :param limit: Maximum number of modules to include in the report.
+        """
+
+        lines = [f"{'cumulative [ms]':>16} {'self [ms]':>10}  module"]
+        for timing in self.sorted_timings()[:limit]:
+            lines.append(f"{timing.cumulative_time * 1000:16.3f} {timing.self_time * 1000:10.3f}  {timing.name}")
+        return "\n".join(lines)
+
+    def write_json(self, path: Path) -> None:
+        "Writes import timings to a JSON file in decreasing order of cumulative time."
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([asdict(timing) for timing in self.sorted_timings()], f, indent=4)
+
+
+def walk_modules(
+    root_path: Path,
+    scan_path: Path,
+    *,
+    include: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+) -> Iterator[tuple[str, Path]]:
+    """
+    Recurses into the specified directory to enumerate all Python modules within, without importing them.
+
+    Only directories with an `__init__.py` file are entered, and directories whose name starts with `.` are skipped.
+    Excluded packages are pruned while walking the directory tree, i.e. neither the package nor any of its sub-modules
+    are traversed.
 
     :param root_path: The directory to act as `PYTHONPATH`.
     :param scan_path: The sub-directory to recurse into.
+    :param include: Glob (or `re:` prefixed regular expression) patterns of qualified module names to enumerate.
+    :param exclude: Glob (or `re:` prefixed regular expression) patterns of qualified module names to skip.
+    :returns: Pairs of qualified module name and absolute path to the module source file.
     """
 
     root_path = root_path.absolute()
@@ -33,37 +244,196 @@ def import_modules(root_path: Path, scan_path: Path) -> list[ModuleType]:
     if not scan_path.is_dir():
         raise ValueError("expected: a directory to scan")
 
-    modules: list[ModuleType] = []
+    module_filter = ModuleFilter(include, exclude)
+
     for dir_path, dir_names, file_names in os.walk(str(scan_path), topdown=True):
         if "__init__.py" not in file_names:  # not a Python module
             dir_names[:] = []
             continue
 
+        base_path = Path(dir_path)
+        qualified_name = module_path(root_path, base_path)
+        if module_filter.is_excluded(qualified_name):
+            dir_names[:] = []
+            continue
+
         recurse_into: list[str] = []
         for dir_name in dir_names:
-            if not dir_name.startswith("."):
-                recurse_into.append(dir_name)
+            if dir_name.startswith("."):
+                continue
+            if module_filter.is_excluded(f"{qualified_name}.{dir_name}"):
+                continue
+            recurse_into.append(dir_name)
         dir_names[:] = recurse_into
 
-        # import self
-        base_path = Path(dir_path)
-        qualified_name = module_path(root_path, base_path)
-        try:
-            module = importlib.import_module(qualified_name)
-            modules.append(module)
-        except ModuleNotFoundError:
-            pass
+        # package itself
+        if module_filter.is_included(qualified_name):
+            yield qualified_name, base_path / "__init__.py"
 
-        # import child modules
+        # child modules
         for file_name in file_names:
             if file_name.startswith("__") or not file_name.endswith(".py"):
                 continue
 
             qualified_name = module_path(root_path, base_path / file_name.removesuffix(".py"))
+            if module_filter.is_included(qualified_name):
+                yield qualified_name, base_path / file_name
+
+
+def import_modules(
+    root_path: Path,
+    scan_path: Path,
+    *,
+    include: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+    profiler: ImportProfiler | None = None,
+    memory_profiler: MemoryProfiler | None = None,
+) -> list[ModuleType]:
+    """
+    Recurses into the specified directory to import all Python modules within.
+
+    Excluded packages are pruned while walking the directory tree, i.e. neither the package nor any of its sub-modules
+    are imported or traversed.
+
+    :param root_path: The directory to act as `PYTHONPATH`.
+    :param scan_path: The sub-directory to recurse into.
+    :param include: Glob (or `re:` prefixed regular expression) patterns of qualified module names to import.
+    :param exclude: Glob (or `re:` prefixed regular expression) patterns of qualified module names to skip.
+    :param profiler: If given, records the time it takes to import each module.
+    :param memory_profiler: If given, records the memory allocated while importing each module.
+    """
+
+    modules: list[ModuleType] = []
+    with profiler if profiler is not None else contextlib.nullcontext():
+        for qualified_name, _ in walk_modules(root_path, scan_path, include=include, exclude=exclude):
             try:
-                module = importlib.import_module(qualified_name)
+                with memory_profiler.measure(qualified_name, "import") if memory_profiler is not None else contextlib.nullcontext():
+                    module = importlib.import_module(qualified_name)
                 modules.append(module)
             except ModuleNotFoundError:
                 pass
 
     return modules
+
+
+@dataclass
+class CompileReport:
+    """
+    Outcome of compiling Python source files to bytecode.
+
+    :param compiled: Number of source files compiled to bytecode.
+    :param up_to_date: Number of source files whose cached bytecode was already up to date.
+    :param failed: Source files that could not be compiled, e.g. due to a syntax error.
+    :param compile_time: Time (in seconds) spent compiling summed across all workers, i.e. the time a serial import would spend compiling.
+    :param elapsed_time: Wall-clock time (in seconds) spent compiling in parallel.
+    """
+
+    compiled: int
+    up_to_date: int
+    failed: list[Path]
+    compile_time: float
+    elapsed_time: float
+
+    @property
+    def saved_time(self) -> float:
+        "Time (in seconds) saved by compiling in parallel instead of compiling serially on import."
+
+        return max(self.compile_time - self.elapsed_time, 0.0)
+
+    def __str__(self) -> str:
+        return (
+            f"compiled {self.compiled} module(s) in {self.elapsed_time:.3f} s "
+            f"({self.up_to_date} up to date, {len(self.failed)} failed); "
+            f"serial compilation would take {self.compile_time:.3f} s, saved {self.saved_time:.3f} s"
+        )
+
+
+def _is_bytecode_up_to_date(source_path: str, cache_path: str) -> bool:
+    "True if the cached bytecode file has a timestamp-based header that matches the source file."
+
+    try:
+        with open(cache_path, "rb") as f:
+            header = f.read(16)
+    except OSError:
+        return False
+
+    stat = os.stat(source_path)
+    expected = (
+        importlib.util.MAGIC_NUMBER
+        + (0).to_bytes(4, "little")
+        + (int(stat.st_mtime) & 0xFFFFFFFF).to_bytes(4, "little")
+        + (stat.st_size & 0xFFFFFFFF).to_bytes(4, "little")
+    )
+    return header == expected
+
+
+def _compile_source(source_path: str, optimize: int) -> tuple[bool, float, bool]:
+    """
+    Compiles a single source file to bytecode unless cached bytecode is up to date.
+
+    Invoked in a worker process.
+
+    :returns: A tuple of whether the file has been compiled, the time spent compiling, and whether compilation succeeded.
+    """
+
+    cache_path = importlib.util.cache_from_source(source_path, optimization=optimize if optimize > 0 else "")
+    if _is_bytecode_up_to_date(source_path, cache_path):
+        return False, 0.0, True
+
+    start = time.perf_counter()
+    try:
+        py_compile.compile(
+            source_path,
+            cfile=cache_path,
+            doraise=True,
+            optimize=optimize,
+            invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP,
+        )
+        success = True
+    except py_compile.PyCompileError:
+        success = False
+    return True, time.perf_counter() - start, success
+
+
+def compile_modules(
+    root_path: Path,
+    scan_path: Path,
+    *,
+    include: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+    workers: int | None = None,
+) -> CompileReport:
+    """
+    Compiles Python modules in a directory to bytecode in parallel, ahead of importing them.
+
+    Walks the same directory tree as :func:`import_modules`. When modules are subsequently imported, the import system
+    loads the cached bytecode instead of compiling source code serially.
+
+    :param root_path: The directory to act as `PYTHONPATH`.
+    :param scan_path: The sub-directory to recurse into.
+    :param include: Glob (or `re:` prefixed regular expression) patterns of qualified module names to compile.
+    :param exclude: Glob (or `re:` prefixed regular expression) patterns of qualified module names to skip.
+    :param workers: Number of worker processes (default: number of processors).
+    """
+
+    source_paths = [path for _, path in walk_modules(root_path, scan_path, include=include, exclude=exclude)]
+
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                _compile_source,
+                [str(path) for path in source_paths],
+                itertools.repeat(sys.flags.optimize),
+                chunksize=max(1, len(source_paths) // (4 * (workers or os.cpu_count() or 1))),
+            )
+        )
+    elapsed_time = time.perf_counter() - start
+
+    return CompileReport(
+        compiled=sum(1 for compiled, _, _ in results if compiled),
+        up_to_date=sum(1 for compiled, _, _ in results if not compiled),
+        failed=[path for path, (_, _, success) in zip(source_paths, results, strict=True) if not success],
+        compile_time=sum(compile_time for _, compile_time, _ in results),
+        elapsed_time=elapsed_time,
+    )
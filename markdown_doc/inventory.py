@@ -0,0 +1,224 @@
+"""
+Generate Markdown documentation from Python code
+
+Copyright 2024-2026, Levente Hunyadi
+
+:see: https://github.com/hunyadi/markdown_doc
+"""
+
+import json
+import re
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+_SPHINX_ROLES = {
+    "py:module": "module",
+    "py:class": "class",
+    "py:exception": "class",
+    "py:function": "function",
+    "py:decorator": "function",
+    "py:method": "method",
+    "py:classmethod": "method",
+    "py:staticmethod": "method",
+    "py:attribute": "attribute",
+    "py:property": "attribute",
+    "py:data": "data",
+}
+
+_SPHINX_LINE_REGEX = re.compile(r"(.+?)\s+(\S+)\s+(-?\d+)\s+?(\S*)\s+(.*)")
+
+
+@dataclass(frozen=True)
+class InventoryEntry:
+    """
+    An object documented outside of the current batch of modules.
+
+    :param name: Fully-qualified name of the object.
+    :param kind: Kind of object, e.g. `module`, `class`, `function` or `method`.
+    :param url: Link to the documentation of the object.
+    """
+
+    name: str
+    kind: str
+    url: str
+
+    @property
+    def short_name(self) -> str:
+        "Display name of the object: the full name for modules, and the last component of the qualified name otherwise."
+
+        if self.kind == "module":
+            return self.name
+        else:
+            return self.name.rsplit(".", 1)[-1]
+
+
+@dataclass(frozen=True, order=True)
+class InventoryItem:
+    """
+    An object documented in a generated Markdown file, as recorded in a JSON link inventory.
+
+    :param name: Fully-qualified name of the object.
+    :param kind: Kind of object, i.e. `module`, `class`, `function` or `method`.
+    :param path: Path of the Markdown file relative to the output directory (in POSIX notation).
+    :param anchor: Anchor of the object within the Markdown file.
+    """
+
+    name: str
+    kind: str
+    path: str
+    anchor: str
+
+
+def write_inventory(items: Iterable[InventoryItem], path: Path) -> None:
+    """
+    Writes a JSON link inventory, which downstream projects can load to link to objects without importing them.
+
+    :param items: Objects documented in generated Markdown files.
+    :param path: Path of the JSON file to write.
+    """
+
+    # an object (e.g. a module heading repeated in each partition) is linked to the first file it is documented in
+    objects: dict[str, list[str]] = {}
+    for item in sorted(items):
+        objects.setdefault(item.name, [item.name, item.kind, item.path, item.anchor])
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "objects": list(objects.values())}, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def _join_url(base_url: str, path: str) -> str:
+    "Joins a base URL (or a relative path) and a relative path."
+
+    if not base_url or base_url.endswith("/"):
+        return f"{base_url}{path}"
+    else:
+        return f"{base_url}/{path}"
+
+
+class Inventory:
+    """
+    Maps fully-qualified names of objects documented elsewhere to links, without importing the modules they are defined in.
+
+    Entries are indexed by top-level package such that names in packages the inventory knows nothing about are rejected
+    with a single lookup.
+
+    Inventories may be loaded from Sphinx `objects.inv` files, or from the JSON link inventory written when generating
+    documentation.
+    """
+
+    packages: dict[str, dict[str, InventoryEntry]]
+
+    def __init__(self, entries: Iterable[InventoryEntry] = ()) -> None:
+        self.packages = {}
+        for entry in entries:
+            self.add(entry)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.packages.values())
+
+    def add(self, entry: InventoryEntry) -> None:
+        "Adds an entry to the inventory. The first entry added for a name takes precedence."
+
+        package = entry.name.split(".", 1)[0]
+        self.packages.setdefault(package, {}).setdefault(entry.name, entry)
+
+    def lookup(self, name: str) -> InventoryEntry | None:
+        """
+        Looks up an object by its fully-qualified name.
+
+        :param name: The fully-qualified name of a module, class or function.
+        :returns: The inventory entry, or `None` if the object is not in the inventory.
+        """
+
+        entries = self.packages.get(name.split(".", 1)[0])
+        if entries is None:
+            return None
+        return entries.get(name)
+
+    def find(self, module_name: str, qualname: str) -> InventoryEntry | None:
+        """
+        Looks up a class or function, trying the module it is defined in first, and then each parent package.
+
+        Packages often document objects under the name they are re-exported with (e.g. `pkg.Class`) rather than the
+        module they are defined in (e.g. `pkg.sub._impl.Class`).
+
+        :param module_name: Qualified name of the module the object is defined in.
+        :param qualname: Qualified name of the object within the module.
+        """
+
+        entries = self.packages.get(module_name.split(".", 1)[0])
+        if entries is None:
+            return None
+
+        parts = module_name.split(".")
+        for count in range(len(parts), 0, -1):
+            entry = entries.get(f"{'.'.join(parts[:count])}.{qualname}")
+            if entry is not None:
+                return entry
+        return None
+
+    @staticmethod
+    def load(path: Path, base_url: str) -> "Inventory":
+        """
+        Loads an inventory from a local file, detecting the file format automatically.
+
+        :param path: Path to a Sphinx `objects.inv` file or a JSON link inventory.
+        :param base_url: URL (or relative path) that links in the inventory are relative to.
+        """
+
+        with open(path, "rb") as f:
+            data = f.read()
+        if data.startswith(b"# Sphinx inventory"):
+            return Inventory.from_sphinx(data, base_url)
+        else:
+            return Inventory.from_json(json.loads(data), base_url)
+
+    @staticmethod
+    def from_sphinx(data: bytes, base_url: str) -> "Inventory":
+        """
+        Parses a Sphinx inventory (version 2), keeping objects in the Python domain.
+
+        :param data: Contents of an `objects.inv` file.
+        :param base_url: URL (or relative path) that links in the inventory are relative to.
+        """
+
+        lines = data.split(b"\n", 4)
+        if len(lines) < 5 or lines[0].rstrip() != b"# Sphinx inventory version 2":
+            raise ValueError("expected: Sphinx inventory version 2")
+        if b"zlib" not in lines[3]:
+            raise ValueError("expected: Sphinx inventory compressed with zlib")
+
+        inventory = Inventory()
+        for line in zlib.decompress(lines[4]).decode("utf-8").splitlines():
+            m = _SPHINX_LINE_REGEX.fullmatch(line.rstrip())
+            if m is None:
+                continue
+            name, role, _, uri, _ = m.groups()
+            kind = _SPHINX_ROLES.get(role)
+            if kind is None:
+                continue
+            if uri.endswith("$"):
+                uri = uri[:-1] + name
+            inventory.add(InventoryEntry(name, kind, _join_url(base_url, uri)))
+        return inventory
+
+    @staticmethod
+    def from_json(data: Any, base_url: str) -> "Inventory":
+        """
+        Parses a JSON link inventory.
+
+        The inventory is an object with a list `objects`, each item of which is a list of fully-qualified name, kind,
+        relative path of the Markdown file and anchor within the file, as written by :func:`write_inventory`.
+
+        :param data: JSON object.
+        :param base_url: URL (or relative path) of the directory that Markdown files in the inventory are relative to.
+        """
+
+        if not isinstance(data, dict) or not isinstance(data.get("objects"), list):
+            raise ValueError("expected: JSON link inventory with a list of objects")
+
+        inventory = Inventory()
+        for name, kind, path, anchor in data["objects"]:
+            inventory.add(InventoryEntry(name, kind, f"{_join_url(base_url, path)}#{anchor}"))
+        return inventory
@@ -0,0 +1,243 @@
+"""
+Generate Markdown documentation from Python code
+
+Copyright 2024-2026, Levente Hunyadi
+
+:see: https://github.com/hunyadi/markdown_doc
+"""
+
+import importlib
+import multiprocessing
+import multiprocessing.context
+import multiprocessing.queues
+import queue
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .generator import MarkdownDocument, MarkdownGenerator, MarkdownOptions, _OutputWriter
+
+if sys.platform != "win32":
+    import resource
+
+if TYPE_CHECKING:
+    ResultQueue = multiprocessing.queues.Queue[Any]
+else:
+    ResultQueue = multiprocessing.queues.Queue
+
+
+class IsolatedWorkerError(RuntimeError):
+    "Raised when a worker process fails to generate documentation for a module."
+
+
+@dataclass
+class _Documents:
+    """
+    Sent by a worker when documentation for a module is ready.
+
+    :param module_name: Qualified name of the module documented.
+    :param documents: Markdown documents generated for the module.
+    """
+
+    module_name: str
+    documents: list[MarkdownDocument]
+
+
+@dataclass
+class _Finished:
+    """
+    Sent by a worker as its last message.
+
+    :param worker_id: Identifies the worker process.
+    :param remaining: Modules the worker has not processed because it exceeded its memory ceiling.
+    """
+
+    worker_id: int
+    remaining: list[str]
+
+
+@dataclass
+class _Failed:
+    """
+    Sent by a worker as its last message when processing a module fails.
+
+    :param worker_id: Identifies the worker process.
+    :param module_name: Qualified name of the module that failed to be documented.
+    :param message: Error message.
+    :param cause: Error message of the exception that caused the error, if any.
+    """
+
+    worker_id: int
+    module_name: str
+    message: str
+    cause: str | None
+
+
+def _peak_memory() -> int | None:
+    "Peak resident set size of the current process in bytes, or `None` if not available on the platform."
+
+    if sys.platform == "win32":
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return max_rss  # bytes
+    else:
+        return max_rss * 1024  # kilobytes
+
+
+def _worker(
+    worker_id: int,
+    module_names: list[str],
+    batch: list[str],
+    options: MarkdownOptions,
+    max_memory: int | None,
+    results: ResultQueue,
+) -> None:
+    "Imports and documents a subset of modules in a child process, streaming rendered documents back to the parent."
+
+    generator = MarkdownGenerator([], options=options, batch=batch)
+    for index, module_name in enumerate(module_names):
+        try:
+            module = importlib.import_module(module_name)
+            documents = generator.render(module)
+        except BaseException as e:
+            # includes `SystemExit` raised by a module that calls `sys.exit` at import
+            message = str(e) if isinstance(e, Exception) else repr(e)
+            results.put(_Failed(worker_id, module_name, message, str(e.__cause__) if e.__cause__ is not None else None))
+            return
+
+        results.put(_Documents(module_name, documents))
+
+        if max_memory is not None:
+            peak_memory = _peak_memory()
+            if peak_memory is not None and peak_memory > max_memory:
+                results.put(_Finished(worker_id, module_names[index + 1 :]))
+                return
+
+    results.put(_Finished(worker_id, []))
+
+
+class IsolatedGenerator:
+    """
+    Generates Markdown documentation in child processes, each of which imports and documents a subset of modules.
+
+    Isolation bounds the memory footprint of documentation builds for code bases whose modules leak memory or load
+    large data at import time. The parent process never imports the modules; it only receives rendered documents.
+    Worker processes are recycled after processing a number of modules or when they exceed a memory ceiling, similar
+    to `maxtasksperchild` in `multiprocessing.pool.Pool`.
+    """
+
+    module_names: list[str]
+    options: MarkdownOptions
+    workers: int
+    max_modules_per_worker: int | None
+    max_memory: int | None
+
+    def __init__(
+        self,
+        module_names: list[str],
+        *,
+        options: MarkdownOptions | None = None,
+        workers: int | None = None,
+        max_modules_per_worker: int | None = None,
+        max_memory: int | None = None,
+    ) -> None:
+        """
+        Instantiates a generator that runs in isolated worker processes.
+
+        :param module_names: Qualified names of modules to generate documentation for.
+        :param options: Options for generating Markdown output.
+        :param workers: Number of worker processes running at the same time (default: number of processors).
+        :param max_modules_per_worker: Number of modules a worker process documents before it is replaced with a new one.
+        :param max_memory: Peak resident set size (in bytes) above which a worker process is replaced with a new one.
+        """
+
+        if max_modules_per_worker is not None and max_modules_per_worker < 1:
+            raise ValueError("expected: a positive number of modules per worker")
+
+        self.module_names = module_names
+        self.options = options if options is not None else MarkdownOptions()
+        self.workers = workers if workers is not None else (multiprocessing.cpu_count() or 1)
+        self.max_modules_per_worker = max_modules_per_worker
+        self.max_memory = max_memory
+
+    def _chunks(self) -> list[list[str]]:
+        "Splits the list of modules into subsets, each of which is assigned to a worker process."
+
+        if self.max_modules_per_worker is not None:
+            size = self.max_modules_per_worker
+        else:
+            size = max(1, -(-len(self.module_names) // self.workers))
+        return [self.module_names[i : i + size] for i in range(0, len(self.module_names), size)]
+
+    def generate(self, target: Path, *, inventory_file: Path | None = None, search_index_file: Path | None = None, navigation: bool = False) -> None:
+        """
+        Writes Markdown files to a target directory as worker processes stream back rendered documents.
+
+        The subdirectories that files are written to match the hierarchy of the Python modules.
+
+        :param target: Directory to write Markdown files to.
+        :param inventory_file: If given, a JSON link inventory of all objects documented is written to this file.
+        :param search_index_file: If given, a JSON search index of all symbols documented is written to this file.
+        :param navigation: Whether to write `SUMMARY.md` and an index page `README.md` for each package.
+        """
+
+        context = multiprocessing.get_context("spawn")
+        results: ResultQueue = context.Queue()
+        pending = self._chunks()
+        running: dict[int, multiprocessing.context.SpawnProcess] = {}
+        chunks: dict[int, list[str]] = {}
+        exited: set[int] = set()
+        worker_count = 0
+        output = _OutputWriter(target, self.module_names)
+
+        try:
+            while pending or running:
+                while pending and len(running) < self.workers:
+                    worker_count += 1
+                    chunks[worker_count] = pending.pop(0)
+                    process = context.Process(
+                        target=_worker,
+                        args=(worker_count, chunks[worker_count], self.module_names, self.options, self.max_memory, results),
+                        daemon=True,
+                    )
+                    process.start()
+                    running[worker_count] = process
+
+                try:
+                    message = results.get(timeout=1.0)
+                except queue.Empty:
+                    # a worker sends a final message before it exits, which is read by the time the queue is found empty
+                    # again; a worker still running that has exited by then has ended without a final message (e.g. a
+                    # module called `os._exit` at import), whatever its exit code
+                    for worker_id in exited:
+                        if worker_id in running:
+                            process = running[worker_id]
+                            modules = ", ".join(f"`{module_name}`" for module_name in chunks[worker_id])
+                            raise IsolatedWorkerError(
+                                f"worker process terminated unexpectedly with exit code {process.exitcode} while processing modules {modules}"
+                            ) from None
+                    exited = {worker_id for worker_id, process in running.items() if not process.is_alive()}
+                    continue
+
+                if isinstance(message, _Documents):
+                    output.write(message.module_name, message.documents)
+                elif isinstance(message, _Finished):
+                    running.pop(message.worker_id).join()
+                    if message.remaining:
+                        pending.insert(0, message.remaining)
+                elif isinstance(message, _Failed):
+                    running.pop(message.worker_id).join()
+                    error = IsolatedWorkerError(f"error while processing module `{message.module_name}`: {message.message}")
+                    if message.cause is not None:
+                        raise error from IsolatedWorkerError(message.cause)
+                    raise error
+        finally:
+            for process in running.values():
+                process.terminate()
+            for process in running.values():
+                process.join()
+
+        output.finish(inventory_file=inventory_file, search_index_file=search_index_file, navigation=navigation)
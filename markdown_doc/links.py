@@ -0,0 +1,292 @@
+"""
+Generate Markdown documentation from Python code
+
+Copyright 2024-2026, Levente Hunyadi
+
+:see: https://github.com/hunyadi/markdown_doc
+"""
+
+import logging
+import re
+
+_TOP_LEVEL_DOMAINS = frozenset(
+    """
+    com net org edu gov mil aero asia biz cat coop info int jobs mobi museum name post pro tel travel xxx
+    ac ad ae af ag ai al am an ao aq ar as at au aw ax az ba bb bd be bf bg bh bi bj bm bn bo br bs bt bv bw
+    by bz ca cc cd cf cg ch ci ck cl cm cn co cr cs cu cv cx cy cz dd de dj dk dm do dz ec ee eg eh er es et
+    eu fi fj fk fm fo fr ga gb gd ge gf gg gh gi gl gm gn gp gq gr gs gt gu gw gy hk hm hn hr ht hu id ie il
+    im in io iq ir is it je jm jo jp ke kg kh ki km kn kp kr kw ky kz la lb lc li lk lr ls lt lu lv ly ma mc
+    md me mg mh mk ml mm mn mo mp mq mr ms mt mu mv mw mx my mz na nc ne nf ng ni nl no np nr nu nz om pa pe
+    pf pg ph pk pl pm pn pr ps pt pw py qa re ro rs ru rw sa sb sc sd se sg sh si sj sk sl sm sn so sr ss st
+    su sv sx sy sz tc td tf tg th tj tk tl tm tn to tp tr tt tv tw tz ua ug uk us uy uz va vc ve vg vi vn vu
+    wf ws ye yt yu za zm zw
+    """.split()
+)
+
+_ALNUM = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+_AFTER_SCHEME = _ALNUM | frozenset("%")
+
+# characters of domain names (including separators)
+_DOMAIN_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789.-"
+_DOMAIN_RUN_REGEX = re.compile(r"[a-z0-9.\-]*")
+
+# labels of letters and digits separated by a single dot or hyphen (no two ways to match, so no backtracking)
+_DOMAIN_CHAIN_REGEX = re.compile(r"[a-z0-9]+(?:[.\-][a-z0-9]+)*")
+
+# a label of letters and digits
+_LABEL_REGEX = re.compile(r"[a-z0-9]*")
+
+# the part of a URL that follows the scheme or domain name: characters allowed in a URL and balanced parentheses
+# (nested at most two levels deep), ending with a balanced pair of parentheses or a character that is not a punctuation
+# mark; the pattern has a single way to match any prefix of the text, so backing off to the last possible end takes
+# time linear in the length of the match
+_URL_PATH_REGEX = re.compile(
+    r"""
+    [^\s()<>{}\[\]]*
+    (?:\([^\s()]*(?:\([^\s()]*\)[^\s()]*)*\)[^\s()<>{}\[\]]*)*
+    (?:\([^\s()]*(?:\([^\s()]*\)[^\s()]*)*\)|[^\s`!()\[\]{};:'".,<>?«»“”‘’])
+    """,
+    re.VERBOSE,
+)
+
+# the scheme of a URL followed by up to three slashes
+_SCHEME_REGEX = re.compile(r"https?:(/{0,3})")
+
+# a position where a URL may start: a word boundary followed by a character that may start a domain name
+_URL_START_REGEX = re.compile(r"\b(?=[a-z0-9.\-])")
+
+# every URL contains a scheme, or a top-level domain that is not followed by a letter or digit
+_URL_HINT_REGEX = re.compile(r"https?:|[.]([a-z]{2,6})(?![a-z0-9])")
+
+_WHITESPACE_REGEX = re.compile(r"\s")
+
+
+def _find_hint(text: str, start: int, end: int) -> int | None:
+    "Finds the first position in a range of text that may be part of a URL."
+
+    while (m := _URL_HINT_REGEX.search(text, start, end)) is not None:
+        domain = m.group(1)
+        if domain is None or domain in _TOP_LEVEL_DOMAINS:
+            return m.start()
+        start = m.start() + 1
+    return None
+
+
+def _is_word(text: str, index: int) -> bool:
+    "True if the character at the index is a word character (as in regular expression `\\w`)."
+
+    if index < 0 or index >= len(text):
+        return False
+    ch = text[index]
+    return ch.isalnum() or ch == "_"
+
+
+class _UrlScanner:
+    """
+    Finds plain text URLs in a single left-to-right pass.
+
+    The scanner accepts exactly the same URLs as the liberal URL-matching regular expression it replaces, but it
+    evaluates each alternative of the pattern directly, and memoizes the results that the regular expression engine
+    would recompute when backtracking. Matching takes time linear in the length of the text, whereas the regular
+    expression takes quadratic time on long dotted or hyphenated names.
+
+    :param text: Text to scan.
+    """
+
+    text: str
+    paths: dict[int, int | None]
+    domain_run: tuple[int, int, int]
+    domain_chain: tuple[int, int, int | None, int]
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.paths = {}
+        self.domain_run = (-1, -1, -1)
+        self.domain_chain = (-1, -1, None, -1)
+
+    def _path(self, start: int) -> int | None:
+        """
+        Matches the part of a URL that follows the scheme or domain name.
+
+        :returns: The end position of the URL, or `None` if there is no match.
+        """
+
+        end = self.paths.get(start, -1)
+        if end == -1:
+            m = _URL_PATH_REGEX.match(self.text, start)
+            end = m.end() if m is not None else None
+            self.paths[start] = end
+        return end
+
+    def _scheme_url(self, start: int) -> int | None:
+        "Matches a URL that starts with the scheme `http:` or `https:`."
+
+        text = self.text
+        m = _SCHEME_REGEX.match(text, start)
+        if m is None:
+            return None
+
+        colon_end = m.start(1)
+        slashes = m.end(1) - colon_end
+        if slashes > 0:
+            # prefer more slashes, backing off one at a time
+            for count in range(slashes, 0, -1):
+                end = self._path(colon_end + count)
+                if end is not None:
+                    return end
+            return None
+        elif colon_end < len(text) and text[colon_end] in _AFTER_SCHEME:
+            return self._path(colon_end + 1)
+        else:
+            return None
+
+    def _domain_run(self, start: int) -> tuple[int, int]:
+        """
+        Finds the characters of domain names (including separators) that follow the start position.
+
+        :returns: The end position of the run of characters, and the position of the last dot in the run (or -1).
+        """
+
+        run_start, run_end, last_dot = self.domain_run
+        if not run_start <= start < run_end:
+            text = self.text
+            m = _DOMAIN_RUN_REGEX.match(text, start)
+            run_end = m.end() if m is not None else start
+            last_dot = text.rfind(".", start, run_end)
+            self.domain_run = (start, run_end, last_dot)
+        return run_end, last_dot
+
+    def _domain_url(self, start: int, run_end: int, last_dot: int) -> int | None:
+        "Matches a URL that starts with a domain name followed by a slash, given the run of domain name characters."
+
+        if last_dot <= start or self.text[last_dot + 1 : run_end] not in _TOP_LEVEL_DOMAINS:
+            return None
+        return self._path(run_end + 1)
+
+    def _naked_domain(self, start: int) -> int | None:
+        "Matches a naked domain name such as `example.com` that is not part of an e-mail address."
+
+        text = self.text
+        if text[start] not in _ALNUM or (start > 0 and text[start - 1] == "@"):
+            return None
+
+        chain_start, chain_end, match, tld_dot = self.domain_chain
+        if not chain_start <= start < chain_end:
+            chain_end, match, tld_dot = self._scan_domain_chain(start)
+            self.domain_chain = (start, chain_end, match, tld_dot)
+
+        # the domain must include a label before the top-level domain
+        return match if tld_dot > start else None
+
+    def _scan_domain_chain(self, start: int) -> tuple[int, int | None, int]:
+        """
+        Scans labels separated by dots or hyphens, and finds the last label that is a top-level domain.
+
+        :returns: The end position of the chain of labels, the end position of the longest match (if any), and the
+            position of the dot before the top-level domain of the match (or -1).
+        """
+
+        text = self.text
+        m = _DOMAIN_CHAIN_REGEX.match(text, start)
+        chain_end = m.end() if m is not None else start
+
+        # only the last label that is a top-level domain matters, so labels are checked from the end of the chain
+        end = chain_end
+        while (dot := text.rfind(".", start, end)) >= 0:
+            label_start = dot + 1
+            m = _LABEL_REGEX.match(text, label_start)
+            label_end = m.end() if m is not None else label_start
+            end = dot
+            if text[label_start:label_end] not in _TOP_LEVEL_DOMAINS:
+                continue
+            if label_end < chain_end:
+                # followed by a separator and another label
+                return chain_end, label_end, dot
+            if _is_word(text, label_end):
+                continue
+            if text.startswith("/", label_end):
+                return chain_end, label_end + 1 if not text.startswith("@", label_end + 1) else label_end, dot
+            elif not text.startswith("@", label_end):
+                return chain_end, label_end, dot
+        return chain_end, None, -1
+
+    def match(self, start: int, hint: int) -> int | None:
+        """
+        Matches a URL at a position that satisfies the word boundary condition, returning the end position.
+
+        :param start: Position to match at.
+        :param hint: Position of the first scheme or top-level domain at or after the start position.
+        """
+
+        end = self._scheme_url(start)
+        if end is not None:
+            return end
+
+        # a domain name ends in a top-level domain, which is found among the characters of domain names
+        run_end, last_dot = self._domain_run(start)
+        if hint >= run_end:
+            return None
+
+        end = self._domain_url(start, run_end, last_dot) if self.text.startswith("/", run_end) else None
+        if end is None:
+            end = self._naked_domain(start)
+        return end
+
+
+def replace_links(text: str) -> str:
+    """
+    Replaces plain text URLs with Markdown links.
+
+    :param text: String with possible occurrences of URLs.
+    :returns: String with replacements made.
+    """
+
+    hint = _find_hint(text, 0, len(text))
+    if hint is None:
+        return text
+
+    scanner = _UrlScanner(text)
+    parts: list[str] = []
+    position = 0
+    token_end = 0
+    while hint is not None:
+        # a URL that contains the hint either starts with it (a scheme) or with a domain name that runs up to it; the
+        # text between the previous token and the hint is stripped at most once, which keeps the total time linear
+        lower = max(position, token_end)
+        index = lower + len(text[lower:hint].rstrip(_DOMAIN_CHARS))
+
+        # URLs never span whitespace, so only the rest of the whitespace-delimited token that contains the hint is scanned
+        space = _WHITESPACE_REGEX.search(text, hint)
+        token_end = space.start() if space is not None else len(text)
+
+        while (m := _URL_START_REGEX.search(text, index, token_end)) is not None:
+            start = m.start()
+            if start > hint:
+                # a URL starts at or before the first hint it contains
+                hint = _find_hint(text, start, len(text))
+                if hint is None or hint >= token_end:
+                    break
+
+            end = scanner.match(start, hint)
+            if end is None:
+                index = start + 1
+                continue
+
+            url = text[start:end]
+            parts.append(text[position:start])
+            parts.append(f"[{url}]({url})")
+            position = index = end
+
+            # another URL in the same token would contain another hint
+            hint = _find_hint(text, position, len(text))
+            if hint is None or hint >= token_end:
+                break
+        else:
+            hint = _find_hint(text, token_end, len(text))
+
+    if not parts:
+        return text
+
+    logging.debug("%d URL(s) found", len(parts) // 2)
+    parts.append(text[position:])
+    return "".join(parts)
@@ -0,0 +1,174 @@
+"""
+Generate Markdown documentation from Python code
+
+Copyright 2024-2026, Levente Hunyadi
+
+:see: https://github.com/hunyadi/markdown_doc
+"""
+
+import contextlib
+import json
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Literal
+
+MemoryPhase = Literal["import", "render"]
+
+
+@dataclass
+class AllocationSite:
+    """
+    A source line that allocated memory while a module was imported or rendered.
+
+    :param file: Path to the source file.
+    :param line: Line number in the source file.
+    :param size: Memory (in bytes) allocated by the line and still held at the end of the measurement.
+    :param count: Number of memory blocks allocated by the line and still held at the end of the measurement.
+    """
+
+    file: str
+    line: int
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryUsage:
+    """
+    Memory allocated while importing or rendering a single module.
+
+    :param name: Qualified name of the module.
+    :param phase: Whether the module was imported or rendered.
+    :param delta: Memory (in bytes) allocated and still held once the module was imported or rendered.
+    :param peak: Largest memory (in bytes) held at any time while the module was imported or rendered, relative to the start.
+    :param sites: Source lines that allocated the most memory still held, in decreasing order of size.
+    """
+
+    name: str
+    phase: MemoryPhase
+    delta: int
+    peak: int
+    sites: list[AllocationSite] = field(default_factory=list)
+
+
+class MemoryProfiler:
+    """
+    Records how much memory is allocated while importing and rendering each module, using :mod:`tracemalloc`.
+
+    Tracing starts when the profiler is first activated (unless already started elsewhere), and stops when the profiler
+    is deactivated. Memory held once a module is imported includes the memory of modules imported in turn; memory held
+    once a module is rendered includes the documents produced and the entries added to caches of the generator.
+
+    Tracing slows down the program, and finding the top allocation sites takes a snapshot of all traced memory blocks
+    before and after each measurement.
+    """
+
+    usages: list[MemoryUsage]
+    top: int
+    frames: int
+    _active: int
+    _started: bool
+    _peaks: list[int]
+
+    def __init__(self, *, top: int = 10, frames: int = 1) -> None:
+        """
+        Creates a memory profiler.
+
+        :param top: Number of allocation sites to record for each module, or 0 not to record allocation sites.
+        :param frames: Number of stack frames to store for each memory block, of which the innermost one is reported.
+        """
+
+        self.usages = []
+        self.top = top
+        self.frames = frames
+        self._active = 0
+        self._started = False
+        self._peaks = []
+
+    def __enter__(self) -> "MemoryProfiler":
+        if self._active == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+        self._active += 1
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._active -= 1
+        if self._active == 0 and self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)])
+
+    @contextlib.contextmanager
+    def measure(self, name: str, phase: MemoryPhase) -> Iterator[None]:
+        """
+        Records memory allocated in the scope of the context manager.
+
+        Measurements may be nested, e.g. an import that takes place while a module is rendered.
+
+        :param name: Qualified name of the module imported or rendered.
+        :param phase: Whether the module is imported or rendered.
+        """
+
+        with self:
+            before = self._snapshot() if self.top > 0 else None
+
+            # peak memory is tracked globally, so preserve the peak observed so far by an enclosing measurement
+            start, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            self._peaks.append(start)
+            tracemalloc.reset_peak()
+            try:
+                yield
+            finally:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, self._peaks.pop())
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+
+                sites: list[AllocationSite] = []
+                if before is not None:
+                    for stat in self._snapshot().compare_to(before, "lineno")[: self.top]:
+                        if stat.size_diff <= 0:
+                            break
+                        frame = stat.traceback[0]
+                        sites.append(AllocationSite(frame.filename, frame.lineno, stat.size_diff, stat.count_diff))
+
+                self.usages.append(MemoryUsage(name, phase, current - start, peak - start, sites))
+
+    def sorted_usages(self) -> list[MemoryUsage]:
+        "Memory usages in decreasing order of peak memory."
+
+        return sorted(self.usages, key=lambda u: (-u.peak, u.phase, u.name))
+
+    def report(self, limit: int | None = None, sites: int = 3) -> str:
+        """
+        Produces a human-readable report of memory usage.
+
+        :param limit: Maximum number of measurements to include in the report.
+        :param sites: Maximum number of allocation sites to show for each measurement.
+        """
+
+        lines = [f"{'peak [KiB]':>12} {'held [KiB]':>12}  {'phase':<6}  module"]
+        for usage in self.sorted_usages()[:limit]:
+            lines.append(f"{usage.peak / 1024:12.1f} {usage.delta / 1024:12.1f}  {usage.phase:<6}  {usage.name}")
+            for site in usage.sites[:sites]:
+                lines.append(f"{'':>25}  {site.size / 1024:10.1f} KiB in {site.count} block(s) at {site.file}:{site.line}")
+
+        for phase in ("import", "render"):
+            usages = [usage for usage in self.usages if usage.phase == phase]
+            if usages:
+                held = sum(usage.delta for usage in usages)
+                peak = max(usage.peak for usage in usages)
+                lines.append(f"{phase}: {len(usages)} module(s), {held / 1024:.1f} KiB held, largest peak {peak / 1024:.1f} KiB")
+        return "\n".join(lines)
+
+    def write_json(self, path: Path) -> None:
+        "Writes memory usages with their allocation sites to a JSON file in decreasing order of peak memory."
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([asdict(usage) for usage in self.sorted_usages()], f, indent=4)
@@ -0,0 +1,351 @@
+"""
+Generate Markdown documentation from Python code
+
+Copyright 2024-2026, Levente Hunyadi
+
+:see: https://github.com/hunyadi/markdown_doc
+"""
+
+import importlib
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from .generator import MarkdownDocument, MarkdownGenerator, MarkdownOptions, _OutputWriter
+
+
+class PipelineError(RuntimeError):
+    "Raised when a stage of the pipeline fails to process a module."
+
+
+@dataclass
+class StageMetrics:
+    """
+    Throughput and queue statistics of a pipeline stage.
+
+    :param name: Name of the stage.
+    :param workers: Number of threads running the stage.
+    :param items: Number of modules processed.
+    :param busy_time: Total time (in seconds) that threads spent processing modules.
+    :param idle_time: Total time (in seconds) that threads spent waiting for input from the upstream stage.
+    :param blocked_time: Total time (in seconds) that threads spent waiting for room in the queue to the downstream stage.
+    :param max_queue_depth: Largest number of modules waiting in the input queue of the stage.
+    :param total_queue_depth: Sum of the number of modules waiting in the input queue, sampled whenever a module is taken.
+    """
+
+    name: str
+    workers: int
+    items: int = 0
+    busy_time: float = 0.0
+    idle_time: float = 0.0
+    blocked_time: float = 0.0
+    max_queue_depth: int = 0
+    total_queue_depth: int = 0
+
+    @property
+    def mean_queue_depth(self) -> float:
+        "Average number of modules waiting in the input queue of the stage."
+
+        return self.total_queue_depth / self.items if self.items else 0.0
+
+    @property
+    def capacity(self) -> float:
+        "Number of modules the stage could process per second if its threads were never idle or blocked."
+
+        return self.workers * self.items / self.busy_time if self.busy_time > 0.0 else 0.0
+
+    def utilization(self, elapsed: float) -> float:
+        "Fraction of time that the threads of the stage spent processing modules."
+
+        return self.busy_time / (self.workers * elapsed) if elapsed > 0.0 else 0.0
+
+
+@dataclass
+class PipelineMetrics:
+    """
+    Statistics of a pipeline run.
+
+    The stage with the highest utilization is the bottleneck: its input queue tends to be full, the stages upstream
+    are blocked waiting for room in the queue, and the stages downstream are idle waiting for input.
+
+    :param elapsed: Wall-clock time (in seconds) of the run.
+    :param stages: Statistics of each stage, in pipeline order.
+    """
+
+    elapsed: float
+    stages: list[StageMetrics]
+
+    def bottleneck(self) -> StageMetrics:
+        "The stage with the highest utilization."
+
+        return max(self.stages, key=lambda stage: stage.utilization(self.elapsed))
+
+    def report(self) -> str:
+        "Returns a human-readable table of stage statistics."
+
+        lines = [f"{'stage':<10} {'workers':>7} {'modules':>7} {'busy':>8} {'idle':>8} {'blocked':>8} {'util':>6} {'capacity':>10} {'queue':>11}"]
+        for stage in self.stages:
+            lines.append(
+                f"{stage.name:<10} {stage.workers:>7} {stage.items:>7} {stage.busy_time:>7.2f}s {stage.idle_time:>7.2f}s {stage.blocked_time:>7.2f}s "
+                f"{stage.utilization(self.elapsed):>6.0%} {stage.capacity:>8.0f}/s {stage.mean_queue_depth:>5.1f} ≤ {stage.max_queue_depth:<3}"
+            )
+        lines.append(f"elapsed: {self.elapsed:.2f}s, bottleneck: {self.bottleneck().name}")
+        return "\n".join(lines)
+
+
+# marks the end of input to a stage
+_DONE = object()
+
+
+class _Stage:
+    """
+    A stage of the pipeline, with a number of threads taking items from an input queue, processing them and passing the
+    results to an output queue.
+
+    :param name: Name of the stage.
+    :param workers: Number of threads running the stage.
+    :param process: Function that processes an item.
+    :param input: Queue the stage takes items from.
+    :param output: Queue the stage passes results to, or `None` for the last stage.
+    :param failed: Set when any stage fails, after which stages drain their input without processing it.
+    """
+
+    name: str
+    process: Callable[[Any], Any]
+    input: "queue.Queue[Any]"
+    output: "queue.Queue[Any] | None"
+    next_workers: int
+    failed: threading.Event
+    errors: list[PipelineError]
+    metrics: StageMetrics
+    lock: threading.Lock
+    running: int
+
+    def __init__(
+        self,
+        name: str,
+        workers: int,
+        process: Callable[[Any], Any],
+        input: "queue.Queue[Any]",
+        output: "queue.Queue[Any] | None",
+        next_workers: int,
+        failed: threading.Event,
+        errors: list[PipelineError],
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"expected: positive number of threads for stage `{name}`; got: {workers}")
+
+        self.name = name
+        self.process = process
+        self.input = input
+        self.output = output
+        self.next_workers = next_workers
+        self.failed = failed
+        self.errors = errors
+        self.metrics = StageMetrics(name, workers)
+        self.lock = threading.Lock()
+        self.running = workers
+
+    def start(self) -> list[threading.Thread]:
+        threads = [threading.Thread(target=self._run, name=f"{self.name}-{index}", daemon=True) for index in range(self.metrics.workers)]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _run(self) -> None:
+        try:
+            self._consume()
+        finally:
+            with self.lock:
+                self.running -= 1
+                last = self.running == 0
+            if last and self.output is not None:
+                # the last thread to finish signals the end of input to each thread of the downstream stage
+                for _ in range(self.next_workers):
+                    self.output.put(_DONE)
+
+    def _consume(self) -> None:
+        "Processes items until the end of input is signalled."
+
+        while True:
+            start = time.perf_counter()
+            depth = self.input.qsize()
+            item = self.input.get()
+            taken = time.perf_counter()
+            if item is _DONE:
+                break
+
+            if self.failed.is_set():
+                # drain input such that upstream stages are not blocked
+                continue
+
+            try:
+                result = self.process(item)
+            except BaseException as e:
+                # includes `SystemExit` raised by a module that calls `sys.exit` at import
+                message = str(e) if isinstance(e, Exception) else repr(e)
+                with self.lock:
+                    error = PipelineError(f"error in stage `{self.name}` while processing module `{_module_name(item)}`: {message}")
+                    error.__cause__ = e
+                    self.errors.append(error)
+                self.failed.set()
+                continue
+            processed = time.perf_counter()
+
+            if self.output is not None:
+                self.output.put(result)
+            finished = time.perf_counter()
+
+            with self.lock:
+                metrics = self.metrics
+                metrics.items += 1
+                metrics.idle_time += taken - start
+                metrics.busy_time += processed - taken
+                metrics.blocked_time += finished - processed
+                metrics.max_queue_depth = max(metrics.max_queue_depth, depth)
+                metrics.total_queue_depth += depth
+
+
+def _module_name(item: Any) -> str:
+    "Qualified name of the module that a pipeline item refers to."
+
+    if isinstance(item, str):
+        return item
+    elif isinstance(item, ModuleType):
+        return item.__name__
+    elif isinstance(item, tuple):
+        return str(item[0])
+    else:
+        return repr(item)
+
+
+class PipelineGenerator:
+    """
+    Generates Markdown documentation in a pipeline of stages connected by bounded queues.
+
+    The stages are:
+
+    1. *import*: imports modules by their qualified name,
+    2. *extract*: collects the classes and functions to export, and parses their doc-strings and module source,
+    3. *render*: formats text and types, and produces Markdown documents,
+    4. *write*: writes documents to files.
+
+    Each stage runs in a configurable number of threads, and works on a module as soon as the upstream stage is done
+    with it, such that CPU work overlaps with I/O (e.g. importing or writing files). Bounded queues apply back-pressure:
+    a stage waits when its downstream queue is full, which keeps the number of modules held in memory in check.
+
+    Files are written with the same content as with :meth:`MarkdownGenerator.generate`. Statistics returned for each
+    stage show which stage is the bottleneck.
+    """
+
+    module_names: list[str]
+    options: MarkdownOptions
+    import_workers: int
+    extract_workers: int
+    render_workers: int
+    write_workers: int
+    queue_size: int
+
+    def __init__(
+        self,
+        module_names: list[str],
+        *,
+        options: MarkdownOptions | None = None,
+        import_workers: int = 1,
+        extract_workers: int = 1,
+        render_workers: int = 1,
+        write_workers: int = 1,
+        queue_size: int = 4,
+    ) -> None:
+        """
+        Instantiates a generator that runs a pipeline of stages.
+
+        Importing modules in several threads is only safe if modules do not import one another in a cycle.
+
+        :param module_names: Qualified names of modules to generate documentation for.
+        :param options: Options for generating Markdown output.
+        :param import_workers: Number of threads importing modules.
+        :param extract_workers: Number of threads extracting documentation from modules.
+        :param render_workers: Number of threads rendering Markdown documents.
+        :param write_workers: Number of threads writing files.
+        :param queue_size: Maximum number of modules waiting in the queue between two stages.
+        """
+
+        if queue_size < 1:
+            raise ValueError(f"expected: positive queue size; got: {queue_size}")
+
+        self.module_names = module_names
+        self.options = options if options is not None else MarkdownOptions()
+        self.import_workers = import_workers
+        self.extract_workers = extract_workers
+        self.render_workers = render_workers
+        self.write_workers = write_workers
+        self.queue_size = queue_size
+
+    def generate(
+        self,
+        target: Path,
+        *,
+        inventory_file: Path | None = None,
+        search_index_file: Path | None = None,
+        navigation: bool = False,
+    ) -> PipelineMetrics:
+        """
+        Writes Markdown files to a target directory.
+
+        :param target: Directory to write Markdown files to.
+        :param inventory_file: If given, a JSON link inventory of all objects documented is written to this file.
+        :param search_index_file: If given, a JSON search index of all symbols documented is written to this file.
+        :param navigation: Whether to write `SUMMARY.md` and an index page `README.md` for each package.
+        :returns: Statistics of each stage.
+        """
+
+        generator = MarkdownGenerator([], options=self.options, batch=self.module_names)
+        output = _OutputWriter(target, self.module_names)
+
+        def import_module(module_name: str) -> ModuleType:
+            return importlib.import_module(module_name)
+
+        def extract(module: ModuleType) -> ModuleType:
+            generator.extract(module)
+            return module
+
+        def render(module: ModuleType) -> tuple[str, list[MarkdownDocument]]:
+            return module.__name__, generator.render(module)
+
+        def write(item: tuple[str, list[MarkdownDocument]]) -> None:
+            output.write(*item)
+
+        # a queue feeds each stage, the last stage has no output queue
+        queues: list[queue.Queue[Any]] = [queue.Queue(maxsize=self.queue_size) for _ in range(4)]
+        failed = threading.Event()
+        errors: list[PipelineError] = []
+        stages = [
+            _Stage("import", self.import_workers, import_module, queues[0], queues[1], self.extract_workers, failed, errors),
+            _Stage("extract", self.extract_workers, extract, queues[1], queues[2], self.render_workers, failed, errors),
+            _Stage("render", self.render_workers, render, queues[2], queues[3], self.write_workers, failed, errors),
+            _Stage("write", self.write_workers, write, queues[3], None, 0, failed, errors),
+        ]
+
+        start = time.perf_counter()
+        threads = [thread for stage in stages for thread in stage.start()]
+        for module_name in self.module_names:
+            if failed.is_set():
+                break
+            queues[0].put(module_name)
+        for _ in range(self.import_workers):
+            queues[0].put(_DONE)
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        if errors:
+            raise errors[0]
+
+        output.finish(inventory_file=inventory_file, search_index_file=search_index_file, navigation=navigation)
+
+        return PipelineMetrics(elapsed, [stage.metrics for stage in stages])
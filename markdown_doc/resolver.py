@@ -22,10 +22,16 @@ class Resolver(abc.ABC):
     @abc.abstractmethod
     def evaluate(self, ref: str) -> type: ...
 
+    @property
+    @abc.abstractmethod
+    def scope(self) -> ModuleType | type:
+        "The module or class whose namespace determines what references evaluate to."
+        ...
+
     def evaluate_global(self, ref: str) -> type | None:
         try:
-            # evaluate as fully-qualified reference in each loaded module
-            for name, module in sys.modules.items():
+            # evaluate as fully-qualified reference in each loaded module (with a snapshot, as other threads may import modules)
+            for name, module in list(sys.modules.items()):
                 if ref == name:
                     return typing.cast(type, module)
                 prefix = f"{name}."
@@ -46,6 +52,10 @@ class ModuleResolver(Resolver):
         super().__init__()
         self.module = module
 
+    @property
+    def scope(self) -> ModuleType | type:
+        return self.module
+
     def _evaluate(self, ref: str) -> type | None:
         obj = self.evaluate_global(ref)
         if obj is not None:
@@ -93,6 +103,10 @@ class ClassResolver(Resolver):
         super().__init__()
         self.cls = cls
 
+    @property
+    def scope(self) -> ModuleType | type:
+        return self.cls
+
     def _evaluate(self, ref: str) -> type | None:
         obj = self.evaluate_global(ref)
         if obj is not None:
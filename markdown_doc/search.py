@@ -0,0 +1,115 @@
+"""
+Generate Markdown documentation from Python code
+
+Copyright 2024-2026, Levente Hunyadi
+
+:see: https://github.com/hunyadi/markdown_doc
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+_ROLE_REGEX = re.compile(r":\w+:`([^`<>]+?)\s*(?:<[^`<>]*>)?`")
+_WORD_REGEX = re.compile(r"[a-z0-9]+")
+_CAMEL_CASE_REGEX = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z0-9]+")
+
+_STOP_WORDS = frozenset(
+    """
+    a an and are as at be by for from has have if in into is it its no not of on or such that the their then there these
+    this to was were when which will with
+    """.split()
+)
+
+
+@dataclass(frozen=True, order=True)
+class SearchItem:
+    """
+    A symbol documented in a generated Markdown file, as recorded in a search index.
+
+    :param name: Fully-qualified name of the symbol.
+    :param kind: Kind of symbol, e.g. `module`, `class`, `function`, `method`, `member` or `property`.
+    :param path: Path of the Markdown file relative to the output directory (in POSIX notation).
+    :param anchor: Anchor within the Markdown file that the symbol is documented under.
+    :param summary: Short description of the symbol in plain text.
+    """
+
+    name: str
+    kind: str
+    path: str
+    anchor: str
+    summary: str
+
+
+def summary_text(description: str | None) -> str:
+    "Converts the short description of a doc-string into a single line of plain text, without cross-reference syntax."
+
+    if not description:
+        return ""
+    return " ".join(_ROLE_REGEX.sub(r"\1", description).split())
+
+
+def name_tokens(name: str) -> set[str]:
+    """
+    Splits the last component of a fully-qualified name into lowercase search tokens.
+
+    The name is indexed as a whole, and by its parts separated by underscores or case changes, e.g. `HTTPAdapter`
+    produces `httpadapter`, `http` and `adapter`, and `send_request` produces `send_request`, `send` and `request`.
+    Enclosing modules and classes are not indexed, as they would match all of their members.
+    """
+
+    component = name.rsplit(".", 1)[-1].strip("_")
+    if not component:
+        return set()
+
+    tokens = {component.lower()}
+    for part in component.split("_"):
+        tokens.update(word.lower() for word in _CAMEL_CASE_REGEX.findall(part))
+    return tokens
+
+
+def summary_terms(summary: str) -> set[str]:
+    "Splits a summary into lowercase search terms, skipping single characters and common English words."
+
+    return {term for term in _WORD_REGEX.findall(summary.lower()) if len(term) > 1 and term not in _STOP_WORDS}
+
+
+def write_search_index(items: Iterable[SearchItem], path: Path) -> None:
+    """
+    Writes a JSON search index, which a documentation portal can load once to answer queries without reading Markdown files.
+
+    The index holds a list `documents`, each item of which is a list of fully-qualified name, kind, relative path of the
+    Markdown file, anchor within the file and summary, and two inverted indexes, `names` and `terms`, which map a
+    lowercase token to the (ascending) positions of the documents whose name or summary contains the token. Tokens are
+    written in sorted order such that prefix queries can be answered with binary search. Matches in `names` are meant
+    to rank above matches in `terms`.
+
+    :param items: Symbols documented in generated Markdown files.
+    :param path: Path of the JSON file to write.
+    """
+
+    # a symbol (e.g. a module heading repeated in each partition) is linked to the first file it is documented in
+    symbols: dict[str, SearchItem] = {}
+    for item in sorted(items):
+        symbols.setdefault(item.name, item)
+
+    names: dict[str, list[int]] = {}
+    terms: dict[str, list[int]] = {}
+    documents: list[list[str]] = []
+    for index, item in enumerate(symbols.values()):
+        documents.append([item.name, item.kind, item.path, item.anchor, item.summary])
+        for token in name_tokens(item.name):
+            names.setdefault(token, []).append(index)
+        for term in summary_terms(item.summary):
+            terms.setdefault(term, []).append(index)
+
+    index_data = {
+        "version": 1,
+        "documents": documents,
+        "names": dict(sorted(names.items())),
+        "terms": dict(sorted(terms.items())),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(index_data, f, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,292 @@
+"""
+Generate Markdown documentation from Python code
+
+Copyright 2024-2026, Levente Hunyadi
+
+:see: https://github.com/hunyadi/markdown_doc
+"""
+
+import http.server
+import importlib
+import linecache
+import os
+import posixpath
+import socketserver
+import stat
+import sys
+import threading
+import urllib.parse
+from types import ModuleType
+from typing import cast
+
+from .dependency import DependencyGraph
+from .generator import MarkdownDocument, MarkdownGenerator, MarkdownNavigation, MarkdownOptions
+
+_UNIX_PREFIX = "unix:"
+
+
+def _source_mtime(module: ModuleType) -> int | None:
+    "Modification time of the source file of a module, or `None` if the module has no source file."
+
+    path: str | None = getattr(module, "__file__", None)
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _references(module: ModuleType, module_names: set[str]) -> bool:
+    "True if the global namespace of a module holds any of the given modules, or any object defined in them."
+
+    for value in list(vars(module).values()):
+        if isinstance(value, ModuleType):
+            if value.__name__ in module_names:
+                return True
+        elif isinstance(getattr(value, "__module__", None), str) and value.__module__ in module_names:
+            return True
+    return False
+
+
+def _module_name_of(path: str) -> str:
+    "Qualified name of the module that a Markdown document path belongs to, e.g. `package/module-ClassName.md`."
+
+    directory, file_name = posixpath.split(path.removesuffix(".md"))
+    module_name = file_name.split("-", 1)[0]
+    return f"{directory.replace('/', '.')}.{module_name}" if directory else module_name
+
+
+def _is_socket(path: str) -> bool:
+    "True if the path exists and is a Unix domain socket."
+
+    try:
+        return stat.S_ISSOCK(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+class DocumentServer:
+    """
+    Keeps modules imported and the generator with its caches warm in a long-lived process, and renders Markdown
+    documents on demand.
+
+    Before each lookup, the source files of modules are checked for changes. Modules that changed on disk are reloaded,
+    along with modules that import objects from them. Rendered documents are memoized, and only the documents and
+    the documentation extracted for reloaded modules and for modules whose documents link to them are discarded.
+
+    Documents are served over HTTP at their path relative to the output directory (e.g. `/package/module.md`), the
+    path `/` serves `SUMMARY.md`, and a qualified name (e.g. `/package.module.ClassName`) redirects to the document
+    and anchor the object is documented under.
+    """
+
+    module_names: list[str]
+    generator: MarkdownGenerator
+    modules: dict[str, ModuleType]
+    mtimes: dict[str, int | None]
+    documents: dict[str, list[MarkdownDocument]]
+    graph: DependencyGraph
+    lock: threading.RLock
+
+    def __init__(self, module_names: list[str], *, options: MarkdownOptions | None = None) -> None:
+        """
+        Imports modules to serve documentation for.
+
+        :param module_names: Qualified names of modules to generate documentation for.
+        :param options: Options for generating Markdown output.
+        """
+
+        self.module_names = module_names
+        self.modules = {name: importlib.import_module(name) for name in module_names}
+        self.mtimes = {name: _source_mtime(module) for name, module in self.modules.items()}
+        self.generator = MarkdownGenerator(list(self.modules.values()), options=options, batch=module_names)
+        self.documents = {}
+        self.graph = DependencyGraph()
+        self.lock = threading.RLock()
+
+    def refresh(self) -> list[str]:
+        """
+        Reloads modules whose source file has changed on disk, and modules that import objects from them.
+
+        :returns: Qualified names of modules reloaded, in the order they were reloaded.
+        """
+
+        with self.lock:
+            changed = [name for name, module in self.modules.items() if _source_mtime(module) != self.mtimes[name]]
+            if not changed:
+                return []
+
+            # modules that import from a reloaded module would keep referring to its stale classes and functions
+            reloaded = list(changed)
+            pending = set(changed)
+            while pending:
+                dependents = [name for name, module in self.modules.items() if name not in reloaded and _references(module, pending)]
+                reloaded.extend(dependents)
+                pending = set(dependents)
+
+            for name in reloaded:
+                module = self.modules[name]
+                mtime = _source_mtime(module)
+                path: str | None = getattr(module, "__file__", None)
+                if path is not None:
+                    linecache.checkcache(path)
+                importlib.reload(module)
+                self.mtimes[name] = mtime
+
+            # documents that link to objects of reloaded modules carry their file names and anchors
+            for name in self.graph.affected(reloaded):
+                self.documents.pop(name, None)
+                self.generator.invalidate(self.modules[name])
+            return reloaded
+
+    def _render(self, module_name: str) -> list[MarkdownDocument]:
+        documents = self.documents.get(module_name)
+        if documents is None:
+            module = self.modules[module_name]
+            documents = self.generator.render(module)
+            self.documents[module_name] = documents
+            self.graph.add(module_name, self.generator.linked_modules(module))
+        return documents
+
+    def warm(self) -> None:
+        "Renders all modules, such that subsequent lookups are served from memory."
+
+        with self.lock:
+            self.refresh()
+            for module_name in self.module_names:
+                self._render(module_name)
+
+    def document(self, path: str) -> str | None:
+        """
+        Returns the text of a Markdown document.
+
+        :param path: Path of the document relative to the output directory (in POSIX notation), e.g. `package/module.md`,
+            `SUMMARY.md` or the index page `package/README.md`.
+        :returns: Markdown text, or `None` if there is no such document.
+        """
+
+        with self.lock:
+            self.refresh()
+            module_name = _module_name_of(path)
+            if module_name in self.modules:
+                for document in self._render(module_name):
+                    if document.path == path:
+                        return document.text
+
+            navigation = MarkdownNavigation()
+            for module_name in self.module_names:
+                for document in self._render(module_name):
+                    navigation.add(module_name, document)
+            return navigation.files().get(path)
+
+    def locate(self, name: str) -> str | None:
+        """
+        Finds where an object is documented.
+
+        :param name: Fully-qualified name of a module, class, function, enumeration member or data-class property.
+        :returns: Path of the document with the anchor of the object, e.g. `package/module.md#ClassName`, or `None`.
+        """
+
+        with self.lock:
+            self.refresh()
+            module_name = name
+            while module_name not in self.modules:
+                if "." not in module_name:
+                    return None
+                module_name = module_name.rsplit(".", 1)[0]
+
+            for document in self._render(module_name):
+                for item in document.symbols:
+                    if item.name == name:
+                        return f"{item.path}#{item.anchor}"
+            return None
+
+    def create_server(self, address: str) -> socketserver.BaseServer:
+        """
+        Creates an HTTP server that serves documents from this object.
+
+        :param address: Host and port to listen on (e.g. `localhost:8000`), or a Unix domain socket path with the prefix `unix:`.
+        """
+
+        server: _ThreadingHTTPServer | _ThreadingUnixHTTPServer
+        if address.startswith(_UNIX_PREFIX):
+            path = address.removeprefix(_UNIX_PREFIX)
+            if os.path.exists(path):
+                if not _is_socket(path):
+                    raise ValueError(f"expected: path to a Unix domain socket; got: existing file {path}")
+                os.unlink(path)  # stale socket of a previous run
+            server = _ThreadingUnixHTTPServer(path, _RequestHandler)
+        else:
+            host, _, port = address.rpartition(":")
+            server = _ThreadingHTTPServer((host or "localhost", int(port)), _RequestHandler)
+        server.documents = self
+        return server
+
+    def serve(self, address: str) -> None:
+        """
+        Serves documents over HTTP until interrupted.
+
+        :param address: Host and port to listen on (e.g. `localhost:8000`), or a Unix domain socket path with the prefix `unix:`.
+        """
+
+        server = self.create_server(address)
+        print(f"serving documentation for {len(self.module_names)} module(s) on {address}", file=sys.stderr, flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if address.startswith(_UNIX_PREFIX):
+                path = address.removeprefix(_UNIX_PREFIX)
+                if _is_socket(path):  # the path may have been removed or replaced while serving
+                    os.unlink(path)
+
+
+class _ThreadingHTTPServer(http.server.ThreadingHTTPServer):
+    documents: DocumentServer
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    documents: DocumentServer
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    "Serves Markdown documents, and redirects qualified names to the document and anchor the object is documented under."
+
+    def address_string(self) -> str:
+        # clients connected to a Unix domain socket have no address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def _send(self, status: int, text: str, content_type: str = "text/plain") -> None:
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        documents = cast(_ThreadingHTTPServer | _ThreadingUnixHTTPServer, self.server).documents
+        path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path).lstrip("/")
+        try:
+            if not path or path.endswith(".md"):
+                text = documents.document(path or "SUMMARY.md")
+                if text is None:
+                    self._send(404, f"no such document: {path}")
+                else:
+                    self._send(200, text, "text/markdown")
+            else:
+                location = documents.locate(path)
+                if location is None:
+                    self._send(404, f"no such object: {path}")
+                else:
+                    self.send_response(302)
+                    self.send_header("Location", f"/{location}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+        except Exception as e:
+            # e.g. a syntax error in a module that changed on disk, which is reported until the module is fixed
+            self._send(500, f"{type(e).__name__}: {e}")
+            print(f"error serving `{path}`: {e}", file=sys.stderr)
@@ -0,0 +1,200 @@
+"""
+Generate Markdown documentation from Python code
+
+Copyright 2024-2026, Levente Hunyadi
+
+:see: https://github.com/hunyadi/markdown_doc
+"""
+
+import ast
+import os
+import sys
+from dataclasses import dataclass
+from enum import Enum
+
+from .cache import MemoryCache
+
+
+def _try_get_assignment(stmt: ast.stmt) -> str | None:
+    "Extracts the name of the member variable assigned to in a class body statement."
+
+    if isinstance(stmt, ast.Assign):
+        if len(stmt.targets) != 1:
+            return None
+        target = stmt.targets[0]
+    elif isinstance(stmt, ast.AnnAssign):
+        target = stmt.target
+    else:
+        return None
+
+    if not isinstance(target, ast.Name):
+        return None
+    return target.id
+
+
+def _try_get_literal(stmt: ast.stmt) -> str | None:
+    "Extracts the string literal of an expression statement."
+
+    if not isinstance(stmt, ast.Expr):
+        return None
+    if not isinstance(constant := stmt.value, ast.Constant):
+        return None
+    if not isinstance(docstring := constant.value, str):
+        return None
+    return docstring
+
+
+def _member_docstrings(classdef: ast.ClassDef) -> dict[str, str]:
+    "Maps member variable names to the string literal that immediately follows their assignment in a class body."
+
+    member_doc: dict[str, str] = {}
+    member_name: str | None = None
+    for stmt in classdef.body:
+        if member_name is not None:
+            # description must immediately follow member variable assignment
+            member_desc = _try_get_literal(stmt)
+            if member_desc is not None:
+                member_doc[member_name] = member_desc
+                member_name = None
+                continue
+
+        member_name = _try_get_assignment(stmt)
+    return member_doc
+
+
+class _ClassCollector(ast.NodeVisitor):
+    "Collects class definitions in a module by qualified name, following the rules of `inspect.getsource`."
+
+    stack: list[str]
+    classes: dict[str, list[ast.ClassDef]]
+
+    def __init__(self) -> None:
+        self.stack = []
+        self.classes = {}
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        self.stack.append(node.name)
+        self.stack.append("<locals>")
+        self.generic_visit(node)
+        self.stack.pop()
+        self.stack.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.stack.append(node.name)
+        self.classes.setdefault(".".join(self.stack), []).append(node)
+        self.generic_visit(node)
+        self.stack.pop()
+
+
+@dataclass
+class SourceFile:
+    """
+    Source-derived data extracted from a Python module in a single pass over its abstract syntax tree.
+
+    :param path: Path to the Python source file.
+    :param tree: The abstract syntax tree of the source file.
+    :param classes: Maps qualified names to class definitions (in order of appearance in the source file).
+    :param member_docstrings: Maps each class definition to its member variable descriptions.
+    """
+
+    path: str
+    tree: ast.Module
+    classes: dict[str, list[ast.ClassDef]]
+    member_docstrings: dict[ast.ClassDef, dict[str, str]]
+
+    @staticmethod
+    def parse(path: str) -> "SourceFile":
+        "Parses a Python source file, and extracts all class definitions and member variable descriptions."
+
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+
+        collector = _ClassCollector()
+        collector.visit(tree)
+        member_docstrings = {classdef: _member_docstrings(classdef) for classdefs in collector.classes.values() for classdef in classdefs}
+        return SourceFile(path, tree, collector.classes, member_docstrings)
+
+    def class_def(self, cls: type) -> ast.ClassDef | None:
+        "Returns the definition of a class in the abstract syntax tree, if found."
+
+        classdefs = self.classes.get(cls.__qualname__)
+        if not classdefs:
+            return None
+
+        # Python 3.13 and later record the first line of the class definition including decorators
+        first_line: int | None = getattr(cls, "__firstlineno__", None)
+        if first_line is not None:
+            for classdef in classdefs:
+                lineno = classdef.decorator_list[0].lineno if classdef.decorator_list else classdef.lineno
+                if lineno == first_line:
+                    return classdef
+
+        return classdefs[0]
+
+
+# approximate memory held by the abstract syntax tree per byte of source code
+_AST_BYTES_PER_SOURCE_BYTE = 32
+
+
+def _source_size(entry: tuple[int, int, SourceFile]) -> int:
+    _, file_size, _ = entry
+    return file_size * _AST_BYTES_PER_SOURCE_BYTE
+
+
+class SourceCache:
+    """
+    Parses each Python source file at most once, and caches source-derived data by path and modification time.
+
+    A module with many classes is parsed once, and the same abstract syntax tree serves all lookups for the classes
+    defined in the module. Parsed files count towards the memory budget of caches, and the least recently used files
+    are evicted first. The cache may be shared by threads.
+    """
+
+    cache: MemoryCache[str, tuple[int, int, SourceFile]]
+
+    def __init__(self) -> None:
+        self.cache = MemoryCache("source files", sizeof=_source_size)
+
+    def get(self, path: str) -> SourceFile:
+        "Returns the parsed source file, re-parsing it only if it has changed on disk."
+
+        stat = os.stat(path)
+        entry = self.cache.get(path)
+        if entry is not None:
+            cached_mtime, _, source = entry
+            if cached_mtime == stat.st_mtime_ns:
+                return source
+            self.cache.discard(path)
+
+        # parse without holding the lock such that threads are not blocked on files other than the one they look up
+        _, _, source = self.cache.put(path, (stat.st_mtime_ns, stat.st_size, SourceFile.parse(path)))
+        return source
+
+    def source_of(self, cls: type) -> SourceFile:
+        """
+        Returns the parsed source file of the module in which a class is defined.
+
+        :raises OSError: Raised when source code is not available.
+        """
+
+        module = sys.modules.get(cls.__module__)
+        path: str | None = getattr(module, "__file__", None)
+        if path is None or not path.endswith(".py"):
+            raise OSError(f"source code not available for class `{cls.__qualname__}` in module `{cls.__module__}`")
+        return self.get(path)
+
+    def enum_labels(self, cls: type[Enum]) -> dict[str, str]:
+        """
+        Maps enumeration member names to their follow-up description, i.e. a string literal immediately following the
+        member assignment in the class body.
+
+        :raises OSError: Raised when source code is not available.
+        """
+
+        source = self.source_of(cls)
+        classdef = source.class_def(cls)
+        if classdef is None:
+            raise OSError(f"could not find definition of class `{cls.__qualname__}` in module `{cls.__module__}`")
+        return source.member_docstrings[classdef]